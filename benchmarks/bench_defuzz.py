@@ -0,0 +1,27 @@
+# fuzzy logic libraries
+from benchmarks.common import crisp_inputs, mamdani_engine, universe
+from fuzzylogic.defuzz import DEFUZZ
+
+
+class Defuzzification:
+    """
+    Defuzzification of the composed output of a Mamdani engine by every method.
+    """
+
+    params = (list(DEFUZZ), [101, 10001], [1, 100])
+    param_names = ["method", "n_universe", "batch_size"]
+
+    def setup(self, method: str, n_universe: int, batch_size: int):
+        engine = mamdani_engine(n_rules=50, n_inputs=2)
+        inputs = crisp_inputs(engine, batch_size)
+
+        self.defuzz = DEFUZZ[method]
+        self.x = universe(n_universe)
+        self.composed_mf = engine.compose(list(inputs[0]))
+        self.memberships = engine.aggregate(engine.get_rule_strengths(inputs), self.x)
+
+    def time_defuzz(self, method: str, n_universe: int, batch_size: int):
+        self.defuzz.defuzz(self.x, self.composed_mf)
+
+    def time_defuzz_batch(self, method: str, n_universe: int, batch_size: int):
+        self.defuzz.defuzz_batch(self.x, self.memberships)
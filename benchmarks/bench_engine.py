@@ -0,0 +1,118 @@
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from benchmarks.common import INPUT_RANGE, crisp_inputs, grid_mamdani_engine, mamdani_engine, tsk_engine, universe
+from fuzzylogic.jit import NUMBA_AVAILABLE
+
+
+class MamdaniInference:
+    """
+    Single crisp input inference of a Mamdani engine.
+    """
+
+    params = ([10, 100, 1000], [1, 2, 4], [101, 1001, 10001])
+    param_names = ["n_rules", "n_inputs", "n_universe"]
+
+    def setup(self, n_rules: int, n_inputs: int, n_universe: int):
+        self.engine = mamdani_engine(n_rules, n_inputs)
+        self.inputs = list(crisp_inputs(self.engine, 1)[0])
+        self.x = universe(n_universe)
+        self.engine.compose(self.inputs)
+
+    def time_compose(self, n_rules: int, n_inputs: int, n_universe: int):
+        self.engine.compose(self.inputs)
+
+    def time_infer(self, n_rules: int, n_inputs: int, n_universe: int):
+        self.engine.infer(self.x)
+
+    def time_evaluate(self, n_rules: int, n_inputs: int, n_universe: int):
+        self.engine.evaluate(self.inputs, self.x)
+
+
+class MamdaniBatchInference:
+    """
+    Batched inference of a Mamdani engine.
+    """
+
+    params = ([10, 100], [1, 2, 4], [101, 1001], [1, 100, 1000])
+    param_names = ["n_rules", "n_inputs", "n_universe", "batch_size"]
+    timeout = 300
+
+    def setup(self, n_rules: int, n_inputs: int, n_universe: int, batch_size: int):
+        self.engine = mamdani_engine(n_rules, n_inputs)
+        self.inputs = crisp_inputs(self.engine, batch_size)
+        self.x = universe(n_universe)
+
+    def time_get_rule_strengths(self, n_rules: int, n_inputs: int, n_universe: int, batch_size: int):
+        self.engine.get_rule_strengths(self.inputs)
+
+    def time_infer_batch(self, n_rules: int, n_inputs: int, n_universe: int, batch_size: int):
+        self.engine.infer_batch(self.inputs, self.x)
+
+    def peakmem_infer_batch(self, n_rules: int, n_inputs: int, n_universe: int, batch_size: int):
+        self.engine.infer_batch(self.inputs, self.x)
+
+
+class CompiledMamdaniBatchInference:
+    """
+    Batched inference of a Mamdani engine compiled with the NumPy or Numba backend.
+    """
+
+    params = ([10, 100], [2, 4], [101, 1001], [100, 10000], ["numpy", "numba"])
+    param_names = ["n_rules", "n_inputs", "n_universe", "batch_size", "backend"]
+    timeout = 300
+
+    def setup(self, n_rules: int, n_inputs: int, n_universe: int, batch_size: int, backend: str):
+        if backend == "numba" and not NUMBA_AVAILABLE:
+            # asv skips the benchmark
+            raise NotImplementedError("Numba is not installed")
+
+        self.engine = mamdani_engine(n_rules, n_inputs)
+        self.engine.compile(backend=backend)
+        self.inputs = crisp_inputs(self.engine, batch_size)
+        self.x = universe(n_universe)
+
+        # Compile the kernels outside of the timings
+        self.engine.infer_batch(self.inputs[:1], self.x)
+
+    def time_infer_batch(self, n_rules: int, n_inputs: int, n_universe: int, batch_size: int, backend: str):
+        self.engine.infer_batch(self.inputs, self.x)
+
+    def peakmem_infer_batch(self, n_rules: int, n_inputs: int, n_universe: int, batch_size: int, backend: str):
+        self.engine.infer_batch(self.inputs, self.x)
+
+
+class MamdaniControlSurface:
+    """
+    Control surface of a two input Mamdani engine with a rule for every pair of input terms, with and without
+    defuzzification.
+    """
+
+    params = ([3, 10], [11, 51], [None, 101, 1001])
+    param_names = ["n_terms", "grid_size", "n_universe"]
+    timeout = 300
+
+    def setup(self, n_terms: int, grid_size: int, n_universe: int):
+        self.engine = grid_mamdani_engine(n_terms)
+        self.antecedent_ranges = [np.linspace(*INPUT_RANGE, grid_size)] * 2
+        self.x = None if n_universe is None else universe(n_universe)
+
+    def time_calculate_fuzzy_control_surface(self, n_terms: int, grid_size: int, n_universe: int):
+        self.engine.calculate_fuzzy_control_surface(self.antecedent_ranges, x=self.x)
+
+
+class TSKInference:
+    """
+    Batched inference and control surface of a first-order TSK engine.
+    """
+
+    params = ([10, 100, 1000], [1, 2, 4], [1, 100, 10000])
+    param_names = ["n_rules", "n_inputs", "batch_size"]
+
+    def setup(self, n_rules: int, n_inputs: int, batch_size: int):
+        self.engine = tsk_engine(n_rules, n_inputs)
+        self.inputs = crisp_inputs(self.engine, batch_size)
+
+    def time_infer_batch(self, n_rules: int, n_inputs: int, batch_size: int):
+        self.engine.infer_batch(self.inputs)
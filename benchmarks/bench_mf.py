@@ -0,0 +1,106 @@
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.expression import CompiledMF
+from fuzzylogic.mf import (
+    Bell,
+    ConstantMF,
+    FuzzySingleton,
+    Gaussian,
+    Linear,
+    MFBank,
+    PiecewiseLinearMF,
+    Rectangular,
+    Sigmoid,
+    Step,
+    Trapezoid,
+)
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
+
+# One membership function of every family on the range [0, 10]
+MFS = {
+    "bell": Bell(center=5, width=2, intensity=3),
+    "constant": ConstantMF(value=0.5),
+    "gaussian": Gaussian(mean=5, std=2),
+    "linear": Linear(m=0.1, b=0),
+    "piecewise_linear": PiecewiseLinearMF(x=[1, 3, 4, 6, 8], y=[0, 1, 0.5, 0.5, 0]),
+    "rectangular": Rectangular(low=3, high=7),
+    "sigmoid": Sigmoid(center_slope=2, center=5),
+    "singleton": FuzzySingleton(value=5),
+    "step": Step(limit=5),
+    "trapezoid": Trapezoid(a=1, b=3, c=7, d=9),
+    "triangle": Triangle(a=1, b=5, c=9),
+}
+
+
+class MembershipFunctions:
+    """
+    Evaluation, support and core of every membership function family.
+    """
+
+    params = (list(MFS), [101, 10001, 1000001])
+    param_names = ["family", "n_points"]
+
+    def setup(self, family: str, n_points: int):
+        self.mf = MFS[family]
+        self.x = np.linspace(0, 10, n_points)
+
+    def time_call(self, family: str, n_points: int):
+        self.mf(self.x)
+
+    def time_support(self, family: str, n_points: int):
+        self.mf.support()
+
+    def time_core(self, family: str, n_points: int):
+        self.mf.core()
+
+
+class MembershipFunctionBanks:
+    """
+    Evaluation of banks of membership functions against evaluating them one by one.
+    """
+
+    params = ([10, 100], [101, 10001])
+    param_names = ["n_mfs", "n_points"]
+
+    def setup(self, n_mfs: int, n_points: int):
+        means = np.linspace(0, 10, n_mfs)
+        self.bank = MFBank(family=Gaussian, parameters={"mean": means, "std": np.full(n_mfs, 1.0)})
+        self.x = np.linspace(0, 10, n_points)
+
+    def time_bank(self, n_mfs: int, n_points: int):
+        self.bank(self.x)
+
+    def time_one_by_one(self, n_mfs: int, n_points: int):
+        for mf in self.bank.mfs:
+            mf(self.x)
+
+
+class CompiledMembershipFunctions:
+    """
+    Evaluation of a composite membership function with shared subexpressions, compiled and as a tree.
+    """
+
+    params = ([4, 8], [101, 10001])
+    param_names = ["depth", "n_points"]
+
+    def setup(self, depth: int, n_points: int):
+        mf = Triangle(a=1, b=5, c=9)
+        for level in range(depth):
+            other = MinimumTNorm.combine(mf, Gaussian(mean=level % 10, std=2))
+            mf = MaximumTCoNorm.combine(other, other)
+        self.mf = mf
+        self.compiled_mf = CompiledMF.from_mf(mf)
+        self.x = np.linspace(0, 10, n_points)
+
+    def time_tree(self, depth: int, n_points: int):
+        self.mf(self.x)
+
+    def time_compiled(self, depth: int, n_points: int):
+        self.compiled_mf(self.x)
+
+    def time_compile(self, depth: int, n_points: int):
+        CompiledMF.from_mf(self.mf)
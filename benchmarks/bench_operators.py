@@ -0,0 +1,112 @@
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.connectives import And, Or
+from fuzzylogic.hedges import Con, Dil, Dim, Int, Not
+from fuzzylogic.mf import Gaussian
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm, MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm, MinimumTNorm
+
+OPERATORS = {
+    operator.__name__: operator
+    for operator in (
+        MinimumTNorm,
+        AlgebraicProductTNorm,
+        BoundedProductTNorm,
+        DrasticProductTNorm,
+        MaximumTCoNorm,
+        AlgebraicSumTCoNorm,
+        BoundedSumTCoNorm,
+        DrasticSumTCoNorm,
+    )
+}
+CONNECTIVES = {connective.__name__: connective for connective in (And, Or)}
+HEDGES = {hedge.__name__: hedge for hedge in (Not, Con, Dil, Int, Dim)}
+
+
+def _memberships(n_mfs: int, n_points: int) -> np.ndarray:
+    """
+    Random membership values of shape (n_mfs, n_points), with exact zeros and ones as at the edges of real ones.
+    """
+    return np.clip(np.random.default_rng(0).uniform(-0.2, 1.2, size=(n_mfs, n_points)), 0, 1)
+
+
+class TNormsAndTCoNorms:
+    """
+    Binary and n-ary application of every T-Norm and T-CoNorm, and evaluation of the membership functions they combine.
+    """
+
+    params = (list(OPERATORS), [101, 10001, 1000001])
+    param_names = ["operator", "n_points"]
+
+    def setup(self, operator: str, n_points: int):
+        self.operator = OPERATORS[operator]
+        self.memberships = _memberships(2, n_points)
+        self.combined_mf = self.operator.combine(Triangle(a=1, b=5, c=9), Gaussian(mean=5, std=2))
+        self.x = np.linspace(0, 10, n_points)
+
+    def time_apply(self, operator: str, n_points: int):
+        self.operator.apply(self.memberships[0], self.memberships[1])
+
+    def time_combined_call(self, operator: str, n_points: int):
+        self.combined_mf(self.x)
+
+
+class NaryReductions:
+    """
+    Reduction of many membership values by every T-Norm and T-CoNorm.
+    """
+
+    params = (list(OPERATORS), [2, 10, 100], [101, 10001])
+    param_names = ["operator", "n_mfs", "n_points"]
+
+    def setup(self, operator: str, n_mfs: int, n_points: int):
+        self.operator = OPERATORS[operator]
+        self.memberships = _memberships(n_mfs, n_points)
+        self.reduced_mf = self.operator.combine_many([Gaussian(mean=mean, std=2) for mean in np.linspace(0, 10, n_mfs)])
+        self.x = np.linspace(0, 10, n_points)
+
+    def time_apply_many(self, operator: str, n_mfs: int, n_points: int):
+        self.operator.apply_many(self.memberships)
+
+    def time_reduced_call(self, operator: str, n_mfs: int, n_points: int):
+        self.reduced_mf(self.x)
+
+
+class Connectives:
+    """
+    Application of every connective.
+    """
+
+    params = (list(CONNECTIVES), [101, 10001, 1000001])
+    param_names = ["connective", "n_points"]
+
+    def setup(self, connective: str, n_points: int):
+        self.connective = CONNECTIVES[connective]
+        self.memberships = _memberships(2, n_points)
+
+    def time_apply(self, connective: str, n_points: int):
+        self.connective.apply(self.memberships[0], self.memberships[1])
+
+
+class Hedges:
+    """
+    Application of every hedge, and evaluation of the membership functions it transforms.
+    """
+
+    params = (list(HEDGES), [101, 10001, 1000001])
+    param_names = ["hedge", "n_points"]
+
+    def setup(self, hedge: str, n_points: int):
+        self.hedge = HEDGES[hedge]
+        self.memberships = _memberships(1, n_points)[0]
+        self.transformed_mf = self.hedge.transform(Gaussian(mean=5, std=2))
+        self.x = np.linspace(0, 10, n_points)
+
+    def time_apply(self, hedge: str, n_points: int):
+        self.hedge.apply(self.memberships)
+
+    def time_transformed_call(self, hedge: str, n_points: int):
+        self.transformed_mf(self.x)
@@ -0,0 +1,158 @@
+# standard libraries
+import itertools
+from typing import List
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.engine import FuzzyEngine
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine, TSKFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule, TSKConsequent, TSKFuzzyRule
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
+
+# Range of every input and of the output of the benchmark engines
+INPUT_RANGE = (0.0, 10.0)
+OUTPUT_RANGE = (0.0, 1.0)
+
+# Number of linguistic terms partitioning every input and the output
+N_TERMS = 7
+
+
+def partition(low: float, high: float, n_terms: int = N_TERMS) -> List[Triangle]:
+    """
+    Triangles partitioning a range, every triangle peaking where its neighbours are zero.
+
+    Args:
+        low (float): Lower bound of the range
+        high (float): Upper bound of the range
+        n_terms (int, optional): Number of triangles. Defaults to N_TERMS.
+
+    Returns:
+        List[Triangle]: Triangles partitioning the range
+    """
+    peaks = np.linspace(low, high, n_terms)
+    width = peaks[1] - peaks[0]
+
+    return [Triangle(a=peak - width, b=peak, c=peak + width) for peak in peaks]
+
+
+def mamdani_engine(n_rules: int, n_inputs: int, defuzz: str = "centroid", seed: int = 0) -> MamdaniFuzzyEngine:
+    """
+    Mamdani engine whose rules pick random terms of every input and of the output.
+
+    Args:
+        n_rules (int): Number of rules
+        n_inputs (int): Number of inputs
+        defuzz (str, optional): Defuzzification method. Defaults to "centroid".
+        seed (int, optional): Seed of the random terms. Defaults to 0.
+
+    Returns:
+        MamdaniFuzzyEngine: Mamdani fuzzy inference engine
+    """
+    rng = np.random.default_rng(seed)
+    input_terms, output_terms = partition(*INPUT_RANGE), partition(*OUTPUT_RANGE)
+
+    rules = [
+        FuzzyRule(
+            antecedents=[input_terms[idx] for idx in rng.integers(N_TERMS, size=n_inputs)],
+            operators=["and"] * (n_inputs - 1),
+            consequent=output_terms[rng.integers(N_TERMS)],
+            dom_operator=MinimumTNorm(),
+            tnorm=MinimumTNorm(),
+            tconorm=MaximumTCoNorm(),
+            implication_operator=MinimumTNorm(),
+        )
+        for _ in range(n_rules)
+    ]
+
+    return MamdaniFuzzyEngine(rules=rules, aggregate_operator=MaximumTCoNorm(), defuzz=defuzz)
+
+
+def grid_mamdani_engine(n_terms: int) -> MamdaniFuzzyEngine:
+    """
+    Two input Mamdani engine with a rule for every pair of input terms, so that every input fires a rule.
+
+    Args:
+        n_terms (int): Number of terms of every input
+
+    Returns:
+        MamdaniFuzzyEngine: Mamdani fuzzy inference engine with n_terms ** 2 rules
+    """
+    input_terms, output_terms = partition(*INPUT_RANGE, n_terms), partition(*OUTPUT_RANGE, 2 * n_terms - 1)
+
+    rules = [
+        FuzzyRule(
+            antecedents=[input_terms[idx1], input_terms[idx2]],
+            operators=["and"],
+            consequent=output_terms[idx1 + idx2],
+            dom_operator=MinimumTNorm(),
+            tnorm=MinimumTNorm(),
+            tconorm=MaximumTCoNorm(),
+            implication_operator=MinimumTNorm(),
+        )
+        for idx1, idx2 in itertools.product(range(n_terms), repeat=2)
+    ]
+
+    return MamdaniFuzzyEngine(rules=rules, aggregate_operator=MaximumTCoNorm())
+
+
+def tsk_engine(n_rules: int, n_inputs: int, seed: int = 0) -> TSKFuzzyEngine:
+    """
+    First-order TSK engine whose rules pick random terms of every input and random linear consequents.
+
+    Args:
+        n_rules (int): Number of rules
+        n_inputs (int): Number of inputs
+        seed (int, optional): Seed of the random terms and consequents. Defaults to 0.
+
+    Returns:
+        TSKFuzzyEngine: TSK fuzzy inference engine
+    """
+    rng = np.random.default_rng(seed)
+    input_terms = partition(*INPUT_RANGE)
+
+    rules = [
+        TSKFuzzyRule(
+            antecedents=[input_terms[idx] for idx in rng.integers(N_TERMS, size=n_inputs)],
+            operators=["and"] * (n_inputs - 1),
+            consequent=TSKConsequent(intercept=rng.uniform(), coefficients=list(rng.uniform(-1, 1, size=n_inputs))),
+            dom_operator=MinimumTNorm(),
+            tnorm=MinimumTNorm(),
+            tconorm=MaximumTCoNorm(),
+        )
+        for _ in range(n_rules)
+    ]
+
+    return TSKFuzzyEngine(rules=rules)
+
+
+def crisp_inputs(engine: FuzzyEngine, n_samples: int, seed: int = 1) -> np.ndarray:
+    """
+    Random crisp inputs that fire at least one rule of an engine, so that the output can be defuzzified.
+
+    Every input is drawn around the peaks of the antecedents of a random rule.
+
+    Args:
+        engine (FuzzyEngine): Fuzzy inference engine built by mamdani_engine or tsk_engine
+        n_samples (int): Number of crisp inputs
+        seed (int, optional): Seed of the random inputs. Defaults to 1.
+
+    Returns:
+        np.ndarray: Crisp inputs of shape (n_samples, n_inputs)
+    """
+    rng = np.random.default_rng(seed)
+    rules = [engine.rules[idx] for idx in rng.integers(len(engine.rules), size=n_samples)]
+    peaks = np.array([[antecedent.b for antecedent in rule.antecedents] for rule in rules])
+    widths = np.array([[antecedent.c - antecedent.b for antecedent in rule.antecedents] for rule in rules])
+
+    return peaks + rng.uniform(-0.5, 0.5, size=peaks.shape) * widths
+
+
+def universe(n_points: int) -> np.ndarray:
+    """
+    Universe of discourse of the output with n_points values.
+    """
+    return np.linspace(*OUTPUT_RANGE, n_points)
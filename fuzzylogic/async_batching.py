@@ -0,0 +1,183 @@
+# standard libraries
+import asyncio
+from concurrent.futures import Executor
+from typing import List, Optional, Set, Tuple, Union
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.engine import FuzzyEngine
+
+# Largest number of concurrent requests inferred as one batch
+DEFAULT_MAX_BATCH_SIZE = 256
+
+# Longest time in seconds a request waits for others to join its batch
+DEFAULT_MAX_WAIT = 0.002
+
+
+class AsyncInferenceBatcher:
+    """
+    Asyncio front-end that micro-batches concurrent single-input inference requests.
+
+    Requests awaiting ainfer are collected until max_batch_size of them are pending or the first of them has waited
+    max_wait seconds, then the batch is inferred with infer_batch in an executor while new requests start the next
+    batch, and every request is resolved with its own output. Under load the engine runs at batched throughput, while
+    a lone request is delayed by at most max_wait.
+
+    The executor runs the batches concurrently if it has several workers, a single worker executor serializes them.
+    A request whose input makes inference fail is resolved with the error, the other requests of its batch with their
+    outputs.
+    """
+
+    def __init__(
+        self,
+        engine: FuzzyEngine,
+        x: Optional[np.ndarray] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialises a micro-batching front-end.
+
+        Args:
+            engine (FuzzyEngine): Fuzzy inference engine
+            x (Optional[np.ndarray], optional): Universe of discourse. Defaults to None.
+            max_batch_size (int, optional): Largest number of requests per batch. Defaults to DEFAULT_MAX_BATCH_SIZE.
+            max_wait (float, optional): Longest wait in seconds before a batch is inferred. Defaults to
+                DEFAULT_MAX_WAIT.
+            executor (Optional[Executor], optional): Executor of the batched inference, None for the default
+                executor of the event loop. Defaults to None.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError(f"Expected max_batch_size to be at least 1, but got {max_batch_size}")
+        if max_wait < 0:
+            raise ValueError(f"Expected max_wait to be non-negative, but got {max_wait}")
+
+        self.engine = engine
+        self.x = x
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self.n_inputs = len(engine.rules[0].antecedents)
+
+        self._pending: List[Tuple[np.ndarray, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the micro-batching front-end.
+        """
+        return (
+            f"AsyncInferenceBatcher(engine={self.engine}, max_batch_size={self.max_batch_size}, "
+            f"max_wait={self.max_wait})"
+        )
+
+    async def ainfer(self, inputs: Union[float, List[float]]) -> float:
+        """
+        Performs inference on a crisp input as part of the next batch.
+
+        Args:
+            inputs (Union[float, List[float]]): Crisp input values
+
+        Returns:
+            float: Crisp output value
+        """
+
+        row = np.atleast_1d(np.asarray(inputs, dtype=np.float64))
+        if row.shape != (self.n_inputs,):
+            raise ValueError(f"Expected {self.n_inputs} crisp inputs, but got shape {row.shape}")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """
+        Starts the inference of the pending requests as one batch.
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Requests cancelled while waiting are dropped from the batch
+        pending = [(row, future) for row, future in self._pending if not future.done()]
+        self._pending = []
+        if not pending:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._infer(pending))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _infer(self, pending: List[Tuple[np.ndarray, asyncio.Future]]):
+        """
+        Infers a batch of requests in the executor and resolves every request with its output.
+
+        If the batch fails, its requests are inferred one by one, so that only the requests whose own input fails
+        are resolved with an error.
+        """
+
+        loop = asyncio.get_running_loop()
+        inputs = np.stack([row for row, _ in pending])
+        try:
+            outputs = (await loop.run_in_executor(self.executor, self.engine.infer_batch, inputs, self.x)).tolist()
+        except Exception as error:
+            if len(pending) == 1:
+                outputs = [error]
+            else:
+                outputs = await loop.run_in_executor(self.executor, self._infer_rows, inputs)
+
+        for (_, future), output in zip(pending, outputs):
+            if future.done():
+                continue
+            if isinstance(output, Exception):
+                future.set_exception(output)
+            else:
+                future.set_result(output)
+
+    def _infer_rows(self, inputs: np.ndarray) -> List[Union[float, Exception]]:
+        """
+        Infers crisp inputs one by one, returning the error of the inputs whose inference fails.
+        """
+
+        outputs: List[Union[float, Exception]] = []
+        for row in inputs:
+            try:
+                outputs.append(float(self.engine.infer_batch(row[np.newaxis], self.x)[0]))
+            except Exception as error:
+                outputs.append(error)
+
+        return outputs
+
+    async def aclose(self):
+        """
+        Infers the pending requests and waits for every batch to complete.
+        """
+
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches)
+
+    async def __aenter__(self) -> "AsyncInferenceBatcher":
+        """
+        Returns the micro-batching front-end.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """
+        Infers the pending requests and waits for every batch to complete.
+        """
+        await self.aclose()
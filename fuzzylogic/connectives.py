@@ -1,9 +1,13 @@
+# standard libraries
+from typing import Tuple
+
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
 from fuzzylogic.core.connective import Connective
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import MembershipFunction1D, interval_hull, interval_intersection, interval_union
+from fuzzylogic.mf.composite import CombinedMF
 
 
 class And(Connective):
@@ -17,18 +21,31 @@ class And(Connective):
         Transforms the membership function.
         """
 
-        class IntersectedMF(MembershipFunction1D):
-            """
-            Intersected membership function.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function at x.
-                """
-                return np.minimum(mf1(x), mf2(x))
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Intersects the membership values.
+        """
+
+        return np.minimum(u1, u2)
+
+    @classmethod
+    def combine_support(cls, support1: Tuple[float, float], support2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Intersects the supports.
+        """
+
+        return interval_intersection(support1, support2)
+
+    @classmethod
+    def combine_core(cls, core1: Tuple[float, float], core2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Intersects the cores.
+        """
 
-        return IntersectedMF()
+        return interval_intersection(core1, core2)
 
 
 class Or(Connective):
@@ -42,16 +59,28 @@ class Or(Connective):
         Transforms the membership function.
         """
 
-        class UnionedMF(MembershipFunction1D):
-            """
-            Unioned membership function.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function at x.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Unions the membership values.
+        """
 
-                return np.maximum(mf1(x), mf2(x))
+        return np.maximum(u1, u2)
+
+    @classmethod
+    def combine_support(cls, support1: Tuple[float, float], support2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Bounds the union of the supports.
+        """
+
+        return interval_hull(support1, support2)
+
+    @classmethod
+    def combine_core(cls, core1: Tuple[float, float], core2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Bounds the union of the cores from within.
+        """
 
-        return UnionedMF()
+        return interval_union(core1, core2)
@@ -1,8 +1,12 @@
 # standard libraries
 from abc import ABC, abstractclassmethod
+from typing import Tuple
+
+# third party libraries
+import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import EMPTY, UNBOUNDED, MembershipFunction1D
 
 
 class Connective(ABC):
@@ -16,3 +20,26 @@ class Connective(ABC):
         Transforms the membership function.
         """
         pass
+
+    @abstractclassmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the connective elementwise to membership values.
+        """
+        pass
+
+    @classmethod
+    def combine_support(cls, support1: Tuple[float, float], support2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Support of the combination of membership functions with the given supports, unbounded unless the connective
+        overrides it.
+        """
+        return UNBOUNDED
+
+    @classmethod
+    def combine_core(cls, core1: Tuple[float, float], core2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Core of the combination of membership functions with the given cores, empty unless the connective overrides
+        it.
+        """
+        return EMPTY
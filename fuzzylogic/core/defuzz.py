@@ -13,9 +13,47 @@ class Defuzzification(ABC):
     Fuzzy Inference Engine base class.
     """
 
-    @abstractclassmethod
+    # Whether defuzz samples the membership function over the universe of discourse
+    requires_universe = True
+
+    @classmethod
     def defuzz(cls, x: np.ndarray, mf: MembershipFunction1D) -> float:
         """
-        Defuzzifies the membership function.
+        Defuzzifies the membership function, evaluating it once over the universe of discourse.
+
+        Args:
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+            mf (MembershipFunction1D): Membership function
+
+        Returns:
+            float: Defuzzified value
+        """
+        return cls.defuzz_memberships(x, mf(x))
+
+    @abstractclassmethod
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
+        """
+        Defuzzifies membership values sampled over the universe of discourse.
+
+        Args:
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+            memberships (np.ndarray): Membership values of shape (n_universe,)
+
+        Returns:
+            float: Defuzzified value
+        """
+        pass
+
+    @abstractclassmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values sampled over the universe of discourse.
+
+        Args:
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+            memberships (np.ndarray): Membership values of shape (n_samples, n_universe)
+
+        Returns:
+            np.ndarray: Defuzzified values of shape (n_samples,)
         """
         pass
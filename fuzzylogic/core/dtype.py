@@ -0,0 +1,65 @@
+# standard libraries
+from typing import Optional
+
+# third party libraries
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+# Floating point types membership values and crisp values can be computed in
+FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# Floating point type of integer, boolean and Python inputs
+DEFAULT_DTYPE = np.dtype(np.float64)
+
+
+def float_dtype(dtype: DTypeLike) -> np.dtype:
+    """
+    Checks that a type is one of the floating point types of the dtype policy.
+
+    Args:
+        dtype (DTypeLike): Floating point type, e.g. np.float32 or "float64"
+
+    Returns:
+        np.dtype: Floating point type
+    """
+
+    dtype = np.dtype(dtype)
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Expected dtype to be one of {[str(float_type) for float_type in FLOAT_DTYPES]}, got {dtype}")
+
+    return dtype
+
+
+def result_dtype(x: ArrayLike) -> np.dtype:
+    """
+    Floating point type of the membership values of observations.
+
+    Membership values keep the type of float32 and float64 observations, any other observations, e.g. integers or
+    Python floats, give float64 membership values.
+
+    Args:
+        x (ArrayLike): Observations
+
+    Returns:
+        np.dtype: Floating point type of the membership values
+    """
+
+    if isinstance(x, (np.ndarray, np.generic)) and x.dtype in FLOAT_DTYPES:
+        return x.dtype
+
+    return DEFAULT_DTYPE
+
+
+def as_float_array(x: ArrayLike, dtype: Optional[DTypeLike] = None) -> np.ndarray:
+    """
+    Casts observations to a floating point array, without copying them if they already are one of the type.
+
+    Args:
+        x (ArrayLike): Observations
+        dtype (Optional[DTypeLike], optional): Floating point type, None for result_dtype(x). Defaults to None.
+
+    Returns:
+        np.ndarray: Floating point observations
+    """
+
+    return np.asarray(x, dtype=result_dtype(x) if dtype is None else dtype)
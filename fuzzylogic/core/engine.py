@@ -1,13 +1,31 @@
 # standard libraries
+import hashlib
+import pickle
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
 
 # third party libraries
 import numpy as np
+from numpy.typing import DTypeLike
 
 # fuzzy logic libraries
+from fuzzylogic.core.dtype import DEFAULT_DTYPE, float_dtype
 from fuzzylogic.core.mf import MembershipFunction1D, MembershipFunction2D
 from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.streaming import DEFAULT_BATCH_SIZE, iter_batches
+
+
+@dataclass(frozen=True)
+class InferenceResult:
+    """
+    Result of a fuzzy inference on a crisp input.
+    """
+
+    rule_strengths: np.ndarray  # firing strength of every rule of shape (n_rules,)
+    composed_mf: MembershipFunction1D | MembershipFunction2D  # output membership function
+    output: Optional[float] = None  # crisp output, None without a universe of discourse
+    outputs: Dict[str, float] = field(default_factory=dict)  # crisp output of every additional defuzzification method
 
 
 class FuzzyEngine(ABC):
@@ -18,18 +36,45 @@ class FuzzyEngine(ABC):
     def __init__(
         self,
         rules: List[FuzzyRule],
+        dtype: DTypeLike = DEFAULT_DTYPE,
     ):
         """
         Initialises a fuzzy inference engine.
 
         Args:
             rules (List[FuzzyRule]): List of fuzzy rules
+            dtype (DTypeLike, optional): Floating point type of the batched inference, np.float32 or np.float64.
+                Defaults to DEFAULT_DTYPE.
         """
         # Check if the rules are valid
         if not rules:
             raise ValueError("The rules list cannot be empty.")
 
         self.rules = rules
+        self.dtype = float_dtype(dtype)
+
+    def _definition(self) -> tuple:
+        """
+        Returns the objects that define the output of the fuzzy inference engine.
+        """
+        return (type(self).__module__, type(self).__qualname__, self.rules, self.dtype.str)
+
+    def fingerprint(self, x: Optional[np.ndarray] = None) -> str:
+        """
+        Fingerprints the definition of the fuzzy inference engine, e.g. to detect stale stored control surfaces.
+
+        The fingerprint is a hash of the pickled rules and operators, so engines built the same way share it across
+        processes, while any change of a rule, membership function or operator changes it.
+
+        Args:
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable. Defaults to None.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest
+        """
+        universe = None if x is None else np.asarray(x, dtype=np.float64)
+
+        return hashlib.sha256(pickle.dumps((self._definition(), universe), protocol=4)).hexdigest()
 
     @abstractmethod
     def compose(self, inputs: float | List[float]) -> MembershipFunction1D | MembershipFunction2D:
@@ -44,6 +89,20 @@ class FuzzyEngine(ABC):
         """
         pass
 
+    @abstractmethod
+    def evaluate(self, inputs: float | List[float], x: Optional[np.ndarray] = None) -> InferenceResult:
+        """
+        Performs fuzzy inference on a crisp input without modifying the fuzzy inference engine.
+
+        Args:
+            inputs (float | List[float]): Crisp Input(s) value(s)
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable. Defaults to None.
+
+        Returns:
+            InferenceResult: Rule strengths, output membership function and crisp output
+        """
+        pass
+
     @abstractmethod
     def infer(self, x: np.ndarray) -> np.ndarray:
         """
@@ -58,12 +117,51 @@ class FuzzyEngine(ABC):
         pass
 
     @abstractmethod
-    def calculate_fuzzy_control_surface(self, antecedent_ranges: List[np.ndarray]) -> np.ndarray:
+    def infer_batch(self, inputs: np.ndarray, x: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Perform inference with the fuzzy inference engine on a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+            x (Optional[np.ndarray], optional): Universe of discourse. Defaults to None.
+
+        Returns:
+            np.ndarray: Crisp output values of shape (n_samples,)
+        """
+        pass
+
+    def infer_stream(
+        self, source: Iterable, x: Optional[np.ndarray] = None, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[np.ndarray]:
+        """
+        Performs inference lazily on a stream of crisp inputs, e.g. the chunks of read_csv_chunks or read_npy_chunks.
+
+        The stream is regrouped into batches of batch_size rows by iter_batches and every batch is inferred with
+        infer_batch once the previous outputs are consumed, so memory is bounded by the batch size whatever the length
+        of the stream.
+
+        Args:
+            source (Iterable): Stream of crisp inputs of shape (n_inputs,) or chunks of shape (n_rows, n_inputs)
+            x (Optional[np.ndarray], optional): Universe of discourse. Defaults to None.
+            batch_size (int, optional): Number of crisp inputs inferred at once. Defaults to DEFAULT_BATCH_SIZE.
+
+        Yields:
+            np.ndarray: Crisp output values of every batch of shape (batch_size,), the last batch may be smaller
+        """
+        for batch in iter_batches(source, batch_size, self.dtype):
+            yield self.infer_batch(batch, x)
+
+    @abstractmethod
+    def calculate_fuzzy_control_surface(
+        self, antecedent_ranges: List[np.ndarray], x: Optional[np.ndarray] = None, indexing: str = "xy"
+    ) -> np.ndarray:
         """
         Calculates the fuzzy control surface.
 
         Args:
             antecedent_ranges (List[np.ndarray]): List of numpy arrays containing the antecedent ranges
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable. Defaults to None.
+            indexing (str, optional): Meshgrid indexing of the antecedent ranges, "xy" or "ij". Defaults to "xy".
 
         Returns:
             np.ndarray: Fuzzy control surface
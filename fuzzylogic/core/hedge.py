@@ -1,8 +1,12 @@
 # standard libraries
 from abc import ABC, abstractclassmethod
+from typing import Tuple
+
+# third party libraries
+import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import EMPTY, UNBOUNDED, MembershipFunction1D
 
 
 class Hedge(ABC):
@@ -16,3 +20,34 @@ class Hedge(ABC):
         Transforms the membership function.
         """
         pass
+
+    @abstractclassmethod
+    def apply(cls, u: np.ndarray) -> np.ndarray:
+        """
+        Applies the hedge elementwise to membership values.
+        """
+        pass
+
+    @classmethod
+    def support_tolerance(cls, tolerance: float) -> float:
+        """
+        Tolerance on the membership values of a membership function below which its transformation is below
+        tolerance, the tolerance itself unless the hedge overrides it.
+        """
+        return tolerance
+
+    @classmethod
+    def transform_support(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Support of the transformation of a membership function with the given support and core, unbounded unless the
+        hedge overrides it.
+        """
+        return UNBOUNDED
+
+    @classmethod
+    def transform_core(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Core of the transformation of a membership function with the given exact support and core, empty unless the
+        hedge overrides it.
+        """
+        return EMPTY
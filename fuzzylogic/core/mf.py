@@ -1,10 +1,73 @@
 # standard libraries
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
+# Membership value below which a membership function without bounded support is treated as zero by support
+SUPPORT_TOLERANCE = 1e-9
+
+# Closed intervals as (low, high), empty when low > high
+UNBOUNDED = (-np.inf, np.inf)
+EMPTY = (np.inf, -np.inf)
+
+
+def interval_intersection(interval1: Tuple[float, float], interval2: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    Intersection of two closed intervals.
+
+    Args:
+        interval1 (Tuple[float, float]): First interval
+        interval2 (Tuple[float, float]): Second interval
+
+    Returns:
+        Tuple[float, float]: Intersection, EMPTY if the intervals do not overlap
+    """
+    low, high = max(interval1[0], interval2[0]), min(interval1[1], interval2[1])
+
+    return (low, high) if low <= high else EMPTY
+
+
+def interval_hull(interval1: Tuple[float, float], interval2: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    Smallest closed interval containing two closed intervals.
+
+    Args:
+        interval1 (Tuple[float, float]): First interval
+        interval2 (Tuple[float, float]): Second interval
+
+    Returns:
+        Tuple[float, float]: Hull of the intervals
+    """
+    if interval1[0] > interval1[1]:
+        return interval2
+    if interval2[0] > interval2[1]:
+        return interval1
+
+    return min(interval1[0], interval2[0]), max(interval1[1], interval2[1])
+
+
+def interval_union(interval1: Tuple[float, float], interval2: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    Largest closed interval contained in the union of two closed intervals that it can be read from directly, i.e. the
+    hull of overlapping intervals or else the longer one.
+
+    Args:
+        interval1 (Tuple[float, float]): First interval
+        interval2 (Tuple[float, float]): Second interval
+
+    Returns:
+        Tuple[float, float]: Interval contained in the union
+    """
+    if interval1[0] > interval1[1] or interval2[0] > interval2[1]:
+        return interval_hull(interval1, interval2)
+    if interval1[0] <= interval2[1] and interval2[0] <= interval1[1]:
+        return interval_hull(interval1, interval2)
+
+    return max(interval1, interval2, key=lambda interval: interval[1] - interval[0])
+
 
 @dataclass
 class MembershipFunction1D(ABC):
@@ -19,6 +82,32 @@ class MembershipFunction1D(ABC):
         """
         pass
 
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+
+        Membership functions that never reach zero report the interval outside of which they are below tolerance, a
+        tolerance of 0 gives the exact support. The default is unbounded.
+
+        Args:
+            tolerance (float, optional): Membership value treated as zero. Defaults to SUPPORT_TOLERANCE.
+
+        Returns:
+            Tuple[float, float]: Lower and upper bound of the support
+        """
+        return UNBOUNDED
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+
+        The interval may be smaller than the core when the core is not an interval or is unknown. The default is empty.
+
+        Returns:
+            Tuple[float, float]: Lower and upper bound of the core, EMPTY if the core is empty or unknown
+        """
+        return EMPTY
+
 
 @dataclass
 class MembershipFunction2D(ABC):
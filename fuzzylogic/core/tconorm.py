@@ -1,8 +1,14 @@
 # standard libraries
 from abc import ABC, abstractclassmethod
+from functools import reduce
+from typing import List, Tuple
+
+# third party libraries
+import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import MembershipFunction1D, interval_hull, interval_union
+from fuzzylogic.mf.composite import ReducedMF
 
 
 class TCoNorm(ABC):
@@ -17,6 +23,62 @@ class TCoNorm(ABC):
         """
         pass
 
+    @abstractclassmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the T-CoNorm elementwise to membership values.
+        """
+        pass
+
+    @classmethod
+    def combine_many(cls, mfs: List[MembershipFunction1D]) -> MembershipFunction1D:
+        """
+        Combines any number of membership functions, evaluated together in one pass.
+
+        Args:
+            mfs (List[MembershipFunction1D]): Membership functions
+
+        Returns:
+            MembershipFunction1D: Combined membership function
+        """
+        if not mfs:
+            raise ValueError("The membership functions list cannot be empty.")
+
+        return ReducedMF(operator=cls, mfs=list(mfs))
+
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the T-CoNorm to any number of membership values, stacked along the first axis.
+
+        The default folds apply over the operands, which is correct for any T-CoNorm as they are associative.
+
+        Args:
+            memberships (np.ndarray): Membership values of shape (n_operands, ...)
+
+        Returns:
+            np.ndarray: Combined membership values of shape (...)
+        """
+        return reduce(cls.apply, memberships)
+
+    @classmethod
+    def combine_support(cls, support1: Tuple[float, float], support2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Support of the combination of membership functions with the given supports.
+
+        A T-CoNorm is zero where both membership values are zero, so the support is within the hull of the supports.
+        """
+        return interval_hull(support1, support2)
+
+    @classmethod
+    def combine_core(cls, core1: Tuple[float, float], core2: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Core of the combination of membership functions with the given cores.
+
+        A T-CoNorm is one where either membership value is one, so the core contains the union of the cores.
+        """
+        return interval_union(core1, core2)
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the T-CoNorm.
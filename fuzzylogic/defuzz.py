@@ -1,9 +1,34 @@
+# standard libraries
+from functools import reduce
+from typing import List, Optional, Tuple
+
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
 from fuzzylogic.core.defuzz import Defuzzification
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import MembershipFunction1D, interval_intersection
+from fuzzylogic.mf.bank import BankedMF
+from fuzzylogic.mf.composite import CombinedMF, ReducedMF, TransformedMF
+from fuzzylogic.mf.constant import ConstantMF
+from fuzzylogic.mf.piecewise import (
+    PiecewiseLinearMF,
+    maximum,
+    piecewise_linear_bisector,
+    piecewise_linear_centroid,
+    segment_areas,
+)
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, MinimumTNorm
+
+# Absolute tolerance of the adaptive defuzzification methods on the defuzzified value
+ADAPTIVE_TOLERANCE = 1e-6
+
+# Number of intervals of the uniform grid that adaptive sampling starts from
+ADAPTIVE_INITIAL_INTERVALS = 32
+
+# Largest number of membership function evaluations of adaptive sampling
+ADAPTIVE_MAX_EVALUATIONS = 10000
 
 
 class Centroid(Defuzzification):
@@ -12,15 +37,15 @@ class Centroid(Defuzzification):
     """
 
     @classmethod
-    def defuzz(cls, x: np.ndarray, mf: MembershipFunction1D) -> float:
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
         """
-        Defuzzifies the membership function.
+        Defuzzifies membership values.
         """
 
         # Compute the summation of x[i] * mf(x[i]) and the summation of mf(x[i])
-        numerator = np.sum(x * mf(x))
+        numerator = np.sum(x * memberships)
 
-        denominator = np.sum(mf(x))
+        denominator = np.sum(memberships)
 
         # Avoid division by zero
         if denominator == 0:
@@ -28,6 +53,23 @@ class Centroid(Defuzzification):
 
         return numerator / denominator
 
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values.
+        """
+
+        # Compute the summations row by row
+        numerator = np.sum(x * memberships, axis=-1)
+
+        denominator = np.sum(memberships, axis=-1)
+
+        # Avoid division by zero
+        if np.any(denominator == 0):
+            raise ValueError("The membership function has an area of zero, cannot compute COA.")
+
+        return numerator / denominator
+
 
 class Bisector(Defuzzification):
     """
@@ -35,13 +77,13 @@ class Bisector(Defuzzification):
     """
 
     @classmethod
-    def defuzz(cls, x: np.ndarray, mf: MembershipFunction1D) -> float:
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
         """
-        Defuzzifies the membership function.
+        Defuzzifies membership values.
         """
 
         # Compute the cumulative membership values
-        cumulative_mf = np.cumsum(mf(x))
+        cumulative_mf = np.cumsum(memberships)
 
         # Total area
         total_area = cumulative_mf[-1]
@@ -55,6 +97,27 @@ class Bisector(Defuzzification):
 
         return x[bisector_index]
 
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values.
+        """
+
+        # Compute the cumulative membership values row by row
+        cumulative_mf = np.cumsum(memberships, axis=-1)
+
+        # Total area of each row
+        total_area = cumulative_mf[:, -1:]
+
+        # If any total area is zero, raise an error
+        if np.any(total_area == 0):
+            raise ValueError("The membership function has an area of zero, cannot compute BOA.")
+
+        # Find the index where the cumulative area is half of the total area
+        bisector_index = np.argmin(np.abs(cumulative_mf - total_area / 2), axis=-1)
+
+        return x[bisector_index]
+
 
 class MeanOfMaximum(Defuzzification):
     """
@@ -62,20 +125,33 @@ class MeanOfMaximum(Defuzzification):
     """
 
     @classmethod
-    def defuzz(cls, x: np.ndarray, mf: MembershipFunction1D) -> float:
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
         """
-        Defuzzifies the membership function.
+        Defuzzifies membership values.
         """
 
         # Find the maximum membership values
-        maximum_mf = np.max(mf(x))
+        maximum_mf = np.max(memberships)
 
         # Find the indices where the maximum membership values are
-        maximum_indices = np.where(mf(x) == maximum_mf)[0]
+        maximum_indices = np.where(memberships == maximum_mf)[0]
 
         # Return the mean of the indices
         return np.mean(x[maximum_indices])
 
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values.
+        """
+
+        # Mask the maximum membership values of each row
+        is_maximum = memberships == np.max(memberships, axis=-1, keepdims=True)
+
+        # Return the mean of the masked universe values, counting the maxima in the floating point type of the values
+        masked_x = np.where(is_maximum, x, 0)
+        return np.sum(masked_x, axis=-1) / np.sum(is_maximum, axis=-1, dtype=masked_x.dtype)
+
 
 class LargestOfMaximum(Defuzzification):
     """
@@ -83,20 +159,32 @@ class LargestOfMaximum(Defuzzification):
     """
 
     @classmethod
-    def defuzz(cls, x: np.ndarray, mf: MembershipFunction1D) -> float:
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
         """
-        Defuzzifies the membership function.
+        Defuzzifies membership values.
         """
 
         # Find the maximum membership values
-        maximum_mf = np.max(mf(x))
+        maximum_mf = np.max(memberships)
 
         # Find the indices where the maximum membership values are
-        maximum_indices = np.where(mf(x) == maximum_mf)[0]
+        maximum_indices = np.where(memberships == maximum_mf)[0]
 
         # Return the largest of the indices
         return np.max(x[maximum_indices])
 
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values.
+        """
+
+        # Mask the maximum membership values of each row
+        is_maximum = memberships == np.max(memberships, axis=-1, keepdims=True)
+
+        # Return the largest of the masked universe values
+        return np.max(np.where(is_maximum, x, -np.inf), axis=-1)
+
 
 class SmallestOfMaximum(Defuzzification):
     """
@@ -104,20 +192,334 @@ class SmallestOfMaximum(Defuzzification):
     """
 
     @classmethod
-    def defuzz(cls, x: np.ndarray, mf: MembershipFunction1D) -> float:
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
         """
-        Defuzzifies the membership function.
+        Defuzzifies membership values.
         """
 
         # Find the maximum membership values
-        maximum_mf = np.max(mf(x))
+        maximum_mf = np.max(memberships)
 
         # Find the indices where the maximum membership values are
-        maximum_indices = np.where(mf(x) == maximum_mf)[0]
+        maximum_indices = np.where(memberships == maximum_mf)[0]
 
         # Return the smallest of the indices
         return np.min(x[maximum_indices])
 
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values.
+        """
+
+        # Mask the maximum membership values of each row
+        is_maximum = memberships == np.max(memberships, axis=-1, keepdims=True)
+
+        # Return the smallest of the masked universe values
+        return np.min(np.where(is_maximum, x, np.inf), axis=-1)
+
+
+def to_piecewise_linear(mf: MembershipFunction1D) -> PiecewiseLinearMF:
+    """
+    Converts an aggregated Mamdani output into an equal piecewise linear membership function.
+
+    Supports triangle, trapezoid and rectangular consequents clipped by a constant with the minimum or scaled with the
+    algebraic product, combined with the minimum and aggregated with the maximum.
+
+    Args:
+        mf (MembershipFunction1D): Membership function
+
+    Returns:
+        PiecewiseLinearMF: Piecewise linear membership function
+    """
+
+    if isinstance(mf, BankedMF):
+        return to_piecewise_linear(mf.bank.mfs[mf.index])
+
+    if isinstance(mf, ReducedMF) and mf.operator is MinimumTNorm:
+        return reduce(PiecewiseLinearMF.minimum, [to_piecewise_linear(operand) for operand in mf.mfs])
+
+    if not isinstance(mf, (CombinedMF, ReducedMF)):
+        return PiecewiseLinearMF.from_mf(mf)
+
+    if mf.operator is MaximumTCoNorm:
+        # Flatten the aggregation chain and merge the rules in a balanced tree
+        operands, stack = [], [mf]
+        while stack:
+            operand = stack.pop()
+            if isinstance(operand, CombinedMF) and operand.operator is MaximumTCoNorm:
+                stack.extend([operand.mf2, operand.mf1])
+            elif isinstance(operand, ReducedMF) and operand.operator is MaximumTCoNorm:
+                stack.extend(reversed(operand.mfs))
+            else:
+                operands.append(to_piecewise_linear(operand))
+        return maximum(operands)
+
+    if isinstance(mf, ReducedMF):
+        raise TypeError(f"Cannot convert a membership function reduced with {mf.operator.__name__} to piecewise linear")
+
+    constants = [operand for operand in (mf.mf1, mf.mf2) if isinstance(operand, ConstantMF)]
+    others = [operand for operand in (mf.mf1, mf.mf2) if not isinstance(operand, ConstantMF)]
+    if mf.operator is MinimumTNorm and len(constants) == 1:
+        return to_piecewise_linear(others[0]).clip(constants[0].value)
+    if mf.operator is MinimumTNorm and not constants:
+        return to_piecewise_linear(mf.mf1).minimum(to_piecewise_linear(mf.mf2))
+    if mf.operator is AlgebraicProductTNorm and len(constants) == 1:
+        return to_piecewise_linear(others[0]).scale(constants[0].value)
+
+    raise TypeError(f"Cannot convert a membership function combined with {mf.operator.__name__} to piecewise linear")
+
+
+class PiecewiseLinearCentroid(Defuzzification):
+    """
+    Exact centroid defuzzification method for piecewise linear aggregated outputs.
+    """
+
+    requires_universe = False
+
+    @classmethod
+    def defuzz(cls, x: Optional[np.ndarray], mf: MembershipFunction1D) -> float:
+        """
+        Defuzzifies the membership function from its breakpoints, the universe of discourse is not used.
+        """
+
+        return to_piecewise_linear(mf).centroid()
+
+    @classmethod
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
+        """
+        Defuzzifies membership values, interpolated linearly between the universe values.
+        """
+
+        return float(piecewise_linear_centroid(x, memberships))
+
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values, interpolated linearly between the universe values.
+        """
+
+        return piecewise_linear_centroid(x, memberships)
+
+
+class PiecewiseLinearBisector(Defuzzification):
+    """
+    Exact bisector of area defuzzification method for piecewise linear aggregated outputs.
+    """
+
+    requires_universe = False
+
+    @classmethod
+    def defuzz(cls, x: Optional[np.ndarray], mf: MembershipFunction1D) -> float:
+        """
+        Defuzzifies the membership function from its breakpoints, the universe of discourse is not used.
+        """
+
+        return to_piecewise_linear(mf).bisector()
+
+    @classmethod
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
+        """
+        Defuzzifies membership values, interpolated linearly between the universe values.
+        """
+
+        return float(piecewise_linear_bisector(x, memberships))
+
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values, interpolated linearly between the universe values.
+        """
+
+        return piecewise_linear_bisector(x, memberships)
+
+
+def _breakpoints(mf: MembershipFunction1D) -> List[float]:
+    """
+    Bounds of the supports and cores of the membership functions a membership function is composed of, where it may
+    have a kink, a jump or a peak.
+    """
+
+    breakpoints, stack = [], [mf]
+    while stack:
+        operand = stack.pop()
+        if isinstance(operand, CombinedMF):
+            stack.extend([operand.mf1, operand.mf2])
+        elif isinstance(operand, ReducedMF):
+            stack.extend(operand.mfs)
+        elif isinstance(operand, TransformedMF):
+            stack.append(operand.mf)
+        elif isinstance(operand, BankedMF):
+            stack.append(operand.bank.mfs[operand.index])
+        elif isinstance(operand, PiecewiseLinearMF):
+            breakpoints.extend(operand.x.tolist())
+        else:
+            breakpoints.extend([*operand.support(), *operand.core()])
+
+    return breakpoints
+
+
+def adaptive_sample(
+    mf: MembershipFunction1D,
+    low: float,
+    high: float,
+    tolerance: float = ADAPTIVE_TOLERANCE,
+    max_evaluations: int = ADAPTIVE_MAX_EVALUATIONS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Samples a membership function densely only where it is not linear.
+
+    Sampling starts from a coarse uniform grid extended with the bounds of the supports and cores of the membership
+    functions mf is composed of, so that narrow peaks are not missed. Every interval whose midpoint deviates from the
+    linear interpolation of its ends is split, until the area error of the linear interpolation is small enough for
+    the centroid and bisector of the samples to be within tolerance, or the evaluation budget is spent.
+
+    Args:
+        mf (MembershipFunction1D): Membership function
+        low (float): Lower bound of the sampled interval
+        high (float): Upper bound of the sampled interval
+        tolerance (float, optional): Absolute tolerance on the centroid and bisector. Defaults to ADAPTIVE_TOLERANCE.
+        max_evaluations (int, optional): Largest number of evaluations of mf. Defaults to ADAPTIVE_MAX_EVALUATIONS.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Increasing sample points and the membership values at them
+    """
+
+    breakpoints = np.array(_breakpoints(mf), dtype=np.float64)
+    x = np.unique(
+        np.r_[
+            np.linspace(low, high, ADAPTIVE_INITIAL_INTERVALS + 1),
+            breakpoints[(low < breakpoints) & (breakpoints < high)],
+        ]
+    )
+    y = np.asarray(mf(x), dtype=np.float64)
+    n_evaluations = len(x)
+    length = high - low
+
+    # Ratio of the estimated error of every interval to its share of the tolerance, above 1 to refine
+    excess = np.full(len(x) - 1, np.inf)
+    while True:
+        idx = np.flatnonzero(excess > 1)
+        budget = max_evaluations - n_evaluations
+        if len(idx) == 0 or budget <= 0:
+            break
+        if len(idx) > budget:
+            # Spend the rest of the budget on the intervals with the largest errors
+            idx = np.sort(idx[np.argsort(-excess[idx], kind="stable")[:budget]])
+
+        # Split the intervals at their midpoint
+        widths = x[idx + 1] - x[idx]
+        midpoints = x[idx] + widths / 2
+        midpoint_y = np.asarray(mf(midpoints), dtype=np.float64)
+        n_evaluations += len(idx)
+        x, y = np.insert(x, idx + 1, midpoints), np.insert(y, idx + 1, midpoint_y)
+
+        # The area between the membership function and its linear interpolation on an interval, times its distance
+        # to the centroid, bounds the error it adds to the centroid. The tolerance is shared among the intervals in
+        # proportion to their width, so that the errors add up to at most tolerance
+        errors = np.abs(midpoint_y - (y[idx + np.arange(len(idx))] + y[idx + np.arange(len(idx)) + 2]) / 2) * widths / 2
+        area = np.sum(segment_areas(x, y))
+        centroid = piecewise_linear_centroid(x, y) if area > 0 else 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = errors * np.maximum(np.abs(midpoints - centroid), widths) * length / (tolerance * area * widths)
+        # A jump never looks linear, stop once it is located well within tolerance
+        ratios[widths / 2 <= tolerance * area / length] = 0
+
+        # Both halves of a split interval inherit its error ratio
+        excess = np.zeros(len(x) - 1)
+        excess[idx + np.arange(len(idx))] = ratios
+        excess[idx + np.arange(len(idx)) + 1] = ratios
+
+    return x, y
+
+
+def _adaptive_bounds(x: Optional[np.ndarray], mf: MembershipFunction1D) -> Tuple[float, float]:
+    """
+    Interval to sample adaptively, the support of the membership function within the universe of discourse.
+    """
+
+    low, high = mf.support()
+    if x is not None:
+        low, high = interval_intersection((low, high), (float(np.min(x)), float(np.max(x))))
+    if not (np.isfinite(low) and np.isfinite(high)):
+        raise ValueError(
+            "Adaptive sampling requires a universe of discourse or a membership function of bounded support."
+        )
+
+    return low, high
+
+
+class AdaptiveCentroid(Defuzzification):
+    """
+    Centroid defuzzification method sampling the aggregated output adaptively.
+    """
+
+    requires_universe = False
+    tolerance = ADAPTIVE_TOLERANCE
+    max_evaluations = ADAPTIVE_MAX_EVALUATIONS
+
+    @classmethod
+    def defuzz(cls, x: Optional[np.ndarray], mf: MembershipFunction1D) -> float:
+        """
+        Defuzzifies the membership function from adaptive samples within the bounds of the universe of discourse.
+        """
+
+        samples = adaptive_sample(mf, *_adaptive_bounds(x, mf), cls.tolerance, cls.max_evaluations)
+
+        return float(piecewise_linear_centroid(*samples))
+
+    @classmethod
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
+        """
+        Defuzzifies membership values, interpolated linearly between the universe values.
+        """
+
+        return float(piecewise_linear_centroid(x, memberships))
+
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values, interpolated linearly between the universe values.
+        """
+
+        return piecewise_linear_centroid(x, memberships)
+
+
+class AdaptiveBisector(Defuzzification):
+    """
+    Bisector of area defuzzification method sampling the aggregated output adaptively.
+    """
+
+    requires_universe = False
+    tolerance = ADAPTIVE_TOLERANCE
+    max_evaluations = ADAPTIVE_MAX_EVALUATIONS
+
+    @classmethod
+    def defuzz(cls, x: Optional[np.ndarray], mf: MembershipFunction1D) -> float:
+        """
+        Defuzzifies the membership function from adaptive samples within the bounds of the universe of discourse.
+        """
+
+        samples = adaptive_sample(mf, *_adaptive_bounds(x, mf), cls.tolerance, cls.max_evaluations)
+
+        return float(piecewise_linear_bisector(*samples))
+
+    @classmethod
+    def defuzz_memberships(cls, x: np.ndarray, memberships: np.ndarray) -> float:
+        """
+        Defuzzifies membership values, interpolated linearly between the universe values.
+        """
+
+        return float(piecewise_linear_bisector(x, memberships))
+
+    @classmethod
+    def defuzz_batch(cls, x: np.ndarray, memberships: np.ndarray) -> np.ndarray:
+        """
+        Defuzzifies a batch of membership values, interpolated linearly between the universe values.
+        """
+
+        return piecewise_linear_bisector(x, memberships)
+
 
 DEFUZZ = {
     "centroid": Centroid,
@@ -125,4 +527,8 @@ DEFUZZ = {
     "mom": MeanOfMaximum,
     "lom": LargestOfMaximum,
     "som": SmallestOfMaximum,
+    "exact_centroid": PiecewiseLinearCentroid,
+    "exact_bisector": PiecewiseLinearBisector,
+    "adaptive_centroid": AdaptiveCentroid,
+    "adaptive_bisector": AdaptiveBisector,
 }
@@ -0,0 +1,186 @@
+# standard libraries
+from dataclasses import dataclass, fields, is_dataclass
+from functools import partial
+from typing import Callable, Dict, Hashable, List, Tuple
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import as_float_array
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
+from fuzzylogic.mf.bank import BankedMF
+from fuzzylogic.mf.composite import CombinedMF, ReducedMF, TransformedMF
+from fuzzylogic.mf.constant import ConstantMF
+from fuzzylogic.rule_base import _TermTable
+
+
+def _leaf_key(mf: MembershipFunction1D) -> Hashable:
+    """
+    Key under which equal leaf membership functions are merged.
+
+    Members of a bank are merged by bank and index, membership functions whose parameters are all scalars by family
+    and parameters, any other membership function only with itself.
+    """
+
+    if isinstance(mf, BankedMF):
+        return BankedMF, id(mf.bank), mf.index
+    if is_dataclass(mf):
+        parameters = tuple(getattr(mf, field.name) for field in fields(mf))
+        if all(isinstance(parameter, (int, float)) for parameter in parameters):
+            return type(mf), parameters
+
+    return (id(mf),)
+
+
+def _apply_many(apply_many: Callable, *memberships: np.ndarray) -> np.ndarray:
+    """
+    Applies an n-ary operator to membership values, broadcasting constants.
+    """
+    return apply_many(np.stack(np.broadcast_arrays(*memberships)))
+
+
+@dataclass(eq=False)
+class CompiledMF(MembershipFunction1D):
+    """
+    Composite membership function compiled into a program over its distinct subexpressions.
+
+    The expression tree built by T-Norms, T-CoNorms, connectives and hedges is flattened into a list of nodes in
+    evaluation order. Equal subexpressions are merged into one node, so that every distinct leaf membership function
+    is evaluated once per input array, grouped into banks where possible, and every distinct node is applied once.
+    Constant leaves are kept as scalars and broadcast by the operators, n-ary reductions stack their operands.
+    """
+
+    expression: MembershipFunction1D  # compiled membership function
+    leaves: _TermTable  # distinct non-constant leaf membership functions
+    constants: List[float]  # values of the distinct constant leaves
+    nodes: List[Tuple[Callable, Tuple[int, ...]]]  # function and operand slots of every distinct composite
+    last_uses: List[int]  # index of the last node reading each slot, to release intermediate values early
+    output: int  # slot of the compiled membership function
+
+    @classmethod
+    def from_mf(cls, mf: MembershipFunction1D) -> "CompiledMF":
+        """
+        Compiles a composite membership function.
+
+        Slots hold the values of the leaves, then of the constants, then of the composite nodes in evaluation order.
+
+        Args:
+            mf (MembershipFunction1D): Membership function
+
+        Returns:
+            CompiledMF: Compiled membership function
+        """
+
+        leaves: Dict[Hashable, int] = {}
+        leaf_mfs: List[MembershipFunction1D] = []
+        constants: Dict[Hashable, int] = {}
+        nodes: Dict[Hashable, int] = {}
+        node_operands: List[Tuple[type, type, Tuple[Tuple[str, int], ...]]] = []
+
+        # Operands of a composite are referred to as ("leaf", index), ("constant", index) or ("node", index) until
+        # the number of leaves and constants is known
+        refs: Dict[int, Tuple[str, int]] = {}
+        stack = [(mf, False)]
+        while stack:
+            operand, expanded = stack.pop()
+            if id(operand) in refs:
+                continue
+
+            if isinstance(operand, (CombinedMF, ReducedMF, TransformedMF)):
+                if isinstance(operand, CombinedMF):
+                    children = (operand.mf1, operand.mf2)
+                elif isinstance(operand, ReducedMF):
+                    children = tuple(operand.mfs)
+                else:
+                    children = (operand.mf,)
+                if not expanded:
+                    # Visit the operands before the composite
+                    stack.append((operand, True))
+                    stack.extend((child, False) for child in reversed(children) if id(child) not in refs)
+                    continue
+
+                function = operand.hedge if isinstance(operand, TransformedMF) else operand.operator
+                operand_refs = tuple(refs[id(child)] for child in children)
+                key = (type(operand), function, operand_refs)
+                if key not in nodes:
+                    nodes[key] = len(node_operands)
+                    node_operands.append(key)
+                refs[id(operand)] = ("node", nodes[key])
+            elif isinstance(operand, ConstantMF):
+                refs[id(operand)] = ("constant", constants.setdefault(float(operand.value), len(constants)))
+            else:
+                key = _leaf_key(operand)
+                if key not in leaves:
+                    leaves[key] = len(leaf_mfs)
+                    leaf_mfs.append(operand)
+                refs[id(operand)] = ("leaf", leaves[key])
+
+        # Resolve the references to slots
+        offsets = {"leaf": 0, "constant": len(leaf_mfs), "node": len(leaf_mfs) + len(constants)}
+
+        def slot(ref: Tuple[str, int]) -> int:
+            return offsets[ref[0]] + ref[1]
+
+        compiled_nodes = [
+            (
+                partial(_apply_many, function.apply_many) if node_type is ReducedMF else function.apply,
+                tuple(slot(ref) for ref in operand_refs),
+            )
+            for node_type, function, operand_refs in node_operands
+        ]
+        n_slots = offsets["node"] + len(compiled_nodes)
+        last_uses = [-1] * n_slots
+        for idx, (_, operand_slots) in enumerate(compiled_nodes):
+            for operand_slot in operand_slots:
+                last_uses[operand_slot] = idx
+
+        return cls(
+            expression=mf,
+            leaves=_TermTable.from_mfs(leaf_mfs),
+            constants=list(constants),
+            nodes=compiled_nodes,
+            last_uses=last_uses,
+            output=slot(refs[id(mf)]),
+        )
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the membership function at x.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: membership values
+        """
+        x = as_float_array(x)
+        flat_x = x.reshape(-1)
+
+        values: List[object] = [*self.leaves(flat_x), *(x.dtype.type(value) for value in self.constants)]
+        for idx, (function, operand_slots) in enumerate(self.nodes):
+            values.append(function(*(values[operand_slot] for operand_slot in operand_slots)))
+
+            # Release the operands no later node reads
+            for operand_slot in operand_slots:
+                if self.last_uses[operand_slot] == idx and operand_slot != self.output:
+                    values[operand_slot] = None
+
+        memberships = values[self.output]
+        if np.shape(memberships) != flat_x.shape or memberships.dtype != x.dtype:
+            # The membership function is constant or of another dtype
+            memberships = np.broadcast_to(memberships, flat_x.shape).astype(x.dtype)
+
+        return memberships.reshape(x.shape)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return self.expression.support(tolerance)
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.expression.core()
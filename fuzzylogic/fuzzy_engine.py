@@ -1,21 +1,51 @@
 # standard libraries
-from functools import reduce
-from typing import List, Union
+import time
+import warnings
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 # third party libraries
 import numpy as np
+from numpy.typing import DTypeLike
 
 # fuzzy logic libraries
-from fuzzylogic.core.engine import FuzzyEngine
+from fuzzylogic.core.dtype import DEFAULT_DTYPE, as_float_array
+from fuzzylogic.core.engine import FuzzyEngine, InferenceResult
 from fuzzylogic.core.mf import MembershipFunction1D
 from fuzzylogic.core.tconorm import TCoNorm
+from fuzzylogic.core.tnorm import TNorm
 from fuzzylogic.defuzz import DEFUZZ
-from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.fuzzy_rule import FuzzyRule, TSKFuzzyRule
+from fuzzylogic.jit import NUMBA_AVAILABLE, JITRuleBase
+from fuzzylogic.mf.constant import ConstantMF
+from fuzzylogic.mf.interval import IntervalType2MF
+from fuzzylogic.mf.singleton import FuzzySingleton
+from fuzzylogic.profiling import DEFAULT_N_BINS, InferenceProfiler, profile_stage
+from fuzzylogic.rule_base import CompiledRuleBase, aggregate_clipped_consequents, support_slices
+from fuzzylogic.rule_index import RuleIndex
+from fuzzylogic.type_reduction import karnik_mendel, karnik_mendel_left, karnik_mendel_right
+
+# Backends of the compiled rule base
+COMPILE_BACKENDS = ("numpy", "numba")
+
+# Type reduction methods of the interval type-2 fuzzy inference engine
+TYPE_REDUCTIONS = ("centroid", "center_of_sets")
+
+# Approximate number of bytes of intermediate arrays evaluated at once by the batched methods
+DEFAULT_MEMORY_BUDGET = 64 * 2**20
 
 
 class MamdaniFuzzyEngine(FuzzyEngine):
     """
     Mamdani fuzzy inference engine.
+
+    The batched methods evaluate the rules, aggregate and defuzzify in the floating point type dtype. With np.float32
+    the intermediate arrays take half the memory, so twice as many samples fit in the memory budget and in cache, at
+    the cost of precision: float32 holds about 7 significant digits, so membership values and rule strengths are
+    rounded to about 1e-7, and the sums of the centroid and the cumulative sums of the bisector accumulate rounding
+    errors over the universe of discourse, typically about 1e-6 relative to its width. The bisector and the maximum
+    methods may pick a neighbouring point of the universe when two candidates are that close. The exact
+    defuzzification methods compute the breakpoints in float64 and only their outputs are rounded to float32.
     """
 
     def __init__(
@@ -23,6 +53,7 @@ class MamdaniFuzzyEngine(FuzzyEngine):
         rules: List[FuzzyRule],
         aggregate_operator: TCoNorm,
         defuzz: str = "centroid",
+        dtype: DTypeLike = DEFAULT_DTYPE,
     ):
         """
         Initialises a fuzzy inference engine.
@@ -31,9 +62,15 @@ class MamdaniFuzzyEngine(FuzzyEngine):
             rules (List[FuzzyRule]): List of fuzzy rules
             aggregate_operator (TCoNorm): Operator to aggregate fuzzy rules
             defuzz (Defuzzification): Defuzzification method
+            dtype (DTypeLike, optional): Floating point type of the batched inference, np.float32 or np.float64.
+                Defaults to DEFAULT_DTYPE.
         """
         # Initialize the base class
-        super().__init__(rules=rules)
+        super().__init__(rules=rules, dtype=dtype)
+
+        # Check if the rules are valid
+        if any(isinstance(rule, TSKFuzzyRule) for rule in rules):
+            raise TypeError("The rules of a Mamdani fuzzy inference engine cannot be TSKFuzzyRule.")
 
         # Check if the aggregate operator is valid
         if not isinstance(aggregate_operator, TCoNorm):
@@ -45,6 +82,9 @@ class MamdaniFuzzyEngine(FuzzyEngine):
 
         self.aggregate_operator = aggregate_operator
         self.defuzz = DEFUZZ[defuzz]
+        self.compiled_rule_base = None
+        self.rule_index = None
+        self.profiler = None
 
     def __repr__(self) -> str:
         """
@@ -54,23 +94,111 @@ class MamdaniFuzzyEngine(FuzzyEngine):
         op = self.aggregate_operator
         defuzz = self.defuzz.__name__
 
-        return f"FuzzyEngine(rules={rules}, aggregate_operator={op}, defuzz={defuzz})"
+        return f"FuzzyEngine(rules={rules}, aggregate_operator={op}, defuzz={defuzz}, dtype={self.dtype})"
+
+    def _definition(self) -> tuple:
+        """
+        Returns the objects that define the output of the fuzzy inference engine.
+        """
+        return super()._definition() + (self.aggregate_operator, self.defuzz)
 
     def compose(self, inputs: Union[float, List[float]]) -> MembershipFunction1D:
         """
         Composes the fuzzy inference engine.
 
+        The composed consequent membership function is stored for infer, use evaluate to share the engine between
+        threads.
+
         Args:
             x (Union[float, List[float]]): Crips input values
         """
 
-        # Evaluate the rules
-        clipped_consequent_mfs = [rule.evaluate(inputs) for rule in self.rules]
+        self.composed_consequent_mf = self.evaluate(inputs).composed_mf
+
+        return self.composed_consequent_mf
+
+    def evaluate(
+        self,
+        inputs: Union[float, List[float]],
+        x: Optional[np.ndarray] = None,
+        methods: Sequence[str] = (),
+    ) -> InferenceResult:
+        """
+        Performs fuzzy inference on a crisp input without modifying the engine or its rules.
+
+        The composed consequent membership function is evaluated once over the universe of discourse and the same
+        membership values are handed to every defuzzification method.
+
+        Args:
+            inputs (Union[float, List[float]]): Crisp input values
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable. Defaults to None.
+            methods (Sequence[str], optional): Names of additional defuzzification methods. Defaults to ().
+
+        Returns:
+            InferenceResult: Rule strengths, composed consequent membership function and, with a universe of
+                discourse, defuzzified outputs
+        """
+
+        # Check if the defuzzification methods are valid
+        defuzzifiers = _get_defuzzifiers(methods)
+        _check_universe(x, defuzzifiers)
+
+        profiler = self.profiler
+
+        # Evaluate the rules, only those that can fire with a rule index
+        rule_strengths = np.zeros(len(self.rules))
+        if self.rule_index is None:
+            candidate_rules = range(len(self.rules))
+        else:
+            candidate_rules = self.rule_index.candidate_rules(np.atleast_1d(inputs))
+        for idx in candidate_rules:
+            if profiler is None:
+                rule_strengths[idx] = self.rules[idx].get_firing_strength(inputs)
+            else:
+                start = time.perf_counter()
+                rule_strengths[idx] = self.rules[idx].get_firing_strength(inputs, profiler)
+                profiler.record_rule(idx, time.perf_counter() - start)
+        if profiler is not None:
+            profiler.record_rule_strengths(rule_strengths)
 
         # Aggregate the rules
-        self.composed_consequent_mf = reduce(self.aggregate_operator.combine, clipped_consequent_mfs)
+        with profile_stage(profiler, "implication"):
+            composed_mf = self._compose(rule_strengths)
 
-        return self.composed_consequent_mf
+        # Evaluate the composed consequent membership function once
+        with profile_stage(profiler, "aggregation"):
+            memberships = None if x is None else composed_mf(x)
+
+        # Defuzzify the composed consequent membership function
+        with profile_stage(profiler, "defuzzification"):
+            output = None
+            if x is not None or not self.defuzz.requires_universe:
+                output = _defuzz(self.defuzz, x, composed_mf, memberships)
+            outputs = {method: _defuzz(DEFUZZ[method], x, composed_mf, memberships) for method in methods}
+
+        return InferenceResult(rule_strengths=rule_strengths, composed_mf=composed_mf, output=output, outputs=outputs)
+
+    def _compose(self, rule_strengths: np.ndarray) -> MembershipFunction1D:
+        """
+        Clips the consequent of every rule with its firing strength and aggregates the clipped consequents.
+
+        Args:
+            rule_strengths (np.ndarray): Rule firing strengths of shape (n_rules,)
+
+        Returns:
+            MembershipFunction1D: Composed consequent membership function
+        """
+
+        # A consequent clipped by a T-Norm is zero where its rule does not fire and leaves the aggregate unchanged
+        clipped_consequent_mfs = [
+            rule.clip(strength)
+            for rule, strength in zip(self.rules, rule_strengths)
+            if strength > 0 or not isinstance(rule.implication_operator, TNorm)
+        ]
+        if not clipped_consequent_mfs:
+            clipped_consequent_mfs = [self.rules[0].clip(rule_strengths[0])]
+
+        return self.aggregate_operator.combine_many(clipped_consequent_mfs)
 
     def infer(self, x: np.ndarray) -> np.ndarray:
         """
@@ -88,52 +216,948 @@ class MamdaniFuzzyEngine(FuzzyEngine):
             raise ValueError("The fuzzy inference engine has not been composed yet. Call the compose method first.")
 
         # Defuzzify the composed consequent membership function
-        defuzzified_value = self.defuzz.defuzz(x, self.composed_consequent_mf)
+        with profile_stage(self.profiler, "defuzzification"):
+            defuzzified_value = self.defuzz.defuzz(x, self.composed_consequent_mf)
 
         return defuzzified_value
 
-    def calculate_fuzzy_control_surface(self, antecedent_ranges: List[np.ndarray]) -> np.ndarray:
+    def compile(self, backend: str = "numpy") -> CompiledRuleBase:
         """
-        Calculates the fuzzy control surface of the fuzzy inference engine.
+        Compiles the rules into a flat evaluation plan used by the batched methods.
+
+        The plan is a snapshot of the rules and the aggregate operator, compile again after changing either. The
+        numba backend evaluates the plan with fused kernels, see JITRuleBase, and falls back to the numpy backend with
+        a warning when Numba is not installed or the rules use membership functions or operators without a kernel.
 
         Args:
-            antecedent_ranges (List[np.ndarray]): List of numpy arrays containing the antecedent ranges
+            backend (str, optional): "numpy" or "numba". Defaults to "numpy".
 
         Returns:
-            np.ndarray: Fuzzy control surface
+            CompiledRuleBase: Compiled rule base
+        """
+
+        if backend not in COMPILE_BACKENDS:
+            raise ValueError(f"The backend must be one of {COMPILE_BACKENDS}. Got {backend}.")
+
+        self.compiled_rule_base = None
+        if backend == "numba":
+            if not NUMBA_AVAILABLE:
+                warnings.warn("Numba is not installed, falling back to the numpy backend.", RuntimeWarning)
+            else:
+                try:
+                    self.compiled_rule_base = JITRuleBase(rules=self.rules, aggregate_operator=self.aggregate_operator)
+                except TypeError as error:
+                    warnings.warn(f"{error} Falling back to the numpy backend.", RuntimeWarning)
+
+        if self.compiled_rule_base is None:
+            self.compiled_rule_base = CompiledRuleBase(rules=self.rules, aggregate_operator=self.aggregate_operator)
+
+        return self.compiled_rule_base
+
+    def build_rule_index(self) -> RuleIndex:
+        """
+        Indexes the rules by the supports of their antecedents, so that only the rules that can fire are evaluated.
+
+        evaluate fires the candidate rules of its input, and without a compiled rule base the batched methods fire
+        every rule on the samples for which it is a candidate only, leaving its strength at zero elsewhere. A compiled
+        rule base evaluates every rule with its vectorized tables and does not use the index. The index is a snapshot
+        of the rules, build it again after changing them.
+
+        Returns:
+            RuleIndex: Rule index
+        """
+
+        self.rule_index = RuleIndex(rules=self.rules)
+
+        return self.rule_index
+
+    @contextmanager
+    def profile(self, n_bins: int = DEFAULT_N_BINS) -> Iterator[InferenceProfiler]:
+        """
+        Profiles the inferences of the engine within the context.
+
+        The profiler records the wall time and calls of every stage of the inference pipeline and of every rule, and
+        the firing strength histogram of every rule. Outside of the context the engine is not profiled.
+
+        Args:
+            n_bins (int, optional): Number of bins of the firing strength histograms. Defaults to DEFAULT_N_BINS.
+
+        Returns:
+            Iterator[InferenceProfiler]: Profiler of the inferences within the context
+        """
+
+        profiler = InferenceProfiler(n_rules=len(self.rules), n_bins=n_bins)
+        previous_profiler, self.profiler = self.profiler, profiler
+        try:
+            yield profiler
+        finally:
+            self.profiler = previous_profiler
+
+    def get_rule_strengths(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the firing strength of every rule for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Rule firing strengths of shape (n_samples, n_rules)
+        """
+
+        profiler = self.profiler
+
+        if isinstance(self.compiled_rule_base, JITRuleBase):
+            # The kernel fuzzifies the inputs while firing the rules
+            with profile_stage(profiler, "rule_firing"):
+                rule_strengths = self.compiled_rule_base.get_rule_strengths(inputs)
+        elif self.compiled_rule_base is not None:
+            with profile_stage(profiler, "fuzzification"):
+                antecedent_doms = self.compiled_rule_base.get_antecedent_doms(inputs)
+            with profile_stage(profiler, "rule_firing"):
+                rule_strengths = self.compiled_rule_base.combine_antecedent_doms(antecedent_doms)
+        elif self.rule_index is not None:
+            # Fire every rule on its candidate samples only, it does not fire on the others
+            inputs = as_float_array(inputs)
+            candidates = self.rule_index.candidates(inputs)
+            rule_strengths = np.zeros(candidates.shape, dtype=inputs.dtype)
+            for idx in np.flatnonzero(np.any(candidates, axis=0)):
+                samples = np.flatnonzero(candidates[:, idx])
+                rule_strengths[samples, idx] = self.rules[idx].get_firing_strengths(inputs[samples], profiler)
+        else:
+            rule_strengths = np.stack([rule.get_firing_strengths(inputs, profiler) for rule in self.rules], axis=1)
+
+        if profiler is not None:
+            profiler.record_rule_strengths(rule_strengths)
+
+        return rule_strengths
+
+    def aggregate(self, rule_strengths: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Aggregates the clipped consequents of every rule over the universe of discourse.
+
+        Args:
+            rule_strengths (np.ndarray): Rule firing strengths of shape (n_samples, n_rules)
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+
+        Returns:
+            np.ndarray: Aggregated membership values of shape (n_samples, n_universe)
+        """
+
+        with profile_stage(self.profiler, "aggregation"):
+            if self.compiled_rule_base is not None:
+                return self.compiled_rule_base.aggregate(rule_strengths, x)
+
+            # Clip each consequent and fold it into the aggregate in rule order, as in compose
+            return aggregate_clipped_consequents(
+                rule_strengths,
+                [rule.consequent(x) for rule in self.rules],
+                [type(rule.implication_operator) for rule in self.rules],
+                self.aggregate_operator,
+                support_slices(np.array([rule.consequent.support(0) for rule in self.rules], dtype=np.float64), x),
+            )
+
+    def infer_batch(
+        self, inputs: np.ndarray, x: Optional[np.ndarray] = None, memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ) -> np.ndarray:
+        """
+        Performs fuzzy inference on a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+            x (Optional[np.ndarray], optional): Universe of discourse, not needed by the exact defuzzification
+                methods. Defaults to None.
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+
+        Returns:
+            np.ndarray: Crisp output values of shape (n_samples,)
+        """
+
+        _check_universe(x, [self.defuzz])
+
+        return self._infer_batch(inputs, x, [self.defuzz], memory_budget)[0]
+
+    def infer_batch_many(
+        self,
+        inputs: np.ndarray,
+        x: Optional[np.ndarray],
+        methods: Sequence[str],
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Performs fuzzy inference on a batch of crisp inputs with several defuzzification methods.
+
+        The rules are evaluated and aggregated once, and the same aggregated membership values are handed to every
+        defuzzification method.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+            x (Optional[np.ndarray]): Universe of discourse, not needed by the exact defuzzification methods
+            methods (Sequence[str]): Names of the defuzzification methods
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+
+        Returns:
+            Dict[str, np.ndarray]: Crisp output values of every method, of shape (n_samples,)
+        """
+
+        defuzzifiers = _get_defuzzifiers(methods)
+        _check_universe(x, defuzzifiers)
+
+        return dict(zip(methods, self._infer_batch(inputs, x, defuzzifiers, memory_budget)))
+
+    def _infer_batch(
+        self, inputs: np.ndarray, x: Optional[np.ndarray], defuzzifiers: List[type], memory_budget: int
+    ) -> List[np.ndarray]:
+        """
+        Performs fuzzy inference on a batch of crisp inputs with every defuzzification method.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+            x (Optional[np.ndarray]): Universe of discourse
+            defuzzifiers (List[type]): Defuzzification methods
+            memory_budget (int): Approximate number of bytes of intermediate arrays evaluated at once
+
+        Returns:
+            List[np.ndarray]: Crisp output values of every method, of shape (n_samples,)
         """
 
-        # Create a multi-dimensional meshgrid from the antecedent ranges
-        meshgrid = np.meshgrid(*antecedent_ranges)
+        # Initialize the outputs, every intermediate array is of the floating point type of the engine
+        inputs = np.asarray(inputs, dtype=self.dtype)
+        x = None if x is None else np.asarray(x, dtype=self.dtype)
+        outputs = [np.empty(len(inputs), dtype=self.dtype) for _ in defuzzifiers]
+
+        # Exact defuzzification methods work on the breakpoints of every composed membership function, the other
+        # methods on the aggregated membership values
+        exact = [idx for idx, defuzz in enumerate(defuzzifiers) if not defuzz.requires_universe]
+        sampled = [idx for idx, defuzz in enumerate(defuzzifiers) if defuzz.requires_universe]
+
+        # The JIT kernels aggregate and defuzzify sample by sample
+        fused = isinstance(self.compiled_rule_base, JITRuleBase) and JITRuleBase.supports_defuzz(
+            [defuzzifiers[idx] for idx in sampled]
+        )
+
+        # The aggregated and clipped consequents dominate the memory of a chunk
+        bytes_per_row = (len(self.rules) + (2 * len(x) if sampled and not fused else 0)) * self.dtype.itemsize
 
-        # Flatten the meshgrid for easier iteration
-        flat_meshgrid = [grid.flatten() for grid in meshgrid]
+        for chunk in _iter_chunks(len(inputs), bytes_per_row, memory_budget):
+            # Evaluate the rules
+            rule_strengths = self.get_rule_strengths(inputs[chunk])
 
-        # Calculate the total number of points
-        total_points = len(flat_meshgrid[0])
+            if exact:
+                for row, row_strengths in zip(range(chunk.start, chunk.stop), rule_strengths):
+                    with profile_stage(self.profiler, "implication"):
+                        composed_mf = self._compose(row_strengths)
+                    with profile_stage(self.profiler, "defuzzification"):
+                        for idx in exact:
+                            outputs[idx][row] = defuzzifiers[idx].defuzz(x, composed_mf)
 
-        # Initialize the fuzzy surface
-        outputs = np.zeros(total_points)
+            if sampled and fused:
+                with profile_stage(self.profiler, "defuzzification"):
+                    fused_outputs = self.compiled_rule_base.aggregate_defuzz(
+                        rule_strengths, x, [defuzzifiers[idx] for idx in sampled]
+                    )
+                for idx, output in zip(sampled, fused_outputs):
+                    outputs[idx][chunk] = output
+            elif sampled:
+                # Aggregate the rules
+                aggregated_mf = self.aggregate(rule_strengths, x)
 
-        # Iterate over the flattened meshgrid
-        for idx, point in enumerate(zip(*flat_meshgrid)):
-            # Create a list of coordinates for this point
-            coords = list(point)
+                # Defuzzify every aggregated membership function
+                with profile_stage(self.profiler, "defuzzification"):
+                    for idx in sampled:
+                        outputs[idx][chunk] = defuzzifiers[idx].defuzz_batch(x, aggregated_mf)
 
-            # Compose the engine with the current inputs
-            self.compose(coords)
+        return outputs
 
-            # Get Rule Strength (Degree of Membership) from the rules
-            rule_doms = [np.minimum(*rule.dom) for rule in self.rules]
+    def calculate_fuzzy_control_surface(
+        self,
+        antecedent_ranges: List[np.ndarray],
+        x: Optional[np.ndarray] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        indexing: str = "xy",
+    ) -> np.ndarray:
+        """
+        Calculates the fuzzy control surface of the fuzzy inference engine.
 
-            # Aggregate the rule strengths
-            aggregated_rule_dom = np.maximum(*rule_doms) if len(self.rules) > 1 else rule_doms[0]
+        Without a universe of discourse the surface holds the aggregated rule strength at every grid point, i.e. the
+        maximum over the rules of the minimum degree of membership of their antecedents. With a universe of discourse,
+        or with an exact defuzzification method, the surface holds the defuzzified output of the engine at every grid
+        point.
 
-            # Calculate the output value
-            outputs[idx] = self.defuzz.defuzz(aggregated_rule_dom, self.composed_consequent_mf)
+        Args:
+            antecedent_ranges (List[np.ndarray]): List of numpy arrays containing the antecedent ranges
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable. Defaults to None.
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+            indexing (str, optional): Meshgrid indexing, with "ij" the surface value at index (i, j, ...) is the
+                value at (antecedent_ranges[0][i], antecedent_ranges[1][j], ...). With "xy" the surface keeps its
+                historical shape (len(antecedent_ranges[0]), len(antecedent_ranges[1]), ...) filled in meshgrid
+                order, which only matches np.meshgrid when the first two ranges have the same length; use "ij" for
+                ranges of unequal lengths. Defaults to "xy".
+
+        Returns:
+            np.ndarray: Fuzzy control surface
+        """
+
+        # Flatten the meshgrid of the antecedent ranges into a batch of crisp inputs
+        flat_meshgrid, _ = _flat_meshgrid(antecedent_ranges, indexing)
+
+        if x is not None or not self.defuzz.requires_universe:
+            # Calculate the output value of every grid point
+            outputs = self.infer_batch(flat_meshgrid, x, memory_budget=memory_budget)
+        else:
+            # Initialize the fuzzy surface
+            flat_meshgrid = flat_meshgrid.astype(self.dtype, copy=False)
+            outputs = np.empty(len(flat_meshgrid), dtype=self.dtype)
+
+            n_antecedents = sum(len(rule.antecedents) for rule in self.rules)
+            for chunk in _iter_chunks(len(flat_meshgrid), n_antecedents * self.dtype.itemsize, memory_budget):
+                # Get Rule Strength (Degree of Membership) from the rules
+                rule_doms = [np.min(rule.get_antecedent_doms(flat_meshgrid[chunk]), axis=0) for rule in self.rules]
+
+                # Aggregate the rule strengths
+                outputs[chunk] = np.max(rule_doms, axis=0)
 
         # Reshape the fuzzy surface
         output_shape = tuple(len(range_) for range_ in antecedent_ranges)
         outputs = outputs.reshape(output_shape)
 
         return outputs
+
+
+class TSKFuzzyEngine(FuzzyEngine):
+    """
+    Takagi-Sugeno-Kang fuzzy inference engine.
+
+    The crisp output is the average of the rule consequents weighted by the rule firing strengths, so the engine needs
+    neither a universe of discourse nor a defuzzification method.
+
+    The batched methods compute in the floating point type dtype. With np.float32 the weighted average is accurate to
+    about 1e-6 relative to the largest consequent, see MamdaniFuzzyEngine.
+    """
+
+    def __init__(self, rules: List[TSKFuzzyRule], dtype: DTypeLike = DEFAULT_DTYPE):
+        """
+        Initialises a fuzzy inference engine.
+
+        Args:
+            rules (List[TSKFuzzyRule]): List of TSK fuzzy rules
+            dtype (DTypeLike, optional): Floating point type of the batched inference, np.float32 or np.float64.
+                Defaults to DEFAULT_DTYPE.
+        """
+        # Initialize the base class
+        super().__init__(rules=rules, dtype=dtype)
+
+        # Check if the rules are valid
+        if not all(isinstance(rule, TSKFuzzyRule) for rule in rules):
+            raise TypeError("The rules of a TSK fuzzy inference engine must be TSKFuzzyRule.")
+
+        self.compile()
+
+    def compile(self) -> np.ndarray:
+        """
+        Stacks the consequents of every rule into one coefficient matrix used by the batched methods.
+
+        The matrix is a snapshot of the consequents, built when the engine is initialised, compile again after
+        changing them.
+
+        Returns:
+            np.ndarray: Intercepts and coefficients of shape (n_inputs + 1, n_rules)
+        """
+
+        # Zero and first-order consequents as one (n_inputs + 1, n_rules) coefficient matrix
+        n_inputs = len(self.rules[0].antecedents)
+        self.coefficients = np.array(
+            [
+                [rule.consequent.intercept]
+                + list(np.zeros(n_inputs) if rule.consequent.coefficients is None else rule.consequent.coefficients)
+                for rule in self.rules
+            ],
+            dtype=self.dtype,
+        ).T
+
+        return self.coefficients
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the fuzzy inference engine.
+        """
+        return f"TSKFuzzyEngine(rules={self.rules}, dtype={self.dtype})"
+
+    def compose(self, inputs: Union[float, List[float]]) -> MembershipFunction1D:
+        """
+        Composes the fuzzy inference engine.
+
+        The composed output is a fuzzy singleton at the crisp output, stored for infer. Use evaluate to share the
+        engine between threads.
+
+        Args:
+            inputs (Union[float, List[float]]): Crisp input values
+
+        Returns:
+            MembershipFunction1D: Fuzzy singleton at the crisp output
+        """
+
+        self.composed_consequent_mf = self.evaluate(inputs).composed_mf
+
+        return self.composed_consequent_mf
+
+    def evaluate(
+        self,
+        inputs: Union[float, List[float]],
+        x: Optional[np.ndarray] = None,
+        methods: Sequence[str] = (),
+    ) -> InferenceResult:
+        """
+        Performs fuzzy inference on a crisp input without modifying the engine or its rules.
+
+        Args:
+            inputs (Union[float, List[float]]): Crisp input values
+            x (Optional[np.ndarray], optional): Unused, a TSK engine has no universe of discourse. Defaults to None.
+            methods (Sequence[str], optional): Must be empty, a TSK engine has no defuzzification method.
+                Defaults to ().
+
+        Returns:
+            InferenceResult: Rule strengths, fuzzy singleton at the crisp output and crisp output
+        """
+
+        if methods:
+            raise ValueError("A TSK fuzzy inference engine has no defuzzification methods.")
+
+        # Cast inputs to a batch of one crisp input
+        inputs = np.atleast_1d(np.asarray(inputs, dtype=np.float64))[np.newaxis, :]
+
+        rule_strengths = self.get_rule_strengths(inputs)
+        consequents = np.stack([rule.consequent(inputs) for rule in self.rules], axis=1)
+        output = float(self.weighted_average(rule_strengths, consequents)[0])
+
+        return InferenceResult(
+            rule_strengths=rule_strengths[0], composed_mf=FuzzySingleton(value=output), output=output
+        )
+
+    def infer(self, x: Optional[np.ndarray] = None) -> float:
+        """
+        Returns the crisp output of the last composition.
+
+        Args:
+            x (Optional[np.ndarray], optional): Unused, a TSK engine has no universe of discourse. Defaults to None.
+
+        Returns:
+            float: Crisp output
+        """
+
+        # Check if the composed consequent membership function exists
+        if not hasattr(self, "composed_consequent_mf"):
+            raise ValueError("The fuzzy inference engine has not been composed yet. Call the compose method first.")
+
+        return self.composed_consequent_mf.value
+
+    def get_rule_strengths(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the firing strength of every rule for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Rule firing strengths of shape (n_samples, n_rules)
+        """
+
+        return np.stack([rule.get_firing_strengths(inputs) for rule in self.rules], axis=1)
+
+    def get_consequents(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the consequent of every rule for a batch of crisp inputs with the coefficient matrix of compile.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Consequent values of shape (n_samples, n_rules)
+        """
+
+        return self.coefficients[0] + np.asarray(inputs, dtype=self.dtype) @ self.coefficients[1:]
+
+    @staticmethod
+    def weighted_average(rule_strengths: np.ndarray, consequents: np.ndarray) -> np.ndarray:
+        """
+        Averages the rule consequents weighted by the rule firing strengths.
+
+        Args:
+            rule_strengths (np.ndarray): Rule firing strengths of shape (n_samples, n_rules)
+            consequents (np.ndarray): Consequent values of shape (n_samples, n_rules)
+
+        Returns:
+            np.ndarray: Crisp output values of shape (n_samples,)
+        """
+
+        total_strength = np.sum(rule_strengths, axis=-1)
+
+        # Avoid division by zero
+        if np.any(total_strength == 0):
+            raise ValueError("No rule fires for some inputs, cannot compute the weighted average.")
+
+        return np.sum(rule_strengths * consequents, axis=-1) / total_strength
+
+    def infer_batch(
+        self, inputs: np.ndarray, x: Optional[np.ndarray] = None, memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ) -> np.ndarray:
+        """
+        Performs fuzzy inference on a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+            x (Optional[np.ndarray], optional): Unused, a TSK engine has no universe of discourse. Defaults to None.
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+
+        Returns:
+            np.ndarray: Crisp output values of shape (n_samples,)
+        """
+
+        # Initialize the outputs
+        inputs = np.asarray(inputs, dtype=self.dtype)
+        outputs = np.empty(len(inputs), dtype=self.dtype)
+
+        # The rule strengths and consequents dominate the memory of a chunk
+        bytes_per_row = 3 * len(self.rules) * self.dtype.itemsize
+
+        for chunk in _iter_chunks(len(inputs), bytes_per_row, memory_budget):
+            rule_strengths = self.get_rule_strengths(inputs[chunk])
+            outputs[chunk] = self.weighted_average(rule_strengths, self.get_consequents(inputs[chunk]))
+
+        return outputs
+
+    def calculate_fuzzy_control_surface(
+        self,
+        antecedent_ranges: List[np.ndarray],
+        x: Optional[np.ndarray] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        indexing: str = "xy",
+    ) -> np.ndarray:
+        """
+        Calculates the fuzzy control surface, the crisp output of the fuzzy inference engine at every grid point.
+
+        Args:
+            antecedent_ranges (List[np.ndarray]): List of numpy arrays containing the antecedent ranges
+            x (Optional[np.ndarray], optional): Unused, a TSK engine has no universe of discourse. Defaults to None.
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+            indexing (str, optional): Meshgrid indexing, the surface has the shape of np.meshgrid. With "ij" the
+                surface value at index (i, j, ...) is the value at (antecedent_ranges[0][i], antecedent_ranges[1][j],
+                ...), with "xy" the first two indices are swapped. Defaults to "xy".
+
+        Returns:
+            np.ndarray: Fuzzy control surface
+        """
+
+        flat_meshgrid, shape = _flat_meshgrid(antecedent_ranges, indexing)
+        outputs = self.infer_batch(flat_meshgrid, memory_budget=memory_budget)
+
+        return outputs.reshape(shape)
+
+
+class IT2FuzzyEngine(FuzzyEngine):
+    """
+    Interval type-2 Mamdani fuzzy inference engine.
+
+    The antecedents and consequents of the rules are interval type-2 membership functions, so every rule fires with an
+    interval of strengths whose lower and upper bounds clip the lower and upper consequents. The type-reduced set of
+    the output is an interval computed with the Karnik-Mendel algorithm for a whole batch of inputs at once, and the
+    crisp output is its midpoint.
+
+    - centroid: centroid of the aggregated interval type-2 output over the universe of discourse
+    - center_of_sets: average of the centroids of the consequents weighted by the rule firing intervals, which only
+      aggregates the rules and not the universe of discourse
+    """
+
+    def __init__(self, rules: List[FuzzyRule], aggregate_operator: TCoNorm, type_reduction: str = "centroid"):
+        """
+        Initialises a fuzzy inference engine.
+
+        Args:
+            rules (List[FuzzyRule]): List of fuzzy rules with IntervalType2MF antecedents and consequents
+            aggregate_operator (TCoNorm): Operator to aggregate fuzzy rules
+            type_reduction (str, optional): Type reduction method, "centroid" or "center_of_sets".
+                Defaults to "centroid".
+        """
+        # Initialize the base class
+        super().__init__(rules=rules)
+
+        # Check if the rules are valid
+        if any(isinstance(rule, TSKFuzzyRule) for rule in rules):
+            raise TypeError("The rules of an IT2 fuzzy inference engine cannot be TSKFuzzyRule.")
+        for rule in rules:
+            if not all(isinstance(mf, IntervalType2MF) for mf in rule.antecedents + [rule.consequent]):
+                raise TypeError(
+                    "The antecedents and consequents of an IT2 fuzzy inference engine must be IntervalType2MF."
+                )
+
+        # Check if the aggregate operator is valid
+        if not isinstance(aggregate_operator, TCoNorm):
+            raise TypeError(f"The aggregate operator must be a TCoNorm. Got {type(aggregate_operator)}.")
+
+        # Check if the type reduction method is valid
+        if type_reduction not in TYPE_REDUCTIONS:
+            raise ValueError(f"The type reduction method is not valid. Got {type_reduction}.")
+
+        self.aggregate_operator = aggregate_operator
+        self.type_reduction = type_reduction
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the fuzzy inference engine.
+        """
+        return (
+            f"IT2FuzzyEngine(rules={self.rules}, aggregate_operator={self.aggregate_operator}, "
+            f"type_reduction={self.type_reduction})"
+        )
+
+    def _definition(self) -> tuple:
+        """
+        Returns the objects that define the output of the fuzzy inference engine.
+        """
+        return super()._definition() + (self.aggregate_operator, self.type_reduction)
+
+    def compose(self, inputs: Union[float, List[float]]) -> IntervalType2MF:
+        """
+        Composes the fuzzy inference engine.
+
+        The composed consequent membership function and the rule firing intervals are stored for infer, use evaluate
+        to share the engine between threads.
+
+        Args:
+            inputs (Union[float, List[float]]): Crisp input values
+
+        Returns:
+            IntervalType2MF: Composed consequent membership function
+        """
+
+        result = self.evaluate(inputs)
+        self.composed_consequent_mf = result.composed_mf
+        self.composed_rule_strengths = result.rule_strengths
+
+        return self.composed_consequent_mf
+
+    def evaluate(
+        self,
+        inputs: Union[float, List[float]],
+        x: Optional[np.ndarray] = None,
+        methods: Sequence[str] = (),
+    ) -> InferenceResult:
+        """
+        Performs fuzzy inference on a crisp input without modifying the engine or its rules.
+
+        Args:
+            inputs (Union[float, List[float]]): Crisp input values
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable. Defaults to None.
+            methods (Sequence[str], optional): Must be empty, an IT2 engine has no defuzzification method.
+                Defaults to ().
+
+        Returns:
+            InferenceResult: Lower and upper rule strengths of shape (2, n_rules), composed consequent membership
+                function and, with a universe of discourse, crisp output
+        """
+
+        if methods:
+            raise ValueError("An IT2 fuzzy inference engine has no defuzzification methods.")
+
+        # Cast inputs to a batch of one crisp input
+        inputs = np.atleast_1d(np.asarray(inputs, dtype=np.float64))[np.newaxis, :]
+        rule_strengths = self.get_rule_strengths(inputs)
+
+        # Clip the lower and upper consequents with the lower and upper rule strengths
+        composed_mf = IntervalType2MF(
+            lower=self._compose([rule.consequent.lower for rule in self.rules], rule_strengths[0, 0]),
+            upper=self._compose([rule.consequent.upper for rule in self.rules], rule_strengths[1, 0]),
+        )
+
+        output = None if x is None else float(np.mean(self.type_reduce(rule_strengths, x), axis=0)[0])
+
+        return InferenceResult(rule_strengths=rule_strengths[:, 0], composed_mf=composed_mf, output=output)
+
+    def _compose(self, consequents: List[MembershipFunction1D], rule_strengths: np.ndarray) -> MembershipFunction1D:
+        """
+        Clips type-1 consequents with rule firing strengths and aggregates the clipped consequents.
+
+        Args:
+            consequents (List[MembershipFunction1D]): Lower or upper consequent of every rule
+            rule_strengths (np.ndarray): Lower or upper rule firing strengths of shape (n_rules,)
+
+        Returns:
+            MembershipFunction1D: Lower or upper composed consequent membership function
+        """
+
+        # A consequent clipped by a T-Norm is zero where its rule does not fire and leaves the aggregate unchanged
+        clipped_consequent_mfs = [
+            rule.implication_operator.combine(ConstantMF(value=strength), consequent)
+            for rule, consequent, strength in zip(self.rules, consequents, rule_strengths.tolist())
+            if strength > 0 or not isinstance(rule.implication_operator, TNorm)
+        ]
+        if not clipped_consequent_mfs:
+            clipped_consequent_mfs = [self.rules[0].implication_operator.combine(ConstantMF(value=0.0), consequents[0])]
+
+        return self.aggregate_operator.combine_many(clipped_consequent_mfs)
+
+    def infer(self, x: np.ndarray) -> float:
+        """
+        Performs fuzzy inference.
+
+        Args:
+            x (np.ndarray): Universe of discourse
+
+        Returns:
+            float: Crisp output value, the midpoint of the type-reduced set
+        """
+
+        # Check if the composed consequent membership function exists
+        if not hasattr(self, "composed_consequent_mf"):
+            raise ValueError("The fuzzy inference engine has not been composed yet. Call the compose method first.")
+
+        return float(np.mean(self.type_reduce(self.composed_rule_strengths[:, np.newaxis], x), axis=0)[0])
+
+    def get_rule_strengths(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the lower and upper firing strength of every rule for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Lower and upper rule firing strengths of shape (2, n_samples, n_rules)
+        """
+
+        return np.stack([rule.get_firing_strengths(inputs) for rule in self.rules], axis=-1)
+
+    def aggregate(self, rule_strengths: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Aggregates the clipped lower and upper consequents of every rule over the universe of discourse.
+
+        Args:
+            rule_strengths (np.ndarray): Lower and upper rule firing strengths of shape (2, n_samples, n_rules)
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+
+        Returns:
+            np.ndarray: Lower and upper aggregated membership values of shape (2, n_samples, n_universe)
+        """
+
+        x = np.asarray(x, dtype=np.float64)
+        consequents = [rule.consequent(x) for rule in self.rules]
+        slices = support_slices(np.array([rule.consequent.support(0) for rule in self.rules], dtype=np.float64), x)
+        implication_operators = [type(rule.implication_operator) for rule in self.rules]
+
+        return np.stack(
+            [
+                aggregate_clipped_consequents(
+                    rule_strengths[bound],
+                    [consequent[bound] for consequent in consequents],
+                    implication_operators,
+                    self.aggregate_operator,
+                    slices,
+                )
+                for bound in range(2)
+            ]
+        )
+
+    def type_reduce(self, rule_strengths: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Calculates the type-reduced set of the output for a batch of rule firing intervals.
+
+        Args:
+            rule_strengths (np.ndarray): Lower and upper rule firing strengths of shape (2, n_samples, n_rules)
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+
+        Returns:
+            np.ndarray: Left and right ends of the type-reduced sets of shape (2, n_samples)
+        """
+
+        x = np.asarray(x, dtype=np.float64)
+
+        if self.type_reduction == "centroid":
+            aggregated_mf = self.aggregate(rule_strengths, x)
+            return np.stack(karnik_mendel(x, aggregated_mf[0], aggregated_mf[1]))
+
+        # Weight the left and right ends of the centroids of the consequents by the rule firing intervals
+        consequents = np.stack([rule.consequent(x) for rule in self.rules], axis=1)
+        left_centroids, right_centroids = karnik_mendel(x, consequents[0], consequents[1])
+
+        return np.stack(
+            [
+                karnik_mendel_left(left_centroids, rule_strengths[0], rule_strengths[1]),
+                karnik_mendel_right(right_centroids, rule_strengths[0], rule_strengths[1]),
+            ]
+        )
+
+    def infer_interval_batch(
+        self, inputs: np.ndarray, x: np.ndarray, memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ) -> np.ndarray:
+        """
+        Calculates the type-reduced set of the output for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+            x (np.ndarray): Universe of discourse
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+
+        Returns:
+            np.ndarray: Left and right ends of the type-reduced sets of shape (n_samples, 2)
+        """
+
+        if x is None:
+            raise ValueError("The type reduction of an IT2 fuzzy inference engine requires a universe of discourse.")
+
+        # Initialize the outputs
+        inputs = np.asarray(inputs, dtype=np.float64)
+        outputs = np.empty((len(inputs), 2))
+
+        # The lower and upper aggregated consequents dominate the memory of a chunk
+        n_universe = len(x) if self.type_reduction == "centroid" else 0
+        bytes_per_row = 2 * (len(self.rules) + 2 * n_universe) * np.float64().itemsize
+
+        for chunk in _iter_chunks(len(inputs), bytes_per_row, memory_budget):
+            outputs[chunk] = self.type_reduce(self.get_rule_strengths(inputs[chunk]), x).T
+
+        return outputs
+
+    def infer_batch(
+        self, inputs: np.ndarray, x: Optional[np.ndarray] = None, memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ) -> np.ndarray:
+        """
+        Performs fuzzy inference on a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+            x (Optional[np.ndarray], optional): Universe of discourse, required by the type reduction.
+                Defaults to None.
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+
+        Returns:
+            np.ndarray: Crisp output values of shape (n_samples,), the midpoints of the type-reduced sets
+        """
+
+        return np.mean(self.infer_interval_batch(inputs, x, memory_budget=memory_budget), axis=1)
+
+    def calculate_fuzzy_control_surface(
+        self,
+        antecedent_ranges: List[np.ndarray],
+        x: Optional[np.ndarray] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        indexing: str = "xy",
+    ) -> np.ndarray:
+        """
+        Calculates the fuzzy control surface, the crisp output of the fuzzy inference engine at every grid point.
+
+        Args:
+            antecedent_ranges (List[np.ndarray]): List of numpy arrays containing the antecedent ranges
+            x (Optional[np.ndarray], optional): Universe of discourse, required by the type reduction.
+                Defaults to None.
+            memory_budget (int, optional): Approximate number of bytes of intermediate arrays evaluated at once.
+                Defaults to DEFAULT_MEMORY_BUDGET.
+            indexing (str, optional): Meshgrid indexing, the surface has the shape of np.meshgrid. With "ij" the
+                surface value at index (i, j, ...) is the value at (antecedent_ranges[0][i], antecedent_ranges[1][j],
+                ...), with "xy" the first two indices are swapped. Defaults to "xy".
+
+        Returns:
+            np.ndarray: Fuzzy control surface
+        """
+
+        flat_meshgrid, shape = _flat_meshgrid(antecedent_ranges, indexing)
+        outputs = self.infer_batch(flat_meshgrid, x, memory_budget=memory_budget)
+
+        return outputs.reshape(shape)
+
+
+def _flat_meshgrid(antecedent_ranges: List[np.ndarray], indexing: str) -> Tuple[np.ndarray, Tuple[int, ...]]:
+    """
+    Flattens the meshgrid of the antecedent ranges into a batch of crisp inputs.
+
+    Args:
+        antecedent_ranges (List[np.ndarray]): List of numpy arrays containing the antecedent ranges
+        indexing (str): Meshgrid indexing
+
+    Returns:
+        Tuple[np.ndarray, Tuple[int, ...]]: Crisp inputs of shape (n_grid_points, n_inputs) and the shape of the
+            meshgrid, in which the grid points are ordered
+    """
+
+    # Create a multi-dimensional meshgrid from the antecedent ranges
+    meshgrid = np.meshgrid(*antecedent_ranges, indexing=indexing)
+
+    return np.stack([grid.ravel() for grid in meshgrid], axis=1), meshgrid[0].shape
+
+
+def _iter_chunks(n_rows: int, bytes_per_row: int, memory_budget: int) -> Iterator[slice]:
+    """
+    Splits a number of rows into chunks that fit the memory budget.
+
+    Args:
+        n_rows (int): Number of rows
+        bytes_per_row (int): Approximate number of bytes of intermediate arrays per row
+        memory_budget (int): Approximate number of bytes of intermediate arrays per chunk
+
+    Yields:
+        slice: Rows of the chunk
+    """
+
+    chunk_size = max(1, memory_budget // max(1, bytes_per_row))
+
+    for start in range(0, n_rows, chunk_size):
+        yield slice(start, min(start + chunk_size, n_rows))
+
+
+def _get_defuzzifiers(methods: Sequence[str]) -> List[type]:
+    """
+    Looks up defuzzification methods by name.
+
+    Args:
+        methods (Sequence[str]): Names of the defuzzification methods
+
+    Returns:
+        List[type]: Defuzzification methods
+    """
+
+    # Check if the defuzzification methods are valid
+    for method in methods:
+        if method not in DEFUZZ:
+            raise ValueError(f"The defuzzification method is not valid. Got {method}.")
+
+    return [DEFUZZ[method] for method in methods]
+
+
+def _check_universe(x: Optional[np.ndarray], defuzzifiers: List[type]):
+    """
+    Checks that a universe of discourse is given to the defuzzification methods that sample it.
+
+    Args:
+        x (Optional[np.ndarray]): Universe of discourse
+        defuzzifiers (List[type]): Defuzzification methods
+    """
+
+    for defuzz in defuzzifiers:
+        if x is None and defuzz.requires_universe:
+            raise ValueError(f"The {defuzz.__name__} defuzzification method requires a universe of discourse.")
+
+
+def _defuzz(
+    defuzz: type, x: Optional[np.ndarray], mf: MembershipFunction1D, memberships: Optional[np.ndarray]
+) -> float:
+    """
+    Defuzzifies a membership function, reusing its membership values over the universe of discourse.
+
+    Args:
+        defuzz (type): Defuzzification method
+        x (Optional[np.ndarray]): Universe of discourse
+        mf (MembershipFunction1D): Membership function
+        memberships (Optional[np.ndarray]): Membership values of mf over the universe of discourse
+
+    Returns:
+        float: Defuzzified value
+    """
+
+    if not defuzz.requires_universe:
+        return defuzz.defuzz(x, mf)
+
+    return defuzz.defuzz_memberships(x, memberships)
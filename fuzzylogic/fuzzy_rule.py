@@ -1,11 +1,21 @@
 # standard libraries
-from typing import List, Optional, Union
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Union
+
+# third party libraries
+import numpy as np
 
 # fuzzy logic libraries
+from fuzzylogic.core.dtype import as_float_array, result_dtype
 from fuzzylogic.core.mf import MembershipFunction1D
 from fuzzylogic.core.tconorm import TCoNorm
 from fuzzylogic.core.tnorm import TNorm
 from fuzzylogic.mf import ConstantMF, FuzzySingleton
+from fuzzylogic.profiling import InferenceProfiler, profile_stage
+from fuzzylogic.tnorms import AlgebraicProductTNorm, MinimumTNorm
+
+# T-Norms for which the degree of membership of a fuzzy singleton input is the antecedent membership at the input
+SINGLETON_TNORMS = (MinimumTNorm, AlgebraicProductTNorm)
 
 
 class FuzzyRule:
@@ -48,9 +58,8 @@ class FuzzyRule:
         if len(operators) != len(antecedents) - 1:
             raise ValueError(f"Expected operators to have length {len(antecedents) - 1}, but got {len(operators)}")
 
-        # Check if consequent is valid
-        if not isinstance(consequent, MembershipFunction1D):
-            raise TypeError(f"Expected consequent to be a MembershipFunction1D, but got {type(consequent)}")
+        # Check if consequent and implication operator are valid
+        self._check_consequent(consequent, implication_operator)
 
         # Check if Degree of Membership operator is valid
         if not isinstance(dom_operator, TNorm):
@@ -64,10 +73,6 @@ class FuzzyRule:
         if not isinstance(tconorm, TCoNorm):
             raise TypeError(f"Expected tconorm to be a TCoNorm, but got {type(tconorm)}")
 
-        # Check if operator is valid
-        if not isinstance(implication_operator, TNorm) and not isinstance(implication_operator, TCoNorm):
-            raise TypeError(f"Expected operator to be a TNorm or TConorm, but got {type(implication_operator)}")
-
         # Check if mf_names is valid
         if mf_names is not None:
             if not isinstance(mf_names, list):
@@ -86,6 +91,24 @@ class FuzzyRule:
         self.implication_operator = implication_operator
         self.mf_names = mf_names
 
+    @staticmethod
+    def _check_consequent(consequent: MembershipFunction1D, implication_operator: Union[TNorm, TCoNorm]):
+        """
+        Check the consequent and the implication operator of the rule.
+
+        Args:
+            consequent (MembershipFunction1D): consequent of the rule
+            implication_operator (Union[TNorm, TCoNorm]): operator to calculate the qualified consequent
+        """
+
+        # Check if consequent is valid
+        if not isinstance(consequent, MembershipFunction1D):
+            raise TypeError(f"Expected consequent to be a MembershipFunction1D, but got {type(consequent)}")
+
+        # Check if operator is valid
+        if not isinstance(implication_operator, TNorm) and not isinstance(implication_operator, TCoNorm):
+            raise TypeError(f"Expected operator to be a TNorm or TConorm, but got {type(implication_operator)}")
+
     def __repr__(self):
         # Handling the case when there are no antecedents or just one
         if not self.antecedents:
@@ -111,6 +134,8 @@ class FuzzyRule:
         """
         Evaluate the rule.
 
+        The rule is not modified, so that it can be evaluated concurrently.
+
         Args:
             x (Union[float, List[float]]): Crisp input
 
@@ -118,59 +143,121 @@ class FuzzyRule:
             MembershipFunction1D: Clipped consequent
         """
 
-        # Get the degree of membership of the antecedents
-        self.dom = self.get_rule_strength(x)
+        return self.clip(self.get_firing_strength(x))
 
-        # Cast antecedent_dom to MembershipFunction1D
-        antecedent_dom_mfs = [ConstantMF(value=antecedent_dom_i) for antecedent_dom_i in self.dom]
+    def clip(self, firing_strength: float) -> MembershipFunction1D:
+        """
+        Clip the consequent with the rule firing strength.
 
-        # Rule firing strength - using reduce to successively combine all membership functions
-        rule_firing_strength_mf = self._calculate_rule_firing_strength(antecedent_dom_mfs)
+        Args:
+            firing_strength (float): Rule firing strength
 
-        # Clip consequent using implication operator
-        clipped_consequent_mf = self.implication_operator.combine(rule_firing_strength_mf, self.consequent)
+        Returns:
+            MembershipFunction1D: Clipped consequent
+        """
 
-        return clipped_consequent_mf
+        return self.implication_operator.combine(ConstantMF(value=firing_strength), self.consequent)
 
-    def _calculate_rule_firing_strength(self, antecedent_dom_mfs: List[MembershipFunction1D]) -> MembershipFunction1D:
+    def get_firing_strength(self, x: Union[float, List[float]], profiler: Optional[InferenceProfiler] = None) -> float:
         """
-        Calculate the rule firing strength.
+        Get the rule firing strength for a crisp input.
 
         Args:
-            antecedent_dom_mfs (List[MembershipFunction1D]): List of antecedent degree of membership
-                membership functions
+            x (Union[float, List[float]]): Crisp input
+            profiler (Optional[InferenceProfiler], optional): Profiler timing the fuzzification and rule firing.
+                Defaults to None.
 
         Returns:
-            MembershipFunction1D: Combined Antecedent Membership Function
+            float: Rule firing strength
+        """
+
+        # Degree of membership of antecedents
+        with profile_stage(profiler, "fuzzification"):
+            antecedent_dom = [as_float_array(antecedent_dom_i) for antecedent_dom_i in self.get_rule_strength(x)]
+
+        with profile_stage(profiler, "rule_firing"):
+            return float(self._combine_antecedent_doms(antecedent_dom))
+
+    def _combine_antecedent_doms(self, antecedent_dom: List[np.ndarray]) -> np.ndarray:
         """
+        Combine the degrees of membership of the antecedents into the rule firing strength.
+
+        Args:
+            antecedent_dom (List[np.ndarray]): Degree of membership of each antecedent
+
+        Returns:
+            np.ndarray: Rule firing strength
+        """
+
+        # Antecedents combined by one operator are reduced in one pass
+        if self.operators and all(operator == "and" for operator in self.operators):
+            return self.tnorm_operator.apply_many(np.stack(antecedent_dom))
+        if self.operators and all(operator == "or" for operator in self.operators):
+            return self.tconorm_operator.apply_many(np.stack(antecedent_dom))
 
         # start with first antecedent
-        rule_firing_strength_mf = antecedent_dom_mfs[0]
+        rule_firing_strength = antecedent_dom[0]
 
         # combine all antecedents
         for idx, operator in enumerate(self.operators):
             if operator == "and":
-                rule_firing_strength_mf = self.tnorm_operator.combine(
-                    rule_firing_strength_mf, antecedent_dom_mfs[idx + 1]
-                )
+                rule_firing_strength = self.tnorm_operator.apply(rule_firing_strength, antecedent_dom[idx + 1])
             elif operator == "or":
-                rule_firing_strength_mf = self.tconorm_operator.combine(
-                    rule_firing_strength_mf, antecedent_dom_mfs[idx + 1]
-                )
+                rule_firing_strength = self.tconorm_operator.apply(rule_firing_strength, antecedent_dom[idx + 1])
             else:
                 raise ValueError(f"Expected operator to be 'and' or 'or', but got {operator} at index {idx}")
 
-        return rule_firing_strength_mf
+        return rule_firing_strength
 
-    def get_rule_strength(self, x: Union[float, List[float]]) -> MembershipFunction1D:
+    def get_antecedent_doms(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Get the degree of membership of the antecedents for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp inputs of shape (n_samples, n_antecedents)
+
+        Returns:
+            np.ndarray: Degrees of membership of shape (n_antecedents, n_samples)
+        """
+
+        # Assert inputs is a batch of crisp inputs
+        inputs = as_float_array(inputs)
+        if inputs.ndim != 2 or inputs.shape[1] != len(self.antecedents):
+            raise ValueError(
+                f"Expected inputs to have shape (n_samples, {len(self.antecedents)}), but got {inputs.shape}"
+            )
+
+        return np.stack(self.get_rule_strength(list(inputs.T)))
+
+    def get_firing_strengths(self, inputs: np.ndarray, profiler: Optional[InferenceProfiler] = None) -> np.ndarray:
+        """
+        Get the rule firing strength for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp inputs of shape (n_samples, n_antecedents)
+            profiler (Optional[InferenceProfiler], optional): Profiler timing the fuzzification and rule firing.
+                Defaults to None.
+
+        Returns:
+            np.ndarray: Rule firing strengths of shape (n_samples,)
+        """
+
+        # Degree of membership of antecedents
+        with profile_stage(profiler, "fuzzification"):
+            antecedent_dom = self.get_antecedent_doms(inputs)
+
+        with profile_stage(profiler, "rule_firing"):
+            return self._combine_antecedent_doms(list(antecedent_dom))
+
+    def get_rule_strength(self, x: Union[float, List[float], List[np.ndarray]]) -> List[np.ndarray]:
         """
         Get the rule strength aka the degree of membership of the antecedents.
 
         Args:
-            x (Union[float, List[float]]): Crisp input
+            x (Union[float, List[float], List[np.ndarray]]): Crisp input, or a vector of crisp inputs per antecedent
 
         Returns:
-            MembershipFunction1D: Clipped consequent
+            List[np.ndarray]: Degree of membership of each antecedent
         """
 
         # Cast x to list if it is a float
@@ -181,6 +268,18 @@ class FuzzyRule:
         if len(x) != len(self.antecedents):
             raise ValueError(f"Expected x to have length {len(self.antecedents)}, but got {len(x)}")
 
+        # A fuzzy singleton is one at its crisp value and zero elsewhere, combined with an antecedent by the minimum or
+        # the algebraic product it yields the antecedent membership at the crisp value
+        if type(self.dom_operator) in SINGLETON_TNORMS:
+            return [antecedent(x_i) for antecedent, x_i in zip(self.antecedents, x)]
+
+        # Vectors of crisp inputs are fuzzified all at once
+        if any(np.ndim(x_i) > 0 for x_i in x):
+            return [
+                self.dom_operator.apply(np.ones_like(x_i, dtype=result_dtype(x_i)), antecedent(x_i))
+                for antecedent, x_i in zip(self.antecedents, x)
+            ]
+
         # Fuzzify Crisp input
         fuzzy_x = [FuzzySingleton(value=x_i) for x_i in x]
 
@@ -191,3 +290,99 @@ class FuzzyRule:
         ]
 
         return antecedent_dom
+
+
+@dataclass
+class TSKConsequent:
+    """
+    Consequent of a Takagi-Sugeno-Kang fuzzy rule, a linear function of the crisp inputs.
+
+    Without coefficients the consequent is the constant intercept of a zero-order rule, with one coefficient per
+    input it is the linear function of a first-order rule.
+    """
+
+    intercept: float
+    coefficients: Optional[Sequence[float]] = None
+
+    def __call__(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the consequent for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp inputs of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Consequent values of shape (n_samples,)
+        """
+
+        # The consequent values keep the floating point type of the inputs
+        inputs = as_float_array(inputs)
+        if self.coefficients is None:
+            return np.full(len(inputs), self.intercept, dtype=inputs.dtype)
+
+        return inputs @ np.asarray(self.coefficients, dtype=inputs.dtype) + inputs.dtype.type(self.intercept)
+
+
+class TSKFuzzyRule(FuzzyRule):
+    """
+    Takagi-Sugeno-Kang fuzzy rule class
+    """
+
+    def __init__(
+        self,
+        antecedents: List[MembershipFunction1D],
+        operators: List[str],
+        consequent: TSKConsequent,
+        dom_operator: TNorm,
+        tnorm: TNorm,
+        tconorm: TCoNorm,
+        mf_names: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            antecedents (List[MembershipFunction1D]): antecedents of the rule
+            operators (List[str]): operators to combine the antecedents
+            consequent (TSKConsequent): consequent of the rule
+            dom_operator (TNorm): operator to calculate the degree of membership of the antecedents
+            tnorm (TNorm): operator to calculate the degree of membership of the consequent aka the AND operator
+            tconorm (TCoNorm): operator to calculate the degree of membership of the consequent aka the OR operator
+            mf_names (Optional[List[str]], optional): names of the antecedents and consequent. Defaults to None.
+        """
+
+        super().__init__(
+            antecedents=antecedents,
+            operators=operators,
+            consequent=consequent,
+            dom_operator=dom_operator,
+            tnorm=tnorm,
+            tconorm=tconorm,
+            implication_operator=None,
+            mf_names=mf_names,
+        )
+
+        # Check if consequent matches the antecedents
+        if consequent.coefficients is not None and len(consequent.coefficients) != len(antecedents):
+            raise ValueError(
+                f"Expected consequent to have {len(antecedents)} coefficients, but got {len(consequent.coefficients)}"
+            )
+
+    @staticmethod
+    def _check_consequent(consequent: TSKConsequent, implication_operator: None):
+        """
+        Check the consequent of the rule, a TSK rule has no implication operator.
+
+        Args:
+            consequent (TSKConsequent): consequent of the rule
+            implication_operator (None): unused
+        """
+
+        # Check if consequent is valid
+        if not isinstance(consequent, TSKConsequent):
+            raise TypeError(f"Expected consequent to be a TSKConsequent, but got {type(consequent)}")
+
+    def clip(self, firing_strength: float) -> MembershipFunction1D:
+        """
+        A TSK rule has no consequent membership function to clip.
+        """
+
+        raise TypeError("A TSK rule has no consequent membership function, use TSKFuzzyEngine to evaluate it.")
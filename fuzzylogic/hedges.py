@@ -1,9 +1,13 @@
+# standard libraries
+from typing import Tuple
+
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
 from fuzzylogic.core.hedge import Hedge
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import EMPTY, UNBOUNDED, MembershipFunction1D
+from fuzzylogic.mf.composite import TransformedMF
 
 
 class Not(Hedge):
@@ -17,18 +21,43 @@ class Not(Hedge):
         Transforms the membership function.
         """
 
-        class ComplimentedMF(MembershipFunction1D):
-            """
-            Complimented membership function.
-            """
+        return TransformedMF(hedge=cls, mf=mf)
+
+    @classmethod
+    def apply(cls, u: np.ndarray) -> np.ndarray:
+        """
+        Complements the membership values.
+        """
+
+        return 1 - u
+
+    @classmethod
+    def transform_support(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Bounds the complement of the core.
+        """
+
+        if core[0] > core[1] or (core[0] > -np.inf and core[1] < np.inf):
+            return UNBOUNDED
+        if core == UNBOUNDED:
+            return EMPTY
+
+        return (core[1], np.inf) if core[0] == -np.inf else (-np.inf, core[0])
+
+    @classmethod
+    def transform_core(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Bounds the complement of the support from within.
+        """
+
+        if support[0] > support[1]:
+            return UNBOUNDED
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function at x.
-                """
-                return 1 - mf(x)
+        # The complement of a closed support is open, so its closure is shrunk by one ulp
+        left = (-np.inf, np.nextafter(support[0], -np.inf)) if support[0] > -np.inf else EMPTY
+        right = (np.nextafter(support[1], np.inf), np.inf) if support[1] < np.inf else EMPTY
 
-        return ComplimentedMF()
+        return max(left, right, key=lambda interval: interval[1] - interval[0])
 
 
 class Con(Hedge):
@@ -42,18 +71,31 @@ class Con(Hedge):
         Transforms the membership function.
         """
 
-        class ConcentratedMF(MembershipFunction1D):
-            """
-            Concentrated membership function.
-            """
+        return TransformedMF(hedge=cls, mf=mf)
+
+    @classmethod
+    def apply(cls, u: np.ndarray) -> np.ndarray:
+        """
+        Concentrates the membership values.
+        """
+
+        return u**2
+
+    @classmethod
+    def transform_support(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the support, as the hedge maps zero to zero only.
+        """
+
+        return support
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function at x.
-                """
-                return mf(x) ** 2
+    @classmethod
+    def transform_core(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the core, as the hedge maps one to one only.
+        """
 
-        return ConcentratedMF()
+        return core
 
 
 class Dil(Hedge):
@@ -67,18 +109,39 @@ class Dil(Hedge):
         Transforms the membership function.
         """
 
-        class DilatedMF(MembershipFunction1D):
-            """
-            Dilated membership function.
-            """
+        return TransformedMF(hedge=cls, mf=mf)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function at x.
-                """
-                return np.sqrt(mf(x))
+    @classmethod
+    def apply(cls, u: np.ndarray) -> np.ndarray:
+        """
+        Dilates the membership values.
+        """
 
-        return DilatedMF()
+        return np.sqrt(u)
+
+    @classmethod
+    def support_tolerance(cls, tolerance: float) -> float:
+        """
+        Membership values below tolerance ** 2 dilate to values below tolerance.
+        """
+
+        return tolerance**2
+
+    @classmethod
+    def transform_support(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the support, as the hedge maps zero to zero only.
+        """
+
+        return support
+
+    @classmethod
+    def transform_core(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the core, as the hedge maps one to one only.
+        """
+
+        return core
 
 
 class Int(Hedge):
@@ -92,20 +155,31 @@ class Int(Hedge):
         Transforms the membership function.
         """
 
-        class IntensifiedMF(MembershipFunction1D):
-            """
-            Intensified membership function.
-            """
+        return TransformedMF(hedge=cls, mf=mf)
+
+    @classmethod
+    def apply(cls, u: np.ndarray) -> np.ndarray:
+        """
+        Intensifies the membership values.
+        """
+
+        return np.where(u < 0.5, 2 * u**2, 1 - 2 * (1 - u) ** 2)
+
+    @classmethod
+    def transform_support(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the support, as the hedge maps zero to zero only.
+        """
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function at x.
-                """
-                u = mf(x)
-                result = np.where(u < 0.5, 2 * u**2, 1 - 2 * (1 - u) ** 2)
-                return result
+        return support
 
-        return IntensifiedMF()
+    @classmethod
+    def transform_core(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the core, as the hedge maps one to one only.
+        """
+
+        return core
 
 
 class Dim(Hedge):
@@ -119,17 +193,36 @@ class Dim(Hedge):
         Transforms the membership function.
         """
 
-        class DiminishedMF(MembershipFunction1D):
-            """
-            Diminished membership function.
-            """
+        return TransformedMF(hedge=cls, mf=mf)
+
+    @classmethod
+    def apply(cls, u: np.ndarray) -> np.ndarray:
+        """
+        Diminishes the membership values.
+        """
+
+        return np.where(u < 0.5, 0.5 * u**0.5, 1 - 0.5 * (1 - u) ** 0.5)
+
+    @classmethod
+    def support_tolerance(cls, tolerance: float) -> float:
+        """
+        Membership values below (2 * tolerance) ** 2 diminish to values below tolerance.
+        """
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function at x.
-                """
-                u = mf(x)
-                result = np.where(u < 0.5, 0.5 * u**0.5, 1 - 0.5 * (1 - u) ** 0.5)
-                return result
+        return (2 * tolerance) ** 2
+
+    @classmethod
+    def transform_support(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the support, as the hedge maps zero to zero only.
+        """
+
+        return support
+
+    @classmethod
+    def transform_core(cls, support: Tuple[float, float], core: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Keeps the core, as the hedge maps one to one only.
+        """
 
-        return DiminishedMF()
+        return core
@@ -0,0 +1,577 @@
+# standard libraries
+from dataclasses import fields
+from typing import Callable, List, Tuple
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import as_float_array
+from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.tconorm import TCoNorm
+from fuzzylogic.core.tnorm import TNorm
+from fuzzylogic.defuzz import Bisector, Centroid, LargestOfMaximum, MeanOfMaximum, SmallestOfMaximum
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.hedges import Con, Dil, Dim, Int, Not
+from fuzzylogic.mf.bank import BankedMF
+from fuzzylogic.mf.bell import Bell
+from fuzzylogic.mf.composite import TransformedMF
+from fuzzylogic.mf.constant import ConstantMF
+from fuzzylogic.mf.gaussian import Gaussian
+from fuzzylogic.mf.linear import Linear
+from fuzzylogic.mf.rectangular import Rectangular
+from fuzzylogic.mf.sigmoid import Sigmoid
+from fuzzylogic.mf.singleton import FuzzySingleton
+from fuzzylogic.mf.step import Step
+from fuzzylogic.mf.trap import Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.rule_base import CompiledRuleBase, _index_distinct, support_slices
+from fuzzylogic.tconorms import AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm, MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm, MinimumTNorm
+
+try:
+    # third party libraries
+    import numba
+except ImportError:
+    numba = None
+
+# Whether the kernels are compiled, without Numba they are plain Python functions
+NUMBA_AVAILABLE = numba is not None
+
+# Kernel codes of the membership function families, whose parameters are passed in field order
+MF_CODES = {
+    Triangle: 0,
+    Trapezoid: 1,
+    Gaussian: 2,
+    Bell: 3,
+    Sigmoid: 4,
+    Rectangular: 5,
+    Step: 6,
+    Linear: 7,
+    ConstantMF: 8,
+    FuzzySingleton: 9,
+}
+
+# Kernel codes of the hedges
+HEDGE_CODES = {Not: 0, Con: 1, Dil: 2, Int: 3, Dim: 4}
+
+# Kernel codes of the T-Norms and T-CoNorms
+OPERATOR_CODES = {
+    MinimumTNorm: 0,
+    AlgebraicProductTNorm: 1,
+    BoundedProductTNorm: 2,
+    DrasticProductTNorm: 3,
+    MaximumTCoNorm: 4,
+    AlgebraicSumTCoNorm: 5,
+    BoundedSumTCoNorm: 6,
+    DrasticSumTCoNorm: 7,
+}
+
+# Kernel codes of the defuzzification methods and the name of their result in zero area errors
+DEFUZZ_CODES = {Centroid: 0, Bisector: 1, MeanOfMaximum: 2, LargestOfMaximum: 3, SmallestOfMaximum: 4}
+_AREA_NAMES = {Centroid: "COA", Bisector: "BOA"}
+
+# Largest number of parameters of a membership function family
+_N_PARAMETERS = 4
+
+
+def _jit(function: Callable) -> Callable:
+    """
+    Compiles a kernel into a nopython function with NumPy division semantics, if Numba is installed.
+    """
+
+    if numba is None:
+        return function
+
+    return numba.njit(cache=True, nogil=True, error_model="numpy")(function)
+
+
+@_jit
+def _membership(family: int, parameters: np.ndarray, x: float) -> float:
+    """
+    Evaluates a membership function of a family at a crisp value.
+    """
+
+    if family == 0 or family == 1:
+        # Triangle and trapezoid, a vertical edge is one from its foot on
+        a, b = parameters[0], parameters[1]
+        c, d = (parameters[1], parameters[2]) if family == 0 else (parameters[2], parameters[3])
+        left = (x - a) / (b - a) if b > a else (1.0 if x >= a else 0.0)
+        right = (d - x) / (d - c) if d > c else (1.0 if x <= d else 0.0)
+        u = min(left, right)
+        return max(min(u, 1.0) if family == 1 else u, 0.0)
+    if family == 2:
+        return np.exp(-0.5 * ((x - parameters[0]) / parameters[1]) ** 2)
+    if family == 3:
+        return 1 / (1 + np.abs((x - parameters[0]) / parameters[1]) ** (2 * parameters[2]))
+    if family == 4:
+        return 1 / (1 + np.exp(-parameters[0] * (x - parameters[1])))
+    if family == 5:
+        return 1.0 if parameters[0] <= x <= parameters[1] else 0.0
+    if family == 6:
+        return 0.0 if x < parameters[0] else 1.0
+    if family == 7:
+        return min(max(parameters[0] * x + parameters[1], 0.0), 1.0)
+    if family == 8:
+        return parameters[0]
+
+    return 1.0 if x == parameters[0] else 0.0
+
+
+@_jit
+def _hedge(hedge: int, u: float) -> float:
+    """
+    Applies a hedge to a membership value.
+    """
+
+    if hedge == 0:
+        return 1 - u
+    if hedge == 1:
+        return u**2
+    if hedge == 2:
+        return np.sqrt(u)
+    if hedge == 3:
+        return 2 * u**2 if u < 0.5 else 1 - 2 * (1 - u) ** 2
+
+    return 0.5 * u**0.5 if u < 0.5 else 1 - 0.5 * (1 - u) ** 0.5
+
+
+@_jit
+def _operator(operator: int, u1: float, u2: float) -> float:
+    """
+    Applies a T-Norm or T-CoNorm to two membership values.
+    """
+
+    if operator == 0:
+        return min(u1, u2)
+    if operator == 1:
+        return u1 * u2
+    if operator == 2:
+        return max(0.0, u1 + u2 - 1)
+    if operator == 3:
+        return u2 if u1 == 1 else (u1 if u2 == 1 else 0.0)
+    if operator == 4:
+        return max(u1, u2)
+    if operator == 5:
+        return u1 + u2 - u1 * u2
+    if operator == 6:
+        return min(1.0, u1 + u2)
+
+    return u2 if u1 == 0 else (u1 if u2 == 0 else 1.0)
+
+
+@_jit
+def _reduce(operator: int, u: np.ndarray) -> float:
+    """
+    Applies a T-Norm or T-CoNorm to membership values in one pass, as its apply_many does.
+    """
+
+    if operator == 2 or operator == 6:
+        total = 0.0
+        for idx in range(len(u)):
+            total += u[idx]
+        return max(0.0, total - (len(u) - 1)) if operator == 2 else min(1.0, total)
+    if operator == 5:
+        complement = 1.0
+        for idx in range(len(u)):
+            complement *= 1 - u[idx]
+        return 1 - complement
+    if operator == 3 or operator == 7:
+        # The drastic operators are the extreme operand if every other one is neutral, else absorbing
+        neutral = 1.0 if operator == 3 else 0.0
+        n_other = 0
+        for idx in range(len(u)):
+            if u[idx] != neutral:
+                n_other += 1
+        if n_other > 1:
+            return 1 - neutral
+        return u.min() if operator == 3 else u.max()
+
+    # Minimum, algebraic product and maximum fold from left to right
+    result = u[0]
+    for idx in range(1, len(u)):
+        result = _operator(operator, result, u[idx])
+    return result
+
+
+@_jit
+def _rule_strengths_kernel(
+    inputs: np.ndarray,
+    term_inputs: np.ndarray,
+    term_families: np.ndarray,
+    term_parameters: np.ndarray,
+    term_hedges: np.ndarray,
+    rule_terms: np.ndarray,
+    dom_codes: np.ndarray,
+    connective_codes: np.ndarray,
+    reduction_codes: np.ndarray,
+    rule_strengths: np.ndarray,
+):
+    """
+    Fuzzifies every crisp input and fires every rule sample by sample.
+    """
+
+    memberships = np.empty(len(term_families))
+    doms = np.empty(rule_terms.shape[1])
+    for sample in range(inputs.shape[0]):
+        # Evaluate every distinct antecedent once, innermost hedge first
+        for term in range(len(term_families)):
+            u = _membership(term_families[term], term_parameters[term], inputs[sample, term_inputs[term]])
+            for hedge in term_hedges[term]:
+                if hedge < 0:
+                    break
+                u = _hedge(hedge, u)
+            memberships[term] = u
+
+        for rule in range(rule_terms.shape[0]):
+            for idx in range(rule_terms.shape[1]):
+                doms[idx] = _operator(dom_codes[rule], 1.0, memberships[rule_terms[rule, idx]])
+
+            # Reduce the antecedents of the rules with a single operator in one pass, combine the others from left to
+            # right
+            if reduction_codes[rule] >= 0:
+                rule_strengths[sample, rule] = _reduce(reduction_codes[rule], doms)
+            else:
+                strength = doms[0]
+                for idx in range(1, len(doms)):
+                    strength = _operator(connective_codes[idx - 1, rule], strength, doms[idx])
+                rule_strengths[sample, rule] = strength
+
+
+@_jit
+def _aggregate_row(
+    rule_strengths: np.ndarray,
+    consequents: np.ndarray,
+    rule_consequents: np.ndarray,
+    implication_codes: np.ndarray,
+    clips_to_zero: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    aggregate_code: int,
+    aggregated_mf: np.ndarray,
+):
+    """
+    Clips the consequent of every rule and folds it into the aggregated membership values of one sample.
+    """
+
+    aggregated_mf[:] = 0.0
+    for rule in range(len(rule_strengths)):
+        strength = rule_strengths[rule]
+        if strength == 0 and clips_to_zero[rule]:
+            continue
+
+        consequent = consequents[rule_consequents[rule]]
+        for idx in range(starts[rule], stops[rule]):
+            clipped = _operator(implication_codes[rule], strength, consequent[idx])
+            aggregated_mf[idx] = _operator(aggregate_code, aggregated_mf[idx], clipped)
+
+
+@_jit
+def _defuzz_row(defuzz: int, x: np.ndarray, aggregated_mf: np.ndarray) -> float:
+    """
+    Defuzzifies the aggregated membership values of one sample, NaN for a zero area.
+    """
+
+    if defuzz == 0:
+        numerator = 0.0
+        denominator = 0.0
+        for idx in range(len(x)):
+            numerator += x[idx] * aggregated_mf[idx]
+            denominator += aggregated_mf[idx]
+        return numerator / denominator if denominator != 0 else np.nan
+
+    if defuzz == 1:
+        total_area = 0.0
+        for idx in range(len(x)):
+            total_area += aggregated_mf[idx]
+        if total_area == 0:
+            return np.nan
+
+        # First point whose cumulative area is closest to half of the total area
+        cumulative_area = 0.0
+        closest = np.inf
+        bisector = 0
+        for idx in range(len(x)):
+            cumulative_area += aggregated_mf[idx]
+            distance = abs(cumulative_area - total_area / 2)
+            if distance < closest:
+                closest = distance
+                bisector = idx
+        return x[bisector]
+
+    # Mean, largest or smallest of the points of maximum membership
+    maximum = aggregated_mf.max()
+    total = 0.0
+    count = 0
+    largest = -np.inf
+    smallest = np.inf
+    for idx in range(len(x)):
+        if aggregated_mf[idx] == maximum:
+            total += x[idx]
+            count += 1
+            largest = max(largest, x[idx])
+            smallest = min(smallest, x[idx])
+    if defuzz == 2:
+        return total / count
+    if defuzz == 3:
+        return largest
+
+    return smallest
+
+
+@_jit
+def _aggregate_kernel(
+    rule_strengths: np.ndarray,
+    consequents: np.ndarray,
+    rule_consequents: np.ndarray,
+    implication_codes: np.ndarray,
+    clips_to_zero: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    aggregate_code: int,
+    aggregated_mf: np.ndarray,
+):
+    """
+    Aggregates the clipped consequents of every sample.
+    """
+
+    for sample in range(rule_strengths.shape[0]):
+        _aggregate_row(
+            rule_strengths[sample],
+            consequents,
+            rule_consequents,
+            implication_codes,
+            clips_to_zero,
+            starts,
+            stops,
+            aggregate_code,
+            aggregated_mf[sample],
+        )
+
+
+@_jit
+def _aggregate_defuzz_kernel(
+    rule_strengths: np.ndarray,
+    x: np.ndarray,
+    consequents: np.ndarray,
+    rule_consequents: np.ndarray,
+    implication_codes: np.ndarray,
+    clips_to_zero: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    aggregate_code: int,
+    defuzz_codes: np.ndarray,
+    outputs: np.ndarray,
+):
+    """
+    Aggregates and defuzzifies every sample, reusing one row of aggregated membership values.
+    """
+
+    aggregated_mf = np.empty_like(x)
+    for sample in range(rule_strengths.shape[0]):
+        _aggregate_row(
+            rule_strengths[sample],
+            consequents,
+            rule_consequents,
+            implication_codes,
+            clips_to_zero,
+            starts,
+            stops,
+            aggregate_code,
+            aggregated_mf,
+        )
+        for idx in range(len(defuzz_codes)):
+            outputs[idx, sample] = _defuzz_row(defuzz_codes[idx], x, aggregated_mf)
+
+
+def _encode_term(mf: MembershipFunction1D) -> Tuple[int, List[float], List[int]]:
+    """
+    Encodes an antecedent as a membership function family, its parameters and its hedges, innermost first.
+
+    Args:
+        mf (MembershipFunction1D): Antecedent membership function
+
+    Returns:
+        Tuple[int, List[float], List[int]]: Family code, parameters and hedge codes
+    """
+
+    hedges = []
+    while isinstance(mf, TransformedMF) and mf.hedge in HEDGE_CODES:
+        hedges.append(HEDGE_CODES[mf.hedge])
+        mf = mf.mf
+    if isinstance(mf, BankedMF):
+        mf = mf.bank.mfs[mf.index]
+
+    if type(mf) not in MF_CODES:
+        raise TypeError(f"The JIT backend cannot evaluate a {type(mf).__name__} antecedent.")
+
+    return MF_CODES[type(mf)], [float(getattr(mf, field.name)) for field in fields(mf)], hedges[::-1]
+
+
+class JITRuleBase(CompiledRuleBase):
+    """
+    Compiled rule base evaluated by fused Numba kernels.
+
+    Every distinct antecedent is encoded as a membership function family, its parameters and a chain of hedges, and
+    every operator as a kernel code. The kernels then fuzzify, fire, clip, aggregate and defuzzify sample by sample
+    on scalars, without the temporary arrays of the NumPy path, while the consequents are evaluated once over the
+    universe of discourse with NumPy. Antecedents of other families, composite antecedents and user defined
+    operators are not supported, see MamdaniFuzzyEngine.compile for the fallback.
+
+    The arrays read and written by the kernels keep the floating point type of the crisp inputs and of the universe
+    of discourse, every type is compiled once.
+    """
+
+    def __init__(self, rules: List[FuzzyRule], aggregate_operator: TCoNorm):
+        """
+        Compiles a rule base into kernel arrays.
+
+        Args:
+            rules (List[FuzzyRule]): List of fuzzy rules
+            aggregate_operator (TCoNorm): Operator to aggregate fuzzy rules
+        """
+
+        super().__init__(rules=rules, aggregate_operator=aggregate_operator)
+
+        # Check that every operator has a kernel
+        for operator in self.operators + (type(aggregate_operator),):
+            if operator not in OPERATOR_CODES:
+                raise TypeError(f"The JIT backend cannot apply the {operator.__name__} operator.")
+        operator_codes = np.array([OPERATOR_CODES[operator] for operator in self.operators], dtype=np.intp)
+
+        # Flat table of the distinct antecedents of every input
+        term_inputs, terms = [], []
+        self.rule_terms = np.empty((self.n_rules, self.n_inputs), dtype=np.intp)
+        for idx in range(self.n_inputs):
+            distinct_mfs, term_index = _index_distinct([rule.antecedents[idx] for rule in rules])
+            self.rule_terms[:, idx] = term_index + len(terms)
+            term_inputs.extend([idx] * len(distinct_mfs))
+            terms.extend(_encode_term(mf) for mf in distinct_mfs)
+
+        max_hedges = max(1, max(len(hedges) for _, _, hedges in terms))
+        self.term_inputs = np.array(term_inputs, dtype=np.intp)
+        self.term_families = np.array([family for family, _, _ in terms], dtype=np.intp)
+        self.term_parameters = np.zeros((len(terms), _N_PARAMETERS))
+        self.term_hedges = np.full((len(terms), max_hedges), -1, dtype=np.intp)
+        for term, (_, parameters, hedges) in enumerate(terms):
+            self.term_parameters[term, : len(parameters)] = parameters
+            self.term_hedges[term, : len(hedges)] = hedges
+
+        # Kernel codes of the operators of every rule
+        self.kernel_dom_codes = operator_codes[self.dom_codes]
+        self.kernel_connective_codes = operator_codes[self.connective_codes]
+        self.kernel_reduction_codes = np.where(self.reduction_codes >= 0, operator_codes[self.reduction_codes], -1)
+        self.kernel_implication_codes = operator_codes[self.implication_codes]
+        self.aggregate_code = OPERATOR_CODES[type(aggregate_operator)]
+
+        # A consequent clipped by a T-Norm is zero where its rule does not fire and outside of its support
+        self.clips_to_zero = np.array([issubclass(self.operators[code], TNorm) for code in self.implication_codes])
+
+    def get_rule_strengths(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the firing strength of every rule for a batch of crisp inputs, fuzzifying in the same kernel.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Rule firing strengths of shape (n_samples, n_rules)
+        """
+
+        # Assert inputs is a batch of crisp inputs
+        inputs = np.ascontiguousarray(as_float_array(inputs))
+        if inputs.ndim != 2 or inputs.shape[1] != self.n_inputs:
+            raise ValueError(f"Expected inputs to have shape (n_samples, {self.n_inputs}), but got {inputs.shape}")
+
+        rule_strengths = np.empty((len(inputs), self.n_rules), dtype=inputs.dtype)
+        _rule_strengths_kernel(
+            inputs,
+            self.term_inputs,
+            self.term_families,
+            self.term_parameters,
+            self.term_hedges,
+            self.rule_terms,
+            self.kernel_dom_codes,
+            self.kernel_connective_codes,
+            self.kernel_reduction_codes,
+            rule_strengths,
+        )
+
+        return rule_strengths
+
+    def _consequent_arrays(self, x: np.ndarray) -> tuple:
+        """
+        Evaluates the distinct consequents over the universe of discourse and the slice of it clipped by every rule.
+        """
+
+        consequents = np.ascontiguousarray(self.consequent_table(x))
+        slices = support_slices(self.consequent_supports, x)
+        starts = np.array([slices[idx].indices(len(x))[0] for idx in self.consequent_index], dtype=np.intp)
+        stops = np.array([slices[idx].indices(len(x))[1] for idx in self.consequent_index], dtype=np.intp)
+
+        # Other implication operators can be non-zero outside of the support of the consequent
+        starts[~self.clips_to_zero] = 0
+        stops[~self.clips_to_zero] = len(x)
+
+        return consequents, self.consequent_index, self.kernel_implication_codes, self.clips_to_zero, starts, stops
+
+    def aggregate(self, rule_strengths: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Aggregates the clipped consequents of every rule over the universe of discourse.
+
+        Args:
+            rule_strengths (np.ndarray): Rule firing strengths of shape (n_samples, n_rules)
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+
+        Returns:
+            np.ndarray: Aggregated membership values of shape (n_samples, n_universe)
+        """
+
+        x = as_float_array(x)
+        aggregated_mf = np.empty((len(rule_strengths), len(x)), dtype=x.dtype)
+        _aggregate_kernel(
+            np.ascontiguousarray(rule_strengths, dtype=x.dtype),
+            *self._consequent_arrays(x),
+            self.aggregate_code,
+            aggregated_mf,
+        )
+
+        return aggregated_mf
+
+    @staticmethod
+    def supports_defuzz(defuzzifiers: List[type]) -> bool:
+        """
+        Whether every defuzzification method has a kernel.
+        """
+        return all(defuzz in DEFUZZ_CODES for defuzz in defuzzifiers)
+
+    def aggregate_defuzz(self, rule_strengths: np.ndarray, x: np.ndarray, defuzzifiers: List[type]) -> np.ndarray:
+        """
+        Aggregates and defuzzifies every sample without storing the aggregated membership values of the batch.
+
+        Args:
+            rule_strengths (np.ndarray): Rule firing strengths of shape (n_samples, n_rules)
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+            defuzzifiers (List[type]): Defuzzification methods, see supports_defuzz
+
+        Returns:
+            np.ndarray: Crisp output values of every method of shape (n_methods, n_samples)
+        """
+
+        x = np.ascontiguousarray(as_float_array(x))
+        outputs = np.empty((len(defuzzifiers), len(rule_strengths)), dtype=x.dtype)
+        _aggregate_defuzz_kernel(
+            np.ascontiguousarray(rule_strengths, dtype=x.dtype),
+            x,
+            *self._consequent_arrays(x),
+            self.aggregate_code,
+            np.array([DEFUZZ_CODES[defuzz] for defuzz in defuzzifiers], dtype=np.intp),
+            outputs,
+        )
+
+        # The kernels return NaN for a zero area rather than raising
+        for defuzz, output in zip(defuzzifiers, outputs):
+            if defuzz in _AREA_NAMES and np.any(np.isnan(output)):
+                raise ValueError(f"The membership function has an area of zero, cannot compute {_AREA_NAMES[defuzz]}.")
+
+        return outputs
@@ -0,0 +1,177 @@
+# standard libraries
+import itertools
+import os
+from typing import List, Optional, Union
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.engine import FuzzyEngine
+from fuzzylogic.storage import load_npz, save_npz
+
+
+class LookupTable:
+    """
+    Lookup table of the crisp output of a fuzzy inference engine.
+
+    The table holds the output of the engine at every point of a grid over the antecedent ranges and answers queries
+    by multilinear interpolation between the grid points, trading accuracy for a cost that does not depend on the
+    number of rules or on the universe of discourse.
+    """
+
+    def __init__(self, antecedent_ranges: List[np.ndarray], values: np.ndarray, max_error: Optional[float] = None):
+        """
+        Initialises a lookup table.
+
+        Args:
+            antecedent_ranges (List[np.ndarray]): Increasing grid points of every input
+            values (np.ndarray): Output values at the grid points of shape (len(antecedent_ranges[0]), ...)
+            max_error (Optional[float], optional): Measured maximum interpolation error. Defaults to None.
+        """
+
+        antecedent_ranges = [np.asarray(range_, dtype=np.float64) for range_ in antecedent_ranges]
+        for idx, range_ in enumerate(antecedent_ranges):
+            if range_.ndim != 1 or len(range_) < 2 or np.any(np.diff(range_) <= 0):
+                raise ValueError(f"Expected antecedent range {idx} to hold at least two increasing values")
+
+        shape = tuple(len(range_) for range_ in antecedent_ranges)
+        if np.shape(values) != shape:
+            raise ValueError(f"Expected values to have shape {shape}, but got {np.shape(values)}")
+
+        self.antecedent_ranges = antecedent_ranges
+        self.values = values
+        self.max_error = max_error
+
+        # Offsets of the corners of a grid cell in the flattened values
+        strides = np.array([int(np.prod(shape[idx + 1 :])) for idx in range(len(shape))], dtype=np.intp)
+        self._corners = np.array(list(itertools.product((0, 1), repeat=len(shape))), dtype=np.intp)
+        self._strides = strides
+        self._corner_offsets = self._corners @ strides
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the lookup table.
+        """
+        return f"LookupTable(shape={self.values.shape}, max_error={self.max_error})"
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: FuzzyEngine,
+        antecedent_ranges: List[np.ndarray],
+        x: Optional[np.ndarray] = None,
+        n_validation: int = 1000,
+        seed: Optional[int] = None,
+    ) -> "LookupTable":
+        """
+        Bakes a fuzzy inference engine into a lookup table.
+
+        The table is built from the control surface of the engine, and its maximum error is measured against the
+        engine on random points of the antecedent ranges.
+
+        Args:
+            engine (FuzzyEngine): Fuzzy inference engine
+            antecedent_ranges (List[np.ndarray]): Increasing grid points of every input
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable, not needed by the exact
+                defuzzification methods. Defaults to None.
+            n_validation (int, optional): Number of random points to measure the maximum error on, 0 to skip the
+                measurement. Defaults to 1000.
+            seed (Optional[int], optional): Seed of the random points. Defaults to None.
+
+        Returns:
+            LookupTable: Lookup table of the engine
+        """
+
+        # Without a universe of discourse the control surface of a sampling defuzzification method holds the
+        # aggregated rule strengths rather than crisp outputs
+        defuzz = getattr(engine, "defuzz", None)
+        if x is None and defuzz is not None and defuzz.requires_universe:
+            raise ValueError(f"The {defuzz.__name__} defuzzification method requires a universe of discourse.")
+
+        values = engine.calculate_fuzzy_control_surface(antecedent_ranges, x=x, indexing="ij")
+        table = cls(antecedent_ranges=antecedent_ranges, values=values)
+
+        if n_validation > 0:
+            rng = np.random.default_rng(seed)
+            low = [range_[0] for range_ in table.antecedent_ranges]
+            high = [range_[-1] for range_ in table.antecedent_ranges]
+            inputs = rng.uniform(low, high, size=(n_validation, len(low)))
+            table.max_error = float(np.max(np.abs(table(inputs) - engine.infer_batch(inputs, x))))
+
+        return table
+
+    def __call__(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Interpolates the output values at a batch of crisp inputs, clamped to the antecedent ranges.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Crisp output values of shape (n_samples,)
+        """
+
+        # Assert inputs is a batch of crisp inputs
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.ndim != 2 or inputs.shape[1] != len(self.antecedent_ranges):
+            raise ValueError(
+                f"Expected inputs to have shape (n_samples, {len(self.antecedent_ranges)}), but got {inputs.shape}"
+            )
+
+        # Grid cell of every input and position of the input in its cell
+        cells = np.empty(inputs.shape, dtype=np.intp)
+        positions = np.empty(inputs.shape)
+        for idx, range_ in enumerate(self.antecedent_ranges):
+            cells[:, idx] = np.clip(np.searchsorted(range_, inputs[:, idx], side="right") - 1, 0, len(range_) - 2)
+            start, stop = range_[cells[:, idx]], range_[cells[:, idx] + 1]
+            positions[:, idx] = np.clip((inputs[:, idx] - start) / (stop - start), 0, 1)
+
+        # Weight the values at the corners of every cell
+        flat_values = self.values.reshape(-1)
+        flat_cells = cells @ self._strides
+        outputs = np.zeros(len(inputs))
+        for corner, offset in zip(self._corners, self._corner_offsets):
+            weights = np.prod(np.where(corner == 1, positions, 1 - positions), axis=1)
+            outputs += weights * flat_values[flat_cells + offset]
+
+        return outputs
+
+    def save(self, path: Union[str, os.PathLike]):
+        """
+        Saves the lookup table to an uncompressed .npz file that load memory maps.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the .npz file
+        """
+
+        save_npz(
+            path,
+            values=self.values,
+            max_error=np.array(np.nan if self.max_error is None else self.max_error),
+            **{f"antecedent_range_{idx}": range_ for idx, range_ in enumerate(self.antecedent_ranges)},
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], mmap_mode: Optional[str] = "r") -> "LookupTable":
+        """
+        Loads a lookup table saved by save, memory mapping its values.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the .npz file
+            mmap_mode (Optional[str], optional): Memory map mode of the values, None to read them into memory.
+                Defaults to "r".
+
+        Returns:
+            LookupTable: Lookup table
+        """
+
+        arrays = load_npz(path, mmap_mode=mmap_mode)
+        n_inputs = sum(name.startswith("antecedent_range_") for name in arrays)
+        max_error = float(arrays["max_error"])
+
+        return cls(
+            antecedent_ranges=[np.array(arrays[f"antecedent_range_{idx}"]) for idx in range(n_inputs)],
+            values=arrays["values"],
+            max_error=None if np.isnan(max_error) else max_error,
+        )
@@ -1,8 +1,12 @@
 # fuzzy logic libraries
+from fuzzylogic.mf.bank import BankedMF, MFBank  # noqa: F401
 from fuzzylogic.mf.bell import Bell  # noqa: F401
+from fuzzylogic.mf.composite import CombinedMF, ReducedMF, TransformedMF  # noqa: F401
 from fuzzylogic.mf.constant import ConstantMF  # noqa: F401
 from fuzzylogic.mf.gaussian import Gaussian  # noqa: F401
+from fuzzylogic.mf.interval import IntervalType2MF  # noqa: F401
 from fuzzylogic.mf.linear import Linear  # noqa: F401
+from fuzzylogic.mf.piecewise import PiecewiseLinearMF  # noqa: F401
 from fuzzylogic.mf.rectangular import Rectangular  # noqa: F401
 from fuzzylogic.mf.sigmoid import Sigmoid  # noqa: F401
 from fuzzylogic.mf.singleton import FuzzySingleton  # noqa: F401
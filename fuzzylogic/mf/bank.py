@@ -0,0 +1,156 @@
+# standard libraries
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Dict, List, Tuple
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import result_dtype
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
+from fuzzylogic.mf.bell import Bell
+from fuzzylogic.mf.gaussian import Gaussian
+from fuzzylogic.mf.linear import Linear
+from fuzzylogic.mf.rectangular import Rectangular
+from fuzzylogic.mf.sigmoid import Sigmoid
+from fuzzylogic.mf.step import Step
+from fuzzylogic.mf.trap import Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+
+# Membership function families whose parameters can be stored as arrays and evaluated in one broadcast call
+BANK_FAMILIES = (Bell, Gaussian, Linear, Rectangular, Sigmoid, Step, Trapezoid, Triangle)
+
+
+@dataclass(eq=False)
+class MFBank:
+    """
+    Bank of membership functions of the same family.
+
+    The parameters of the K membership functions are stored as arrays, so that the bank evaluates all of them with
+    one broadcast call of the family formula. Any membership function dataclass with a static formula(x, *parameters)
+    method can be banked, the families of BANK_FAMILIES are banked automatically by compiled rule bases.
+    """
+
+    family: type
+    parameters: Dict[str, np.ndarray]  # parameters of the membership functions as (K,) arrays
+    mfs: List[MembershipFunction1D] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """
+        Checks the family and builds the membership functions, which validates their parameters.
+        """
+        if not (
+            isinstance(self.family, type)
+            and issubclass(self.family, MembershipFunction1D)
+            and is_dataclass(self.family)
+            and callable(getattr(self.family, "formula", None))
+        ):
+            raise TypeError(f"Expected family to be a membership function dataclass with a formula, got {self.family}")
+
+        names = [family_field.name for family_field in fields(self.family)]
+        if sorted(self.parameters) != sorted(names):
+            raise ValueError(f"Expected parameters {names}, but got {list(self.parameters)}")
+
+        self.parameters = {name: np.asarray(self.parameters[name]) for name in names}
+        if len({values.shape for values in self.parameters.values()}) != 1 or self.parameters[names[0]].ndim != 1:
+            raise ValueError("Expected parameters to be one dimensional arrays of the same length")
+
+        self.mfs = [
+            self.family(**{name: values[idx].item() for name, values in self.parameters.items()})
+            for idx in range(len(self))
+        ]
+
+    @classmethod
+    def from_mfs(cls, mfs: List[MembershipFunction1D]) -> "MFBank":
+        """
+        Creates a bank from membership functions of the same family.
+
+        Args:
+            mfs (List[MembershipFunction1D]): Membership functions
+
+        Returns:
+            MFBank: Bank of the membership functions
+        """
+        if not mfs:
+            raise ValueError("The membership functions list cannot be empty.")
+
+        family = type(mfs[0])
+        if any(type(mf) is not family for mf in mfs):
+            raise TypeError("Expected every membership function to be of the same family")
+
+        return cls(
+            family=family,
+            parameters={
+                family_field.name: np.array([getattr(mf, family_field.name) for mf in mfs])
+                for family_field in fields(family)
+            },
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of membership functions of the bank.
+        """
+        return len(next(iter(self.parameters.values())))
+
+    def __getitem__(self, idx: int) -> "BankedMF":
+        """
+        Returns a membership function of the bank that can be used as an antecedent or consequent.
+        """
+        if not -len(self) <= idx < len(self):
+            raise IndexError(f"Bank index {idx} out of range for a bank of {len(self)} membership functions")
+
+        return BankedMF(bank=self, index=idx % len(self))
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates every membership function of the bank at x.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: membership values of shape (K, *x.shape)
+        """
+        x = np.asarray(x)
+
+        # The family formula broadcasts the (K, 1, ...) parameters, of the floating point type of the membership
+        # values, against the observations
+        shape = (len(self),) + (1,) * x.ndim
+        dtype = result_dtype(x)
+        parameters = {name: values.reshape(shape).astype(dtype, copy=False) for name, values in self.parameters.items()}
+
+        return self.family.formula(x, **parameters)
+
+
+@dataclass(eq=False)
+class BankedMF(MembershipFunction1D):
+    """
+    Membership function of a bank.
+    """
+
+    bank: MFBank
+    index: int
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the membership function at x.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return self.bank.mfs[self.index](x)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return self.bank.mfs[self.index].support(tolerance)
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.bank.mfs[self.index].core()
@@ -1,11 +1,12 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import EMPTY, SUPPORT_TOLERANCE, UNBOUNDED, MembershipFunction1D
 
 
 @dataclass
@@ -35,4 +36,38 @@ class Bell(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return 1 / (1 + np.abs((x - self.center) / self.width) ** (2 * self.intensity))
+        return self.formula(x, self.center, self.width, self.intensity)
+
+    @staticmethod
+    def formula(x: np.ndarray, center: np.ndarray, width: np.ndarray, intensity: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            center (np.ndarray): center parameter
+            width (np.ndarray): width parameter
+            intensity (np.ndarray): intensity parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return 1 / (1 + np.abs((x - center) / width) ** (2 * intensity))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is below tolerance.
+        """
+        if tolerance <= 0 or self.intensity <= 0:
+            return UNBOUNDED
+
+        # 1 / (1 + |z| ** (2 * intensity)) >= tolerance for |z| <= (1 / tolerance - 1) ** (1 / (2 * intensity))
+        half_width = abs(self.width) * (1 / min(tolerance, 1) - 1) ** (1 / (2 * self.intensity))
+        return self.center - half_width, self.center + half_width
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return (self.center, self.center) if self.intensity > 0 else EMPTY
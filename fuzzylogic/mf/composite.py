@@ -0,0 +1,115 @@
+# standard libraries
+from dataclasses import dataclass
+from functools import reduce
+from typing import List, Tuple
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
+
+
+@dataclass
+class CombinedMF(MembershipFunction1D):
+    """
+    Membership function combining two membership functions with a T-Norm, T-CoNorm or connective.
+    """
+
+    operator: type  # T-Norm, T-CoNorm or connective class
+    mf1: MembershipFunction1D
+    mf2: MembershipFunction1D
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the membership function at x.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return self.operator.apply(self.mf1(x), self.mf2(x))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero, combined by the operator.
+        """
+        return self.operator.combine_support(self.mf1.support(tolerance), self.mf2.support(tolerance))
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one, combined by the operator.
+        """
+        return self.operator.combine_core(self.mf1.core(), self.mf2.core())
+
+
+@dataclass
+class TransformedMF(MembershipFunction1D):
+    """
+    Membership function transformed by a linguistic hedge.
+    """
+
+    hedge: type  # Hedge class
+    mf: MembershipFunction1D
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the membership function at x.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return self.hedge.apply(self.mf(x))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero, transformed by the hedge.
+        """
+        return self.hedge.transform_support(self.mf.support(self.hedge.support_tolerance(tolerance)), self.mf.core())
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one, transformed by the hedge.
+        """
+        return self.hedge.transform_core(self.mf.support(0), self.mf.core())
+
+
+@dataclass
+class ReducedMF(MembershipFunction1D):
+    """
+    Membership function combining any number of membership functions with a T-Norm or T-CoNorm in one pass.
+    """
+
+    operator: type  # T-Norm or T-CoNorm class
+    mfs: List[MembershipFunction1D]
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the membership function at x.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: membership values
+        """
+        # Fold the operands into a single partial result rather than stacking them for apply_many, which is faster on
+        # large arrays
+        return reduce(self.operator.apply, (mf(x) for mf in self.mfs))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero, combined by the operator.
+        """
+        return reduce(self.operator.combine_support, [mf.support(tolerance) for mf in self.mfs])
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one, combined by the operator.
+        """
+        return reduce(self.operator.combine_core, [mf.core() for mf in self.mfs])
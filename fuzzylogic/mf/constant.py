@@ -1,11 +1,13 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.dtype import result_dtype
+from fuzzylogic.core.mf import EMPTY, SUPPORT_TOLERANCE, UNBOUNDED, MembershipFunction1D
 
 
 @dataclass
@@ -33,4 +35,16 @@ class ConstantMF(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return np.full_like(x, fill_value=self.value, dtype=np.float64)
+        return np.full_like(x, fill_value=self.value, dtype=result_dtype(x))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return EMPTY if self.value == 0 else UNBOUNDED
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return UNBOUNDED if self.value == 1 else EMPTY
@@ -1,11 +1,12 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
 
 
 @dataclass
@@ -27,4 +28,37 @@ class Gaussian(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return np.exp(-0.5 * ((x - self.mean) / self.std) ** 2)
+        return self.formula(x, self.mean, self.std)
+
+    @staticmethod
+    def formula(x: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            mean (np.ndarray): mean parameter
+            std (np.ndarray): std parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return np.exp(-0.5 * ((x - mean) / std) ** 2)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is below tolerance.
+        """
+        if tolerance <= 0:
+            return -np.inf, np.inf
+
+        # exp(-0.5 * z ** 2) >= tolerance for |z| <= sqrt(-2 * log(tolerance))
+        half_width = abs(self.std) * np.sqrt(-2 * np.log(min(tolerance, 1)))
+        return self.mean - half_width, self.mean + half_width
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.mean, self.mean
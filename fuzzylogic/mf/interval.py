@@ -0,0 +1,96 @@
+# standard libraries
+from dataclasses import dataclass
+from typing import Tuple
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import as_float_array
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
+from fuzzylogic.mf.gaussian import Gaussian
+from fuzzylogic.mf.trap import Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+
+
+@dataclass
+class IntervalType2MF(MembershipFunction1D):
+    """
+    Interval type-2 membership function.
+
+    The footprint of uncertainty lies between a lower and an upper type-1 membership function. The membership function
+    evaluates to the lower and upper membership values stacked along a new first axis, which T-Norms and T-CoNorms
+    combine bound by bound. A lower membership function of height h < 1 is e.g. the algebraic product of a constant h
+    and a type-1 membership function.
+    """
+
+    lower: MembershipFunction1D  # lower membership function, at most the upper one
+    upper: MembershipFunction1D  # upper membership function
+
+    @classmethod
+    def from_mf(cls, mf: MembershipFunction1D, spread: float) -> "IntervalType2MF":
+        """
+        Blurs a triangle, trapezoid or gaussian membership function into an interval type-2 membership function.
+
+        The feet of a triangle or trapezoid, or the standard deviation of a gaussian, move by spread outwards for the
+        upper membership function and inwards for the lower one.
+
+        Args:
+            mf (MembershipFunction1D): Triangle, Trapezoid or Gaussian membership function
+            spread (float): Non-negative uncertainty of the feet or standard deviation
+
+        Returns:
+            IntervalType2MF: Interval type-2 membership function
+        """
+        if spread < 0:
+            raise ValueError("spread must be non-negative")
+
+        if type(mf) is Triangle:
+            if mf.a + spread > mf.b or mf.b > mf.c - spread:
+                raise ValueError("spread must not move the feet of the lower triangle past its peak")
+            return cls(
+                lower=Triangle(a=mf.a + spread, b=mf.b, c=mf.c - spread),
+                upper=Triangle(a=mf.a - spread, b=mf.b, c=mf.c + spread),
+            )
+        if type(mf) is Trapezoid:
+            if mf.a + spread > mf.b or mf.c > mf.d - spread:
+                raise ValueError("spread must not move the feet of the lower trapezoid past its shoulders")
+            return cls(
+                lower=Trapezoid(a=mf.a + spread, b=mf.b, c=mf.c, d=mf.d - spread),
+                upper=Trapezoid(a=mf.a - spread, b=mf.b, c=mf.c, d=mf.d + spread),
+            )
+        if type(mf) is Gaussian:
+            if spread >= abs(mf.std):
+                raise ValueError("spread must be smaller than the standard deviation")
+            return cls(
+                lower=Gaussian(mean=mf.mean, std=abs(mf.std) - spread),
+                upper=Gaussian(mean=mf.mean, std=abs(mf.std) + spread),
+            )
+
+        raise TypeError(f"Expected a Triangle, Trapezoid or Gaussian membership function, but got {type(mf)}")
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the membership function at x.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: lower and upper membership values of shape (2, *x.shape)
+        """
+        x = as_float_array(x)
+
+        return np.stack(np.broadcast_arrays(self.lower(x), self.upper(x))).astype(x.dtype, copy=False)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the upper membership function is zero.
+        """
+        return self.upper.support(tolerance)
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the lower membership function is one.
+        """
+        return self.lower.core()
@@ -1,11 +1,12 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import EMPTY, SUPPORT_TOLERANCE, UNBOUNDED, MembershipFunction1D
 
 
 @dataclass
@@ -27,4 +28,44 @@ class Linear(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return np.clip(self.m * x + self.b, 0, 1)
+        return self.formula(x, self.m, self.b)
+
+    @staticmethod
+    def formula(x: np.ndarray, m: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            m (np.ndarray): m parameter
+            b (np.ndarray): b parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return np.clip(m * x + b, 0, 1)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        if self.m == 0:
+            return EMPTY if self.b <= 0 else UNBOUNDED
+
+        # The line crosses zero at -b / m
+        if self.m > 0:
+            return -self.b / self.m, np.inf
+        return -np.inf, -self.b / self.m
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        if self.m == 0:
+            return UNBOUNDED if self.b >= 1 else EMPTY
+
+        # The line crosses one at (1 - b) / m
+        if self.m > 0:
+            return (1 - self.b) / self.m, np.inf
+        return -np.inf, (1 - self.b) / self.m
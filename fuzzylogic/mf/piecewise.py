@@ -0,0 +1,309 @@
+# standard libraries
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import as_float_array
+from fuzzylogic.core.mf import EMPTY, SUPPORT_TOLERANCE, MembershipFunction1D
+from fuzzylogic.mf.rectangular import Rectangular
+from fuzzylogic.mf.trap import Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+
+
+@dataclass(eq=False)
+class PiecewiseLinearMF(MembershipFunction1D):
+    """
+    Piecewise linear membership function.
+
+    The membership function interpolates linearly between its breakpoints and is zero outside of them. Consecutive
+    breakpoints with the same abscissa describe a jump, as at the edges of a rectangular membership function.
+    """
+
+    x: np.ndarray  # non-decreasing abscissas of the breakpoints
+    y: np.ndarray  # membership values of the breakpoints
+
+    def __post_init__(self):
+        """
+        Checks the breakpoints and closes the membership function with zeros at both ends.
+        """
+        self.x = np.asarray(self.x, dtype=np.float64)
+        self.y = np.asarray(self.y, dtype=np.float64)
+
+        if self.x.ndim != 1 or self.x.shape != self.y.shape or len(self.x) == 0:
+            raise ValueError("Expected x and y to be non empty one dimensional arrays of the same length")
+        if np.any(np.diff(self.x) < 0):
+            raise ValueError("x must be non-decreasing")
+        if np.any(self.y < 0) or np.any(self.y > 1):
+            raise ValueError("y must be between 0 and 1")
+
+        if self.y[0] != 0:
+            self.x, self.y = np.r_[self.x[0], self.x], np.r_[0.0, self.y]
+        if self.y[-1] != 0:
+            self.x, self.y = np.r_[self.x, self.x[-1]], np.r_[self.y, 0.0]
+
+    @classmethod
+    def from_mf(cls, mf: MembershipFunction1D) -> "PiecewiseLinearMF":
+        """
+        Creates the piecewise linear membership function equal to a triangle, trapezoid or rectangular membership
+        function.
+
+        Args:
+            mf (MembershipFunction1D): Membership function
+
+        Returns:
+            PiecewiseLinearMF: Piecewise linear membership function
+        """
+        if isinstance(mf, PiecewiseLinearMF):
+            return mf
+        if type(mf) is Triangle:
+            return cls(x=[mf.a, mf.b, mf.c], y=[0, 1, 0])
+        if type(mf) is Trapezoid:
+            return cls(x=[mf.a, mf.b, mf.c, mf.d], y=[0, 1, 1, 0])
+        if type(mf) is Rectangular:
+            return cls(x=[mf.low, mf.high], y=[1, 1])
+
+        raise TypeError(f"Expected a Triangle, Trapezoid or Rectangular membership function, but got {type(mf)}")
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the membership function at x, taking the larger side of a jump.
+
+        Args:
+            x (np.ndarray): observations
+
+        Returns:
+            np.ndarray: membership values
+        """
+        x = as_float_array(x)
+
+        # The breakpoints are interpolated in float64 and the membership values cast to the type of x
+        return np.maximum(self._left_limits(x), self._right_limits(x)).astype(x.dtype, copy=False)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        positive = np.flatnonzero(self.y > 0)
+        if len(positive) == 0:
+            return EMPTY
+
+        # The membership function is positive between the neighbours of its positive breakpoints
+        return self.x[max(positive[0] - 1, 0)], self.x[min(positive[-1] + 1, len(self.x) - 1)]
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one, the longest one if there are several.
+        """
+        ones = np.r_[False, self.y == 1, False].astype(np.int8)
+        starts, stops = np.flatnonzero(np.diff(ones) == 1), np.flatnonzero(np.diff(ones) == -1) - 1
+        if len(starts) == 0:
+            return EMPTY
+
+        longest = np.argmax(self.x[stops] - self.x[starts])
+        return self.x[starts[longest]], self.x[stops[longest]]
+
+    def _left_limits(self, u: np.ndarray) -> np.ndarray:
+        """
+        Limits of the membership function from the left at u.
+        """
+        idx = np.searchsorted(self.x, u, side="left")
+        inside = (idx > 0) & (idx < len(self.x))
+        idx = np.clip(idx, 1, max(1, len(self.x) - 1))
+
+        return self._interpolate(u, idx - 1, idx, inside)
+
+    def _right_limits(self, u: np.ndarray) -> np.ndarray:
+        """
+        Limits of the membership function from the right at u.
+        """
+        idx = np.searchsorted(self.x, u, side="right") - 1
+        inside = (idx >= 0) & (idx < len(self.x) - 1)
+        idx = np.clip(idx, 0, max(0, len(self.x) - 2))
+
+        return self._interpolate(u, idx, idx + 1, inside)
+
+    def _interpolate(self, u: np.ndarray, start: np.ndarray, stop: np.ndarray, inside: np.ndarray) -> np.ndarray:
+        """
+        Interpolates the segments between the start and stop breakpoints at u, zero outside of the breakpoints.
+        """
+        if len(self.x) < 2:
+            return np.zeros_like(u)
+
+        x0, x1, y0, y1 = self.x[start], self.x[stop], self.y[start], self.y[stop]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = y0 + (y1 - y0) * (u - x0) / (x1 - x0)
+
+        return np.where(inside, values, 0.0)
+
+    def _combine(self, other_left: np.ndarray, other_right: np.ndarray, u: np.ndarray, ufunc: Callable):
+        """
+        Combines the membership function with another one given by its limits at the sorted abscissas u, between
+        which both are linear.
+        """
+        left, right = self._left_limits(u), self._right_limits(u)
+
+        # The combined membership function has a breakpoint where the two cross between abscissas
+        start, stop = right[:-1] - other_right[:-1], left[1:] - other_left[1:]
+        crosses = start * stop < 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(crosses, start / (start - stop), np.nan)
+        crossing_x = u[:-1] + (u[1:] - u[:-1]) * t
+        crossing_y = right[:-1] + (left[1:] - right[:-1]) * t
+
+        # Order the breakpoints as left limit, right limit and crossing of every abscissa
+        x = np.column_stack([u, u, np.r_[crossing_x, np.nan]]).ravel()
+        y = np.column_stack([ufunc(left, other_left), ufunc(right, other_right), np.r_[crossing_y, np.nan]]).ravel()
+
+        # Drop the missing crossings and repeated breakpoints
+        keep = ~np.isnan(x)
+        x, y = x[keep], y[keep]
+        keep = np.r_[True, (np.diff(x) != 0) | (np.diff(y) != 0)]
+
+        return PiecewiseLinearMF(x=x[keep], y=np.clip(y[keep], 0, 1))
+
+    def maximum(self, other: "PiecewiseLinearMF") -> "PiecewiseLinearMF":
+        """
+        Pointwise maximum with another piecewise linear membership function.
+        """
+        u = np.union1d(self.x, other.x)
+
+        return self._combine(other._left_limits(u), other._right_limits(u), u, np.maximum)
+
+    def minimum(self, other: "PiecewiseLinearMF") -> "PiecewiseLinearMF":
+        """
+        Pointwise minimum with another piecewise linear membership function.
+        """
+        u = np.union1d(self.x, other.x)
+
+        return self._combine(other._left_limits(u), other._right_limits(u), u, np.minimum)
+
+    def clip(self, height: float) -> "PiecewiseLinearMF":
+        """
+        Pointwise minimum with a constant.
+        """
+        u = np.unique(self.x)
+        height = np.full(len(u), float(height))
+
+        return self._combine(height, height, u, np.minimum)
+
+    def scale(self, factor: float) -> "PiecewiseLinearMF":
+        """
+        Pointwise product with a constant between 0 and 1.
+        """
+        return PiecewiseLinearMF(x=self.x, y=self.y * factor)
+
+    def area(self) -> float:
+        """
+        Area under the membership function.
+        """
+        return float(np.sum(segment_areas(self.x, self.y)))
+
+    def centroid(self) -> float:
+        """
+        Abscissa of the centroid of the area under the membership function.
+        """
+        return float(piecewise_linear_centroid(self.x, self.y))
+
+    def bisector(self) -> float:
+        """
+        Abscissa that splits the area under the membership function in two halves.
+        """
+        return float(piecewise_linear_bisector(self.x, self.y))
+
+
+def maximum(mfs: List[PiecewiseLinearMF]) -> PiecewiseLinearMF:
+    """
+    Pointwise maximum of piecewise linear membership functions.
+
+    The membership functions are merged pairwise in a balanced tree, so each breakpoint is merged a logarithmic number
+    of times.
+
+    Args:
+        mfs (List[PiecewiseLinearMF]): Piecewise linear membership functions
+
+    Returns:
+        PiecewiseLinearMF: Pointwise maximum
+    """
+    if not mfs:
+        raise ValueError("The membership functions list cannot be empty.")
+
+    while len(mfs) > 1:
+        mfs = [mf1.maximum(mf2) for mf1, mf2 in zip(mfs[::2], mfs[1::2])] + mfs[len(mfs) - len(mfs) % 2 :]
+
+    return mfs[0]
+
+
+def segment_areas(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Areas under the segments between consecutive breakpoints of piecewise linear membership functions.
+
+    Args:
+        x (np.ndarray): Abscissas of the breakpoints of shape (n_breakpoints,)
+        y (np.ndarray): Membership values of the breakpoints of shape (..., n_breakpoints)
+
+    Returns:
+        np.ndarray: Segment areas of shape (..., n_breakpoints - 1)
+    """
+    return np.diff(x) * (y[..., :-1] + y[..., 1:]) / 2
+
+
+def piecewise_linear_centroid(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Exact centroid of piecewise linear membership functions given by their breakpoints.
+
+    Args:
+        x (np.ndarray): Abscissas of the breakpoints of shape (n_breakpoints,)
+        y (np.ndarray): Membership values of the breakpoints of shape (..., n_breakpoints)
+
+    Returns:
+        np.ndarray: Centroids of shape (...)
+    """
+    x0, x1, y0, y1 = x[:-1], x[1:], y[..., :-1], y[..., 1:]
+
+    # Integral of x * y over every segment on which y is linear
+    numerator = np.sum((x1 - x0) * (x0 * (2 * y0 + y1) + x1 * (y0 + 2 * y1)), axis=-1) / 6
+    denominator = np.sum(segment_areas(x, y), axis=-1)
+
+    # Avoid division by zero
+    if np.any(denominator == 0):
+        raise ValueError("The membership function has an area of zero, cannot compute COA.")
+
+    return numerator / denominator
+
+
+def piecewise_linear_bisector(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Exact bisector of area of piecewise linear membership functions given by their breakpoints.
+
+    Args:
+        x (np.ndarray): Abscissas of the breakpoints of shape (n_breakpoints,)
+        y (np.ndarray): Membership values of the breakpoints of shape (..., n_breakpoints)
+
+    Returns:
+        np.ndarray: Bisectors of shape (...)
+    """
+    cumulative_area = np.cumsum(segment_areas(x, y), axis=-1)
+    half_area = cumulative_area[..., -1:] / 2
+
+    # If total area is zero, raise an error
+    if np.any(half_area == 0):
+        raise ValueError("The membership function has an area of zero, cannot compute BOA.")
+
+    # Segment in which the cumulative area reaches half of the total area
+    segment = np.sum(cumulative_area < half_area, axis=-1, keepdims=True)
+    remaining_area = (
+        half_area
+        - np.take_along_axis(cumulative_area, segment, axis=-1)
+        + np.take_along_axis(segment_areas(x, y), segment, axis=-1)
+    )
+    x0, x1 = x[segment], x[segment + 1]
+    y0, y1 = np.take_along_axis(y, segment, axis=-1), np.take_along_axis(y, segment + 1, axis=-1)
+
+    # Solve y0 * t + slope * t^2 / 2 = remaining_area for the offset t into the segment, in a stable form
+    slope = (y1 - y0) / (x1 - x0)
+    offset = 2 * remaining_area / (y0 + np.sqrt(np.maximum(y0**2 + 2 * slope * remaining_area, 0)))
+
+    return (x0 + offset)[..., 0]
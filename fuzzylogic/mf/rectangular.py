@@ -1,11 +1,13 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.dtype import result_dtype
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
 
 
 @dataclass
@@ -34,4 +36,32 @@ class Rectangular(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return np.logical_and(x >= self.low, x <= self.high).astype(float)
+        return self.formula(x, self.low, self.high)
+
+    @staticmethod
+    def formula(x: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            low (np.ndarray): low parameter
+            high (np.ndarray): high parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return np.logical_and(x >= low, x <= high).astype(result_dtype(x))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return self.low, self.high
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.low, self.high
@@ -1,11 +1,12 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import EMPTY, SUPPORT_TOLERANCE, UNBOUNDED, MembershipFunction1D
 
 
 @dataclass
@@ -27,4 +28,39 @@ class Sigmoid(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return 1 / (1 + np.exp(-self.center_slope * (x - self.center)))
+        return self.formula(x, self.center_slope, self.center)
+
+    @staticmethod
+    def formula(x: np.ndarray, center_slope: np.ndarray, center: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            center_slope (np.ndarray): center_slope parameter
+            center (np.ndarray): center parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return 1 / (1 + np.exp(-center_slope * (x - center)))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is below tolerance.
+        """
+        if tolerance <= 0 or self.center_slope == 0:
+            return UNBOUNDED
+        if tolerance >= 1:
+            return EMPTY
+
+        # 1 / (1 + exp(-slope * (x - center))) >= tolerance for slope * (x - center) >= log(tolerance / (1 - tolerance))
+        bound = self.center + np.log(tolerance / (1 - tolerance)) / self.center_slope
+        return (bound, np.inf) if self.center_slope > 0 else (-np.inf, bound)
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one, which is empty as the sigmoid never reaches one.
+        """
+        return EMPTY
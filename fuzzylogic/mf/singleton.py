@@ -1,12 +1,13 @@
 # standard libraries
 from dataclasses import dataclass
-from typing import Union
+from typing import Tuple, Union
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.dtype import result_dtype
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
 
 
 @dataclass
@@ -36,4 +37,18 @@ class FuzzySingleton(MembershipFunction1D):
             np.ndarray: Membership function evaluated at x.
         """
 
-        return np.where(x == self.value, 1, 0)
+        dtype = result_dtype(x)
+
+        return np.where(x == self.value, dtype.type(1), dtype.type(0))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return self.value, self.value
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.value, self.value
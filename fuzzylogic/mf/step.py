@@ -1,11 +1,13 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.dtype import result_dtype
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
 
 
 @dataclass
@@ -26,4 +28,33 @@ class Step(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return np.where(x < self.limit, 0, 1)
+        return self.formula(x, self.limit)
+
+    @staticmethod
+    def formula(x: np.ndarray, limit: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            limit (np.ndarray): limit parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        dtype = result_dtype(x)
+
+        return np.where(x < limit, dtype.type(0), dtype.type(1))
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return self.limit, np.inf
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.limit, np.inf
@@ -1,11 +1,12 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
 
 
 @dataclass
@@ -40,6 +41,34 @@ class Trapezoid(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return np.maximum(
-            np.minimum(np.minimum((x - self.a) / (self.b - self.a), (self.d - x) / (self.d - self.c)), 1), 0
-        )
+        return self.formula(x, self.a, self.b, self.c, self.d)
+
+    @staticmethod
+    def formula(x: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            a (np.ndarray): a parameter
+            b (np.ndarray): b parameter
+            c (np.ndarray): c parameter
+            d (np.ndarray): d parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return np.maximum(np.minimum(np.minimum((x - a) / (b - a), (d - x) / (d - c)), 1), 0)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return self.a, self.d
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.b, self.c
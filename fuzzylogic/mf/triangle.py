@@ -1,11 +1,12 @@
 # standard libraries
 from dataclasses import dataclass
+from typing import Tuple
 
 # third party libraries
 import numpy as np
 
 # fuzzy logic libraries
-from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
 
 
 @dataclass
@@ -39,4 +40,33 @@ class Triangle(MembershipFunction1D):
         Returns:
             np.ndarray: membership values
         """
-        return np.maximum(np.minimum((x - self.a) / (self.b - self.a), (self.c - x) / (self.c - self.b)), 0)
+        return self.formula(x, self.a, self.b, self.c)
+
+    @staticmethod
+    def formula(x: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the family formula at x, with parameters that broadcast against x, e.g. the parameter arrays of a
+        bank of membership functions.
+
+        Args:
+            x (np.ndarray): observations
+            a (np.ndarray): a parameter
+            b (np.ndarray): b parameter
+            c (np.ndarray): c parameter
+
+        Returns:
+            np.ndarray: membership values
+        """
+        return np.maximum(np.minimum((x - a) / (b - a), (c - x) / (c - b)), 0)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        """
+        Closed interval outside of which the membership function is zero.
+        """
+        return self.a, self.c
+
+    def core(self) -> Tuple[float, float]:
+        """
+        Closed interval on which the membership function is one.
+        """
+        return self.b, self.b
@@ -0,0 +1,178 @@
+# standard libraries
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.engine import FuzzyEngine
+
+# Number of shards per worker, more shards balance the load when shards take uneven time
+SHARDS_PER_WORKER = 4
+
+# Engine, universe and shared buffers of a worker process
+_worker_state: Dict[str, object] = {}
+
+
+def _attach(name: str, shape: Tuple[int, ...]) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Attaches to a shared memory buffer created by the parent process.
+
+    Args:
+        name (str): Name of the shared memory block
+        shape (Tuple[int, ...]): Shape of the float64 array stored in the block
+
+    Returns:
+        Tuple[shared_memory.SharedMemory, np.ndarray]: Shared memory block and the array view on it
+    """
+
+    buffer = shared_memory.SharedMemory(name=name)
+
+    return buffer, np.ndarray(shape, dtype=np.float64, buffer=buffer.buf)
+
+
+def _init_worker(
+    engine: FuzzyEngine,
+    x: np.ndarray,
+    inputs_name: str,
+    inputs_shape: Tuple[int, ...],
+    outputs_name: str,
+    outputs_shape: Tuple[int, ...],
+):
+    """
+    Initializes a worker process with the engine and views on the shared input and output buffers.
+    """
+
+    inputs_buffer, inputs = _attach(inputs_name, inputs_shape)
+    outputs_buffer, outputs = _attach(outputs_name, outputs_shape)
+
+    _worker_state.update(
+        engine=engine,
+        x=x,
+        inputs=inputs,
+        outputs=outputs,
+        buffers=(inputs_buffer, outputs_buffer),
+    )
+
+
+def _infer_shard(start: int, stop: int):
+    """
+    Performs inference on one shard of the shared inputs and writes it to the shared outputs.
+    """
+
+    outputs = _worker_state["outputs"]
+    outputs[start:stop] = _worker_state["engine"].infer_batch(_worker_state["inputs"][start:stop], _worker_state["x"])
+
+
+def _iter_shards(n_rows: int, n_workers: int, shard_size: Optional[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Splits the rows into shards.
+
+    Args:
+        n_rows (int): Number of rows
+        n_workers (int): Number of workers
+        shard_size (Optional[int]): Number of rows per shard, None to give each worker SHARDS_PER_WORKER shards
+
+    Yields:
+        Tuple[int, int]: Start and stop row of the shard
+    """
+
+    if shard_size is None:
+        shard_size = -(-n_rows // (n_workers * SHARDS_PER_WORKER))
+
+    for start in range(0, n_rows, max(1, shard_size)):
+        yield start, min(start + shard_size, n_rows)
+
+
+def _wait(executor: Executor, fn: Callable[[int, int], None], shards: List[Tuple[int, int]]):
+    """
+    Submits every shard to the executor and waits for them, raising the first error.
+    """
+
+    futures = [executor.submit(fn, start, stop) for start, stop in shards]
+    for future in futures:
+        future.result()
+
+
+def parallel_infer_batch(
+    engine: FuzzyEngine,
+    inputs: np.ndarray,
+    x: np.ndarray,
+    n_workers: Optional[int] = None,
+    backend: str = "process",
+    shard_size: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> np.ndarray:
+    """
+    Performs batched inference with a pool of workers.
+
+    The inputs are split into shards that the workers infer independently and write back in place, so the outputs
+    keep the order of the inputs. The process backend copies the inputs once into a shared memory buffer and the
+    workers write into a shared output buffer, only the engine is pickled, once per worker. The thread backend shares
+    the arrays directly and scales when the engine spends its time in NumPy routines that release the GIL.
+
+    Args:
+        engine (FuzzyEngine): Fuzzy inference engine
+        inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+        x (np.ndarray): Universe of discourse
+        n_workers (Optional[int], optional): Number of workers. Defaults to the number of CPUs.
+        backend (str, optional): "process" or "thread". Defaults to "process".
+        shard_size (Optional[int], optional): Number of rows per shard. Defaults to None.
+        mp_context (Optional[BaseContext], optional): Multiprocessing context of the process backend.
+            Defaults to None.
+
+    Returns:
+        np.ndarray: Crisp output values of shape (n_samples,)
+    """
+
+    if backend not in ("process", "thread"):
+        raise ValueError(f"The backend must be 'process' or 'thread'. Got {backend}.")
+
+    inputs = np.asarray(inputs, dtype=np.float64)
+    if inputs.ndim != 2:
+        raise ValueError(f"Expected inputs to have shape (n_samples, n_inputs), but got {inputs.shape}")
+
+    n_workers = n_workers or os.cpu_count() or 1
+    shards = list(_iter_shards(len(inputs), n_workers, shard_size))
+
+    if backend == "thread":
+        outputs = np.empty(len(inputs))
+
+        def infer_shard(start: int, stop: int):
+            outputs[start:stop] = engine.infer_batch(inputs[start:stop], x)
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            _wait(executor, infer_shard, shards)
+
+        return outputs
+
+    inputs_buffer = shared_memory.SharedMemory(create=True, size=max(1, inputs.nbytes))
+    outputs_buffer = shared_memory.SharedMemory(create=True, size=max(1, len(inputs) * np.float64().itemsize))
+    shared_inputs = shared_outputs = None
+    try:
+        shared_inputs = np.ndarray(inputs.shape, dtype=np.float64, buffer=inputs_buffer.buf)
+        shared_inputs[:] = inputs
+        shared_outputs = np.ndarray((len(inputs),), dtype=np.float64, buffer=outputs_buffer.buf)
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(engine, x, inputs_buffer.name, inputs.shape, outputs_buffer.name, shared_outputs.shape),
+        ) as executor:
+            _wait(executor, _infer_shard, shards)
+
+        outputs = shared_outputs.copy()
+    finally:
+        # Release the views before closing the blocks
+        shared_inputs = shared_outputs = None
+        inputs_buffer.close()
+        inputs_buffer.unlink()
+        outputs_buffer.close()
+        outputs_buffer.unlink()
+
+    return outputs
@@ -0,0 +1,210 @@
+# standard libraries
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, Optional
+
+# third party libraries
+import numpy as np
+
+# Stages of the inference pipeline, in order
+STAGES = ("fuzzification", "rule_firing", "implication", "aggregation", "defuzzification")
+
+# Number of bins of the rule firing strength histograms
+DEFAULT_N_BINS = 10
+
+# Context of the stages of an inference that is not profiled
+_NOT_PROFILED = nullcontext()
+
+
+class InferenceProfiler:
+    """
+    Wall time and call counts of the stages of the inference pipeline and of every rule, with rule firing histograms.
+
+    The stages are recorded by MamdaniFuzzyEngine and FuzzyRule while the profiler is attached, see
+    MamdaniFuzzyEngine.profile. Without a profiler the pipeline only checks that none is attached.
+
+    - fuzzification: degrees of membership of the antecedents
+    - rule_firing: combination of the degrees of membership into the rule firing strengths
+    - implication: clipping of the consequents by the rule firing strengths, which batched inference fuses with
+      aggregation
+    - aggregation: evaluation of the aggregated consequents over the universe of discourse
+    - defuzzification: crisp outputs
+
+    Rules are timed one by one by evaluate only, batched inference evaluates every rule at once. The firing strength
+    histograms split (0, 1] into n_bins bins, a rule that does not fire counts as a sample but not in its histogram.
+    """
+
+    def __init__(self, n_rules: int, n_bins: int = DEFAULT_N_BINS):
+        """
+        Initialises an empty profile.
+
+        Args:
+            n_rules (int): Number of rules of the profiled engine
+            n_bins (int, optional): Number of bins of the firing strength histograms. Defaults to DEFAULT_N_BINS.
+        """
+
+        if n_bins < 1:
+            raise ValueError(f"Expected n_bins to be at least 1, but got {n_bins}")
+
+        self.n_rules = n_rules
+        self.n_bins = n_bins
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the recorded stages and rules.
+        """
+
+        with self._lock:
+            self.n_samples = 0
+            self.stage_calls = dict.fromkeys(STAGES, 0)
+            self.stage_times = dict.fromkeys(STAGES, 0.0)
+            self.rule_calls = np.zeros(self.n_rules, dtype=np.int64)
+            self.rule_times = np.zeros(self.n_rules)
+            self.rule_fired = np.zeros(self.n_rules, dtype=np.int64)
+            self.rule_histograms = np.zeros((self.n_rules, self.n_bins), dtype=np.int64)
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state of the profiler without its lock, e.g. to send the engine to worker processes.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+
+        return state
+
+    def __setstate__(self, state: dict):
+        """
+        Restores the state of the profiler with a new lock.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Times a stage of the inference pipeline.
+
+        Args:
+            name (str): Name of the stage, one of STAGES
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - start)
+
+    def record_stage(self, name: str, elapsed: float):
+        """
+        Records a call of a stage of the inference pipeline.
+
+        Args:
+            name (str): Name of the stage, one of STAGES
+            elapsed (float): Wall time of the call in seconds
+        """
+
+        if name not in self.stage_calls:
+            raise ValueError(f"Expected name to be one of {STAGES}, but got {name}")
+
+        with self._lock:
+            self.stage_calls[name] += 1
+            self.stage_times[name] += elapsed
+
+    def record_rule(self, idx: int, elapsed: float):
+        """
+        Records the evaluation of a rule for one crisp input.
+
+        Args:
+            idx (int): Index of the rule
+            elapsed (float): Wall time of the evaluation in seconds
+        """
+
+        with self._lock:
+            self.rule_calls[idx] += 1
+            self.rule_times[idx] += elapsed
+
+    def record_rule_strengths(self, rule_strengths: np.ndarray):
+        """
+        Records the firing strengths of every rule.
+
+        Args:
+            rule_strengths (np.ndarray): Rule firing strengths of shape (n_rules,) or (n_samples, n_rules)
+        """
+
+        rule_strengths = np.reshape(rule_strengths, (-1, self.n_rules))
+        samples, rules = np.nonzero(rule_strengths > 0)
+
+        # Bin k holds the firing strengths in (k / n_bins, (k + 1) / n_bins]
+        bins = np.clip(np.ceil(rule_strengths[samples, rules] * self.n_bins).astype(np.intp) - 1, 0, self.n_bins - 1)
+
+        with self._lock:
+            self.n_samples += len(rule_strengths)
+            self.rule_fired += np.bincount(rules, minlength=self.n_rules)
+            np.add.at(self.rule_histograms, (rules, bins), 1)
+
+    def dead_rules(self) -> np.ndarray:
+        """
+        Rules that did not fire for any recorded sample, candidates for pruning.
+
+        Returns:
+            np.ndarray: Indices of the rules that never fired
+        """
+
+        return np.flatnonzero(self.rule_fired == 0)
+
+    def as_dict(self) -> Dict[str, object]:
+        """
+        Exports the profile as built-in types.
+
+        Returns:
+            Dict[str, object]: Number of samples, histogram bin edges, calls and wall time of every stage, and calls,
+                wall time, firing count and firing strength histogram of every rule
+        """
+
+        with self._lock:
+            return {
+                "n_samples": self.n_samples,
+                "bin_edges": np.linspace(0, 1, self.n_bins + 1).tolist(),
+                "stages": {name: {"calls": self.stage_calls[name], "time": self.stage_times[name]} for name in STAGES},
+                "rules": [
+                    {
+                        "calls": int(self.rule_calls[idx]),
+                        "time": float(self.rule_times[idx]),
+                        "fired": int(self.rule_fired[idx]),
+                        "histogram": self.rule_histograms[idx].tolist(),
+                    }
+                    for idx in range(self.n_rules)
+                ],
+            }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Exports the profile as JSON.
+
+        Args:
+            **kwargs: Keyword arguments of json.dumps
+
+        Returns:
+            str: JSON document of as_dict
+        """
+
+        return json.dumps(self.as_dict(), **kwargs)
+
+
+def profile_stage(profiler: Optional[InferenceProfiler], name: str) -> ContextManager:
+    """
+    Times a stage of the inference pipeline with a profiler, does nothing without one.
+
+    Args:
+        profiler (Optional[InferenceProfiler]): Profiler, None if the inference is not profiled
+        name (str): Name of the stage, one of STAGES
+
+    Returns:
+        ContextManager: Context of the stage
+    """
+
+    return _NOT_PROFILED if profiler is None else profiler.stage(name)
@@ -0,0 +1,418 @@
+# standard libraries
+from dataclasses import astuple, dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import as_float_array, result_dtype
+from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.core.tconorm import TCoNorm
+from fuzzylogic.core.tnorm import TNorm
+from fuzzylogic.fuzzy_rule import SINGLETON_TNORMS, FuzzyRule
+from fuzzylogic.mf.bank import BANK_FAMILIES, BankedMF, MFBank
+
+# Largest fraction of samples for which a rule fires that is aggregated sample by sample rather than at once
+SPARSE_AGGREGATION_FRACTION = 0.5
+
+
+@dataclass
+class _TermTable:
+    """
+    Distinct membership functions evaluated on the same input, grouped into banks.
+    """
+
+    banks: List[MFBank]  # banks evaluated at once
+    bank_terms: List[Optional[np.ndarray]]  # terms of each bank used by the table, None for every term
+    bank_rows: List[np.ndarray]  # rows of the table filled by each bank
+    mfs: List[MembershipFunction1D]  # membership functions evaluated one by one
+    mf_rows: np.ndarray  # rows of the table filled by each membership function evaluated one by one
+    n_terms: int
+
+    @classmethod
+    def from_mfs(cls, mfs: List[MembershipFunction1D]) -> "_TermTable":
+        """
+        Groups distinct membership functions into banks.
+
+        Members of a user defined bank are evaluated with their bank, other membership functions of a bank family
+        are grouped into one bank per family.
+
+        Args:
+            mfs (List[MembershipFunction1D]): Distinct membership functions
+
+        Returns:
+            _TermTable: Term table
+        """
+
+        banked_rows: Dict[int, List[int]] = {}
+        family_rows: Dict[type, List[int]] = {}
+        other_rows = []
+        for row, mf in enumerate(mfs):
+            if isinstance(mf, BankedMF):
+                banked_rows.setdefault(id(mf.bank), []).append(row)
+            elif type(mf) in BANK_FAMILIES:
+                family_rows.setdefault(type(mf), []).append(row)
+            else:
+                other_rows.append(row)
+
+        banks, bank_terms, bank_rows = [], [], []
+        for rows in banked_rows.values():
+            banks.append(mfs[rows[0]].bank)
+            bank_terms.append(np.array([mfs[row].index for row in rows], dtype=np.intp))
+            bank_rows.append(np.array(rows, dtype=np.intp))
+        for rows in family_rows.values():
+            banks.append(MFBank.from_mfs([mfs[row] for row in rows]))
+            bank_terms.append(None)
+            bank_rows.append(np.array(rows, dtype=np.intp))
+
+        return cls(
+            banks=banks,
+            bank_terms=bank_terms,
+            bank_rows=bank_rows,
+            mfs=[mfs[row] for row in other_rows],
+            mf_rows=np.array(other_rows, dtype=np.intp),
+            n_terms=len(mfs),
+        )
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates every membership function of the table.
+
+        Args:
+            x (np.ndarray): Observations of shape (n_samples,)
+
+        Returns:
+            np.ndarray: Membership values of shape (n_terms, n_samples)
+        """
+
+        memberships = np.empty((self.n_terms, len(x)), dtype=result_dtype(x))
+
+        for bank, terms, rows in zip(self.banks, self.bank_terms, self.bank_rows):
+            memberships[rows] = bank(x) if terms is None else bank(x)[terms]
+
+        for mf, row in zip(self.mfs, self.mf_rows):
+            memberships[row] = mf(x)
+
+        return memberships
+
+
+def _index_distinct(mfs: List[MembershipFunction1D]) -> Tuple[List[MembershipFunction1D], np.ndarray]:
+    """
+    Deduplicates membership functions.
+
+    Membership functions of a bank family with equal parameters are merged, as are members of a bank with the same
+    index. Any other membership function is only merged with itself.
+
+    Args:
+        mfs (List[MembershipFunction1D]): Membership functions
+
+    Returns:
+        Tuple[List[MembershipFunction1D], np.ndarray]: Distinct membership functions and the index of each input
+    """
+
+    distinct: Dict[tuple, int] = {}
+    index = np.empty(len(mfs), dtype=np.intp)
+    for idx, mf in enumerate(mfs):
+        if isinstance(mf, BankedMF):
+            key = (BankedMF, id(mf.bank), mf.index)
+        elif type(mf) in BANK_FAMILIES:
+            key = (type(mf), astuple(mf))
+        else:
+            key = (id(mf),)
+        index[idx] = distinct.setdefault(key, len(distinct))
+
+    distinct_mfs = [None] * len(distinct)
+    for mf, term in zip(mfs, index):
+        distinct_mfs[term] = mf
+
+    return distinct_mfs, index
+
+
+def _operator_codes(operators: List[Union[TNorm, TCoNorm]], codes: Dict[type, int]) -> np.ndarray:
+    """
+    Encodes operators as indices into a table of operator classes.
+
+    Args:
+        operators (List[Union[TNorm, TCoNorm]]): Operators
+        codes (Dict[type, int]): Code of every operator class seen so far, updated in place
+
+    Returns:
+        np.ndarray: Code of every operator
+    """
+
+    return np.array([codes.setdefault(type(operator), len(codes)) for operator in operators], dtype=np.intp)
+
+
+class CompiledRuleBase:
+    """
+    Flat evaluation plan of a Mamdani rule base.
+
+    The antecedents of every input are stored as one table of distinct membership functions grouped into banks, the
+    consequents as one table of distinct membership functions, and the degree of membership, connective and
+    implication operators of every rule as integer codes into a table of operator classes. The plan is built once and
+    evaluates a batch of crisp inputs without allocating any membership function or rule object.
+    """
+
+    def __init__(self, rules: List[FuzzyRule], aggregate_operator: TCoNorm):
+        """
+        Compiles a rule base.
+
+        Args:
+            rules (List[FuzzyRule]): List of fuzzy rules
+            aggregate_operator (TCoNorm): Operator to aggregate fuzzy rules
+        """
+
+        # Check that every rule takes the same inputs
+        n_inputs = len(rules[0].antecedents)
+        if any(len(rule.antecedents) != n_inputs for rule in rules):
+            raise ValueError("Expected every rule to have the same number of antecedents.")
+
+        # Antecedent term tables, one per input
+        self.term_tables = []
+        self.term_index = np.empty((n_inputs, len(rules)), dtype=np.intp)
+        for idx in range(n_inputs):
+            distinct_mfs, self.term_index[idx] = _index_distinct([rule.antecedents[idx] for rule in rules])
+            self.term_tables.append(_TermTable.from_mfs(distinct_mfs))
+
+        # Consequent term table
+        distinct_mfs, self.consequent_index = _index_distinct([rule.consequent for rule in rules])
+        self.consequent_table = _TermTable.from_mfs(distinct_mfs)
+        self.consequent_supports = np.array([mf.support(0) for mf in distinct_mfs], dtype=np.float64)
+
+        # Operator codes
+        codes: Dict[type, int] = {}
+        self.dom_codes = _operator_codes([rule.dom_operator for rule in rules], codes)
+        self.implication_codes = _operator_codes([rule.implication_operator for rule in rules], codes)
+        self.connective_codes = np.empty((n_inputs - 1, len(rules)), dtype=np.intp)
+        for idx in range(n_inputs - 1):
+            connectives = []
+            for rule in rules:
+                if rule.operators[idx] == "and":
+                    connectives.append(rule.tnorm_operator)
+                elif rule.operators[idx] == "or":
+                    connectives.append(rule.tconorm_operator)
+                else:
+                    raise ValueError(
+                        f"Expected operator to be 'and' or 'or', but got {rule.operators[idx]} at index {idx}"
+                    )
+            self.connective_codes[idx] = _operator_codes(connectives, codes)
+
+        # Rules combining all their antecedents with one operator are reduced in one pass, as FuzzyRule does
+        self.reduction_codes = np.full(len(rules), -1, dtype=np.intp)
+        if n_inputs > 1:
+            for role, operator in (("and", "tnorm_operator"), ("or", "tconorm_operator")):
+                rules_idx = [idx for idx, rule in enumerate(rules) if all(op == role for op in rule.operators)]
+                if rules_idx:
+                    self.reduction_codes[rules_idx] = _operator_codes(
+                        [getattr(rules[idx], operator) for idx in rules_idx], codes
+                    )
+        self.operators = tuple(codes)
+        self.dom_is_membership = all(type(rule.dom_operator) in SINGLETON_TNORMS for rule in rules)
+
+        self.aggregate_operator = aggregate_operator
+        self.n_inputs = n_inputs
+        self.n_rules = len(rules)
+
+    def _apply(self, codes: np.ndarray, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the operator of every rule to its membership values.
+
+        Args:
+            codes (np.ndarray): Operator code of every rule of shape (n_rules,)
+            u1 (np.ndarray): Membership values of shape (n_rules, ...)
+            u2 (np.ndarray): Membership values of shape (n_rules, ...)
+
+        Returns:
+            np.ndarray: Combined membership values of shape (n_rules, ...)
+        """
+
+        # Most rule bases use a single operator per role
+        if np.all(codes == codes[0]):
+            return self.operators[codes[0]].apply(u1, u2)
+
+        u1, u2 = np.broadcast_arrays(u1, u2)
+        combined = np.empty(u1.shape, dtype=np.result_type(u1, u2))
+        for code in np.unique(codes):
+            rules = codes == code
+            combined[rules] = self.operators[code].apply(u1[rules], u2[rules])
+
+        return combined
+
+    def get_antecedent_doms(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the degree of membership of the antecedents of every rule for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Degrees of membership of shape (n_inputs, n_rules, n_samples)
+        """
+
+        # Assert inputs is a batch of crisp inputs
+        inputs = as_float_array(inputs)
+        if inputs.ndim != 2 or inputs.shape[1] != self.n_inputs:
+            raise ValueError(f"Expected inputs to have shape (n_samples, {self.n_inputs}), but got {inputs.shape}")
+
+        antecedent_doms = np.empty((self.n_inputs, self.n_rules, len(inputs)), dtype=inputs.dtype)
+        for idx, (term_table, x_i) in enumerate(zip(self.term_tables, inputs.T)):
+            # Evaluate every distinct term once and gather the terms of every rule
+            memberships = term_table(x_i)[self.term_index[idx]]
+
+            # A fuzzy singleton evaluates to one at its own crisp value
+            if self.dom_is_membership:
+                antecedent_doms[idx] = memberships
+            else:
+                antecedent_doms[idx] = self._apply(self.dom_codes, np.ones(1, dtype=inputs.dtype), memberships)
+
+        return antecedent_doms
+
+    def get_rule_strengths(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the firing strength of every rule for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Rule firing strengths of shape (n_samples, n_rules)
+        """
+
+        return self.combine_antecedent_doms(self.get_antecedent_doms(inputs))
+
+    def combine_antecedent_doms(self, antecedent_doms: np.ndarray) -> np.ndarray:
+        """
+        Combines the degrees of membership of the antecedents into the firing strength of every rule.
+
+        Args:
+            antecedent_doms (np.ndarray): Degrees of membership of shape (n_inputs, n_rules, n_samples)
+
+        Returns:
+            np.ndarray: Rule firing strengths of shape (n_samples, n_rules)
+        """
+
+        reduced_codes = np.unique(self.reduction_codes)
+
+        # Most rule bases combine every antecedent of every rule with the same operator
+        if len(reduced_codes) == 1 and reduced_codes[0] >= 0:
+            return self.operators[reduced_codes[0]].apply_many(antecedent_doms).T
+
+        # Combine the antecedents of every rule from left to right
+        rule_strengths = antecedent_doms[0]
+        for idx, codes in enumerate(self.connective_codes):
+            rule_strengths = self._apply(codes, rule_strengths, antecedent_doms[idx + 1])
+
+        # Reduce the antecedents of the rules with a single operator in one pass
+        for code in reduced_codes[reduced_codes >= 0]:
+            rules = self.reduction_codes == code
+            rule_strengths[rules] = self.operators[code].apply_many(antecedent_doms[:, rules])
+
+        return rule_strengths.T
+
+    def aggregate(self, rule_strengths: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Aggregates the clipped consequents of every rule over the universe of discourse.
+
+        Args:
+            rule_strengths (np.ndarray): Rule firing strengths of shape (n_samples, n_rules)
+            x (np.ndarray): Universe of discourse of shape (n_universe,)
+
+        Returns:
+            np.ndarray: Aggregated membership values of shape (n_samples, n_universe)
+        """
+
+        # Evaluate every distinct consequent once
+        x = as_float_array(x)
+        consequents = self.consequent_table(x)
+        slices = support_slices(self.consequent_supports, x)
+
+        return aggregate_clipped_consequents(
+            rule_strengths,
+            [consequents[idx] for idx in self.consequent_index],
+            [self.operators[code] for code in self.implication_codes],
+            self.aggregate_operator,
+            [slices[idx] for idx in self.consequent_index],
+        )
+
+
+def support_slices(supports: np.ndarray, x: np.ndarray) -> List[slice]:
+    """
+    Slices of the universe of discourse that hold the support of membership functions.
+
+    Args:
+        supports (np.ndarray): Closed supports of the membership functions of shape (n_mfs, 2)
+        x (np.ndarray): Universe of discourse of shape (n_universe,)
+
+    Returns:
+        List[slice]: Slice of x outside of which each membership function is zero, the whole universe if x is not
+            sorted
+    """
+
+    if np.any(np.diff(x) < 0):
+        return [slice(None)] * len(supports)
+
+    starts = np.searchsorted(x, supports[:, 0], side="left")
+    stops = np.searchsorted(x, supports[:, 1], side="right")
+
+    return [slice(start, max(start, stop)) for start, stop in zip(starts.tolist(), stops.tolist())]
+
+
+def aggregate_clipped_consequents(
+    rule_strengths: np.ndarray,
+    consequents: List[np.ndarray],
+    implication_operators: List[type],
+    aggregate_operator: TCoNorm,
+    support_slices: Optional[List[slice]] = None,
+) -> np.ndarray:
+    """
+    Clips the consequent of every rule and folds it into the aggregate in rule order.
+
+    A consequent clipped by a T-Norm is zero where its rule does not fire, and any T-CoNorm with a zero leaves the
+    aggregate unchanged, so such rules are only aggregated on the samples for which they fire when few do, and only
+    on the slice of the universe that holds the support of their consequent.
+
+    Args:
+        rule_strengths (np.ndarray): Rule firing strengths of shape (n_samples, n_rules)
+        consequents (List[np.ndarray]): Consequent membership values of every rule of shape (n_universe,)
+        implication_operators (List[type]): Implication operator class of every rule
+        aggregate_operator (TCoNorm): Operator to aggregate fuzzy rules
+        support_slices (Optional[List[slice]], optional): Slice of the universe outside of which the consequent of
+            every rule is zero. Defaults to None.
+
+    Returns:
+        np.ndarray: Aggregated membership values of shape (n_samples, n_universe)
+    """
+
+    if support_slices is None:
+        support_slices = [slice(None)] * len(consequents)
+
+    aggregated_mf = None
+    for idx, (consequent, implication_operator, columns) in enumerate(
+        zip(consequents, implication_operators, support_slices)
+    ):
+        strengths = rule_strengths[:, idx, np.newaxis]
+
+        if aggregated_mf is not None and issubclass(implication_operator, TNorm):
+            # Only aggregate the samples for which the rule fires, on the support of the consequent
+            consequent = consequent[columns]
+            active = np.flatnonzero(strengths[:, 0] > 0)
+            if len(active) <= SPARSE_AGGREGATION_FRACTION * len(strengths):
+                if len(active) > 0:
+                    clipped_consequent_mf = implication_operator.apply(strengths[active], consequent[np.newaxis, :])
+                    aggregated_mf[active, columns] = aggregate_operator.apply(
+                        aggregated_mf[active, columns], clipped_consequent_mf
+                    )
+            else:
+                clipped_consequent_mf = implication_operator.apply(strengths, consequent[np.newaxis, :])
+                aggregated_mf[:, columns] = aggregate_operator.apply(aggregated_mf[:, columns], clipped_consequent_mf)
+            continue
+
+        clipped_consequent_mf = implication_operator.apply(strengths, consequent[np.newaxis, :])
+
+        if aggregated_mf is None:
+            aggregated_mf = clipped_consequent_mf
+        else:
+            aggregated_mf = aggregate_operator.apply(aggregated_mf, clipped_consequent_mf)
+
+    return aggregated_mf
@@ -0,0 +1,124 @@
+# standard libraries
+from typing import List
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.fuzzy_rule import FuzzyRule
+
+
+class _InputIndex:
+    """
+    Rules whose antecedent support covers each elementary interval of one input.
+    """
+
+    def __init__(self, supports: np.ndarray):
+        """
+        Builds the index of one input.
+
+        Args:
+            supports (np.ndarray): Closed support of the antecedent of every rule of shape (n_rules, 2)
+        """
+
+        # Sorted bounds split the input into slots: slot 2 * i + 1 is the bound i itself and slot 2 * i is the open
+        # interval between the bounds i - 1 and i
+        bounds = np.unique(supports[np.isfinite(supports)])
+        lows, highs = supports[:, 0], supports[:, 1]
+
+        covers = np.empty((2 * len(bounds) + 1, len(supports)), dtype=bool)
+        covers[1::2] = (lows <= bounds[:, np.newaxis]) & (bounds[:, np.newaxis] <= highs)
+        interval_lows = np.r_[-np.inf, bounds]
+        interval_highs = np.r_[bounds, np.inf]
+        covers[0::2] = (lows <= interval_lows[:, np.newaxis]) & (interval_highs[:, np.newaxis] <= highs)
+
+        self.bounds = bounds
+        self.covers = covers
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Looks up the rules whose antecedent support contains x.
+
+        Args:
+            x (np.ndarray): Crisp inputs of shape (n_samples,)
+
+        Returns:
+            np.ndarray: Candidate mask of shape (n_samples, n_rules)
+        """
+
+        idx = np.searchsorted(self.bounds, x, side="left")
+        on_bound = np.zeros(len(x), dtype=bool)
+        inside = idx < len(self.bounds)
+        on_bound[inside] = self.bounds[idx[inside]] == x[inside]
+
+        return self.covers[2 * idx + on_bound]
+
+
+class RuleIndex:
+    """
+    Index of the rules that can fire for a crisp input.
+
+    A rule that combines its antecedents with the AND operator fires only where every antecedent is non-zero, since
+    any T-Norm with a zero is zero. The index stores, for every input, which rules have an antecedent support covering
+    each interval between the bounds of the exact antecedent supports, so that a lookup costs a binary search per
+    input. Rules with OR operators are always candidates, as are antecedents without bounded support.
+    """
+
+    def __init__(self, rules: List[FuzzyRule]):
+        """
+        Builds the index of a rule base.
+
+        Args:
+            rules (List[FuzzyRule]): List of fuzzy rules
+        """
+
+        # Check that every rule takes the same inputs
+        n_inputs = len(rules[0].antecedents)
+        if any(len(rule.antecedents) != n_inputs for rule in rules):
+            raise ValueError("Expected every rule to have the same number of antecedents.")
+
+        supports = np.empty((n_inputs, len(rules), 2))
+        for idx, rule in enumerate(rules):
+            if all(operator == "and" for operator in rule.operators):
+                supports[:, idx] = [antecedent.support(0) for antecedent in rule.antecedents]
+            else:
+                supports[:, idx] = [-np.inf, np.inf]
+
+        self.input_indexes = [_InputIndex(input_supports) for input_supports in supports]
+        self.n_inputs = n_inputs
+        self.n_rules = len(rules)
+
+    def candidates(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Looks up the rules that can fire for a batch of crisp inputs.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_samples, n_inputs)
+
+        Returns:
+            np.ndarray: Candidate mask of shape (n_samples, n_rules), False where the rule firing strength is zero
+        """
+
+        # Assert inputs is a batch of crisp inputs
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.ndim != 2 or inputs.shape[1] != self.n_inputs:
+            raise ValueError(f"Expected inputs to have shape (n_samples, {self.n_inputs}), but got {inputs.shape}")
+
+        mask = self.input_indexes[0](inputs[:, 0])
+        for input_index, x_i in zip(self.input_indexes[1:], inputs.T[1:]):
+            mask = mask & input_index(x_i)
+
+        return mask
+
+    def candidate_rules(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Looks up the rules that can fire for a crisp input.
+
+        Args:
+            inputs (np.ndarray): Crisp input values of shape (n_inputs,)
+
+        Returns:
+            np.ndarray: Indices of the candidate rules
+        """
+
+        return np.flatnonzero(self.candidates(np.reshape(inputs, (1, -1)))[0])
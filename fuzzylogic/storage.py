@@ -0,0 +1,190 @@
+# standard libraries
+import os
+import struct
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+# third party libraries
+import numpy as np
+
+# fuzzy logic libraries
+from fuzzylogic.core.engine import FuzzyEngine
+
+# Size and layout of the local file header of a zip member, followed by its file name and extra field
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_FORMAT = "<4s5H3L2H"
+
+
+def save_npz(path: Union[str, os.PathLike], **arrays: np.ndarray):
+    """
+    Saves arrays to an uncompressed .npz file whose members can be memory mapped by load_npz.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the .npz file
+        **arrays (np.ndarray): Arrays to save by name
+    """
+
+    # Members are stored uncompressed, so that their bytes are contiguous in the file
+    np.savez(path, **arrays)
+
+
+def load_npz(path: Union[str, os.PathLike], mmap_mode: Optional[str] = "r") -> Dict[str, np.ndarray]:
+    """
+    Loads the arrays of an uncompressed .npz file.
+
+    Unlike np.load, the arrays are memory mapped from the .npz file, so that loading does not copy them and every
+    process that maps the file shares one copy in the page cache.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the .npz file
+        mmap_mode (Optional[str], optional): Memory map mode of np.memmap, None to read the arrays into memory.
+            Defaults to "r".
+
+    Returns:
+        Dict[str, np.ndarray]: Arrays by name
+    """
+
+    if mmap_mode is None:
+        with np.load(path) as npz:
+            return {name: npz[name] for name in npz.files}
+
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Cannot memory map the compressed member {info.filename} of {path}")
+
+            # The data of a member follows its local header, file name and extra field
+            file.seek(info.header_offset)
+            local_header = struct.unpack(_LOCAL_HEADER_FORMAT, file.read(_LOCAL_HEADER_SIZE))
+            file.seek(info.header_offset + _LOCAL_HEADER_SIZE + local_header[-2] + local_header[-1])
+
+            # Parse the .npy header of the member
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            else:
+                raise ValueError(f"Unsupported .npy format version {version} of member {info.filename} of {path}")
+
+            name = info.filename[: -len(".npy")] if info.filename.endswith(".npy") else info.filename
+            if dtype.hasobject:
+                raise ValueError(f"Cannot memory map the object array {name} of {path}")
+            # Empty and scalar arrays cannot be memory mapped
+            if 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+                continue
+            if not shape:
+                arrays[name] = np.fromfile(file, dtype=dtype, count=1).reshape(shape)
+                continue
+
+            arrays[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode=mmap_mode,
+                shape=shape,
+                order="F" if fortran_order else "C",
+                offset=file.tell(),
+            )
+
+    return arrays
+
+
+@dataclass(eq=False)
+class ControlSurface:
+    """
+    Fuzzy control surface with the antecedent ranges it was calculated on and the fingerprint of its engine.
+    """
+
+    values: np.ndarray  # fuzzy control surface
+    antecedent_ranges: List[np.ndarray]  # antecedent ranges of the meshgrid
+    fingerprint: str  # fingerprint of the fuzzy inference engine and universe of discourse
+    indexing: str = "xy"  # meshgrid indexing of the antecedent ranges
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: FuzzyEngine,
+        antecedent_ranges: List[np.ndarray],
+        x: Optional[np.ndarray] = None,
+        indexing: str = "xy",
+    ) -> "ControlSurface":
+        """
+        Calculates the control surface of a fuzzy inference engine.
+
+        Args:
+            engine (FuzzyEngine): Fuzzy inference engine
+            antecedent_ranges (List[np.ndarray]): List of numpy arrays containing the antecedent ranges
+            x (Optional[np.ndarray], optional): Universe of discourse of the output variable. Defaults to None.
+            indexing (str, optional): Meshgrid indexing of the antecedent ranges. Defaults to "xy".
+
+        Returns:
+            ControlSurface: Control surface
+        """
+
+        return cls(
+            values=engine.calculate_fuzzy_control_surface(antecedent_ranges, x=x, indexing=indexing),
+            antecedent_ranges=[np.asarray(range_) for range_ in antecedent_ranges],
+            fingerprint=engine.fingerprint(x),
+            indexing=indexing,
+        )
+
+    def save(self, path: Union[str, os.PathLike]):
+        """
+        Saves the control surface to an uncompressed .npz file that load memory maps.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the .npz file
+        """
+
+        save_npz(
+            path,
+            values=self.values,
+            fingerprint=np.array(self.fingerprint),
+            indexing=np.array(self.indexing),
+            **{f"antecedent_range_{idx}": range_ for idx, range_ in enumerate(self.antecedent_ranges)},
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, os.PathLike],
+        fingerprint: Optional[str] = None,
+        antecedent_ranges: Optional[List[np.ndarray]] = None,
+        mmap_mode: Optional[str] = "r",
+    ) -> "ControlSurface":
+        """
+        Loads a control surface saved by save, memory mapping its values.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the .npz file
+            fingerprint (Optional[str], optional): Expected fingerprint of the engine. Defaults to None.
+            antecedent_ranges (Optional[List[np.ndarray]], optional): Expected antecedent ranges. Defaults to None.
+            mmap_mode (Optional[str], optional): Memory map mode of the values, None to read them into memory.
+                Defaults to "r".
+
+        Returns:
+            ControlSurface: Control surface
+        """
+
+        arrays = load_npz(path, mmap_mode=mmap_mode)
+        n_inputs = sum(name.startswith("antecedent_range_") for name in arrays)
+        surface = cls(
+            values=arrays["values"],
+            antecedent_ranges=[np.array(arrays[f"antecedent_range_{idx}"]) for idx in range(n_inputs)],
+            fingerprint=str(arrays["fingerprint"]),
+            indexing=str(arrays["indexing"]),
+        )
+
+        # Check that the surface was calculated by the same engine on the same grid
+        if fingerprint is not None and surface.fingerprint != fingerprint:
+            raise ValueError(f"The control surface {path} is stale, it was calculated by another engine.")
+        if antecedent_ranges is not None and (
+            len(antecedent_ranges) != n_inputs
+            or not all(np.array_equal(a, b) for a, b in zip(antecedent_ranges, surface.antecedent_ranges))
+        ):
+            raise ValueError(f"The control surface {path} was calculated on other antecedent ranges.")
+
+        return surface
@@ -0,0 +1,128 @@
+# standard libraries
+import os
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+# third party libraries
+import numpy as np
+from numpy.typing import DTypeLike
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import DEFAULT_DTYPE, float_dtype
+
+# Number of crisp inputs inferred at once by streaming inference
+DEFAULT_BATCH_SIZE = 4096
+
+
+def iter_batches(
+    source: Iterable, batch_size: int = DEFAULT_BATCH_SIZE, dtype: DTypeLike = DEFAULT_DTYPE
+) -> Iterator[np.ndarray]:
+    """
+    Regroups a stream of crisp inputs into batches of batch_size rows.
+
+    The stream may mix single inputs, i.e. scalars or rows of shape (n_inputs,), and chunks of shape
+    (n_rows, n_inputs), e.g. the chunks of read_csv_chunks. Only the rows of one batch and of the chunk being split are
+    held in memory at a time.
+
+    Args:
+        source (Iterable): Stream of crisp inputs or chunks of crisp inputs
+        batch_size (int, optional): Number of rows per batch. Defaults to DEFAULT_BATCH_SIZE.
+        dtype (DTypeLike, optional): Floating point type of the batches. Defaults to DEFAULT_DTYPE.
+
+    Yields:
+        np.ndarray: Crisp input values of shape (batch_size, n_inputs), the last batch may be smaller
+    """
+
+    if batch_size < 1:
+        raise ValueError(f"Expected batch_size to be at least 1, but got {batch_size}")
+    dtype = float_dtype(dtype)
+
+    pending: List[np.ndarray] = []
+    n_pending = 0
+    n_inputs = None
+
+    for item in source:
+        chunk = np.asarray(item, dtype=dtype)
+        if chunk.ndim < 2:
+            chunk = chunk.reshape(1, -1)
+        if chunk.ndim != 2 or (n_inputs is not None and chunk.shape[1] != n_inputs):
+            raise ValueError(f"Expected rows of {n_inputs or 'n_inputs'} crisp inputs, but got shape {chunk.shape}")
+        n_inputs = chunk.shape[1]
+
+        pending.append(chunk)
+        n_pending += len(chunk)
+        if n_pending < batch_size:
+            continue
+
+        # Split the pending rows into full batches and keep the remainder for the next batch
+        rows = np.concatenate(pending) if len(pending) > 1 else pending[0]
+        n_full = n_pending - n_pending % batch_size
+        for start in range(0, n_full, batch_size):
+            yield rows[start : start + batch_size]
+        pending = [rows[n_full:]] if n_full < n_pending else []
+        n_pending -= n_full
+
+    if n_pending:
+        yield np.concatenate(pending) if len(pending) > 1 else pending[0]
+
+
+def read_csv_chunks(
+    path: Union[str, os.PathLike],
+    chunk_size: int = DEFAULT_BATCH_SIZE,
+    delimiter: str = ",",
+    skip_header: int = 0,
+    usecols: Optional[Sequence[int]] = None,
+) -> Iterator[np.ndarray]:
+    """
+    Reads the crisp inputs of a CSV file chunk by chunk, without loading the whole file.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the CSV file
+        chunk_size (int, optional): Number of lines per chunk. Defaults to DEFAULT_BATCH_SIZE.
+        delimiter (str, optional): Delimiter of the columns. Defaults to ",".
+        skip_header (int, optional): Number of header lines to skip. Defaults to 0.
+        usecols (Optional[Sequence[int]], optional): Columns of the crisp inputs, None for every column.
+            Defaults to None.
+
+    Yields:
+        np.ndarray: Crisp input values of shape (n_rows, n_inputs)
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"Expected chunk_size to be at least 1, but got {chunk_size}")
+
+    with open(path) as file:
+        for _ in islice(file, skip_header):
+            pass
+
+        while lines := list(islice(file, chunk_size)):
+            # Skip chunks of blank lines, e.g. at the end of the file
+            if any(line.strip() for line in lines):
+                yield np.loadtxt(lines, delimiter=delimiter, usecols=usecols, ndmin=2)
+
+
+def read_npy_chunks(path: Union[str, os.PathLike], chunk_size: int = DEFAULT_BATCH_SIZE) -> Iterator[np.ndarray]:
+    """
+    Reads the crisp inputs of a .npy file chunk by chunk from a memory map, without loading the whole file.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of a .npy file of shape (n_samples, n_inputs), or (n_samples,) for a
+            single input
+        chunk_size (int, optional): Number of rows per chunk. Defaults to DEFAULT_BATCH_SIZE.
+
+    Yields:
+        np.ndarray: Crisp input values of shape (n_rows, n_inputs)
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"Expected chunk_size to be at least 1, but got {chunk_size}")
+
+    inputs = np.load(path, mmap_mode="r")
+    if inputs.ndim == 1:
+        inputs = inputs[:, np.newaxis]
+    if inputs.ndim != 2:
+        raise ValueError(f"Expected inputs to have shape (n_samples, n_inputs), but got {inputs.shape}")
+
+    # Copy every chunk out of the memory map, so that only the pages of the current chunk are read
+    for start in range(0, len(inputs), chunk_size):
+        yield np.array(inputs[start : start + chunk_size], dtype=np.float64)
@@ -4,6 +4,7 @@ import numpy as np
 # fuzzy logic libraries
 from fuzzylogic.core.mf import MembershipFunction1D
 from fuzzylogic.core.tconorm import TCoNorm
+from fuzzylogic.mf.composite import CombinedMF
 
 
 class MaximumTCoNorm(TCoNorm):
@@ -17,19 +18,23 @@ class MaximumTCoNorm(TCoNorm):
         Transforms the membership function.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the maximum operator elementwise to membership values.
+        """
+
+        return np.maximum(u1, u2)
 
-                return np.maximum(mf1(x), mf2(x))
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the maximum operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        return np.max(memberships, axis=0)
 
 
 class AlgebraicSumTCoNorm(TCoNorm):
@@ -43,19 +48,23 @@ class AlgebraicSumTCoNorm(TCoNorm):
         Transforms the membership function.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the algebraic sum operator elementwise to membership values.
+        """
+
+        return u1 + u2 - u1 * u2
 
-                return mf1(x) + mf2(x) - mf1(x) * mf2(x)
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the algebraic sum operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        return 1 - np.prod(1 - memberships, axis=0)
 
 
 class BoundedSumTCoNorm(TCoNorm):
@@ -69,19 +78,23 @@ class BoundedSumTCoNorm(TCoNorm):
         Transforms the membership function.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the bounded sum operator elementwise to membership values.
+        """
+
+        return np.minimum(1, u1 + u2)
 
-                return np.minimum(1, mf1(x) + mf2(x))
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the bounded sum operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        return np.minimum(1, np.sum(memberships, axis=0))
 
 
 class DrasticSumTCoNorm(TCoNorm):
@@ -95,16 +108,21 @@ class DrasticSumTCoNorm(TCoNorm):
         Transforms the membership function.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the drastic sum operator elementwise to membership values.
+        """
+
+        return np.where(u1 == 0, u2, np.where(u2 == 0, u1, 1))
 
-                return np.where(mf1(x) == 0, mf2(x), np.where(mf2(x) == 0, mf1(x), 1))
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the drastic sum operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        # The drastic sum is the largest operand if every other one is 0, else 1
+        return np.where(np.sum(memberships != 0, axis=0) <= 1, np.max(memberships, axis=0), 1)
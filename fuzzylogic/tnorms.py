@@ -4,6 +4,7 @@ import numpy as np
 # fuzzy logic libraries
 from fuzzylogic.core.mf import MembershipFunction1D
 from fuzzylogic.core.tnorm import TNorm
+from fuzzylogic.mf.composite import CombinedMF
 
 
 class MinimumTNorm(TNorm):
@@ -17,19 +18,23 @@ class MinimumTNorm(TNorm):
         Combines two membership functions using the minimum operator.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function using the minimum operator.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the minimum operator elementwise to membership values.
+        """
+
+        return np.minimum(u1, u2)
 
-                return np.minimum(mf1(x), mf2(x))
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the minimum operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        return np.min(memberships, axis=0)
 
 
 class AlgebraicProductTNorm(TNorm):
@@ -43,19 +48,23 @@ class AlgebraicProductTNorm(TNorm):
         Combines two membership functions using the algebraic product operator.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function using the algebraic product operator.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the algebraic product operator elementwise to membership values.
+        """
+
+        return u1 * u2
 
-                return mf1(x) * mf2(x)
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the algebraic product operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        return np.prod(memberships, axis=0)
 
 
 class BoundedProductTNorm(TNorm):
@@ -69,19 +78,23 @@ class BoundedProductTNorm(TNorm):
         Combines two membership functions using the bounded product operator.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function using the bounded product operator.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the bounded product operator elementwise to membership values.
+        """
+
+        return np.maximum(0, u1 + u2 - 1)
 
-                return np.maximum(0, mf1(x) + mf2(x) - 1)
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the bounded product operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        return np.maximum(0, np.sum(memberships, axis=0) - (len(memberships) - 1))
 
 
 class DrasticProductTNorm(TNorm):
@@ -95,16 +108,21 @@ class DrasticProductTNorm(TNorm):
         Combines two membership functions using the drastic product operator.
         """
 
-        class CombinedMF(MembershipFunction1D):
-            """
-            Combined membership function using the drastic product operator.
-            """
+        return CombinedMF(operator=cls, mf1=mf1, mf2=mf2)
 
-            def __call__(self, x: np.ndarray) -> np.ndarray:
-                """
-                Evaluates the membership function.
-                """
+    @classmethod
+    def apply(cls, u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+        """
+        Applies the drastic product operator elementwise to membership values.
+        """
+
+        return np.where(u1 == 1, u2, np.where(u2 == 1, u1, 0))
 
-                return np.where(mf1(x) == 1, mf2(x), np.where(mf2(x) == 1, mf1(x), 0))
+    @classmethod
+    def apply_many(cls, memberships: np.ndarray) -> np.ndarray:
+        """
+        Applies the drastic product operator to membership values stacked along the first axis.
+        """
 
-        return CombinedMF()
+        # The drastic product is the smallest operand if every other one is 1, else 0
+        return np.where(np.sum(memberships != 1, axis=0) <= 1, np.min(memberships, axis=0), 0)
@@ -0,0 +1,100 @@
+# standard libraries
+from typing import Tuple
+
+# third party libraries
+import numpy as np
+
+# Number of weights reduced at once by the Karnik-Mendel algorithm
+TYPE_REDUCTION_CHUNK_SIZE = 2**14
+
+
+def _smallest_average(y: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Smallest weighted average of the sorted points y over the switch points, along the last axis.
+    """
+
+    # Weighted sums and total weights with upper weights up to each switch point and lower weights after it
+    lower_sums, lower_weights = np.cumsum(y * lower, axis=-1), np.cumsum(lower, axis=-1)
+    numerators = np.cumsum(y * upper, axis=-1) + (lower_sums[..., -1:] - lower_sums)
+    denominators = np.cumsum(upper, axis=-1) + (lower_weights[..., -1:] - lower_weights)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        averages = np.where(denominators > 0, numerators / denominators, np.inf)
+        # Lower weights on every point
+        lower_averages = np.where(lower_weights[..., -1] > 0, lower_sums[..., -1] / lower_weights[..., -1], np.inf)
+
+    return np.minimum(np.min(averages, axis=-1), lower_averages)
+
+
+def karnik_mendel_left(y: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Left end of the interval of weighted averages of y with weights between lower and upper.
+
+    The left end weights the k smallest points by their upper weight and the others by their lower weight, for the
+    switch point k found by the Karnik-Mendel algorithm. Rather than iterating towards k sample by sample, the weighted
+    average of every switch point is read from cumulative sums and the smallest one is kept, which is exact and
+    vectorized over any number of samples.
+
+    Args:
+        y (np.ndarray): Points of shape (n_points,), e.g. the universe of discourse
+        lower (np.ndarray): Lower weights of shape (..., n_points)
+        upper (np.ndarray): Upper weights of shape (..., n_points)
+
+    Returns:
+        np.ndarray: Left ends of shape (...)
+    """
+
+    # Sort the points, the switch point splits them into smaller and larger ones
+    y = np.asarray(y, dtype=np.float64)
+    order = np.argsort(y, kind="stable")
+    y = y[order]
+    lower = np.broadcast_to(np.asarray(lower, dtype=np.float64), np.broadcast_shapes(np.shape(lower), np.shape(upper)))
+    upper = np.broadcast_to(np.asarray(upper, dtype=np.float64), lower.shape)
+
+    # Avoid division by zero
+    if np.any(np.sum(upper, axis=-1) == 0):
+        raise ValueError("The upper membership function has an area of zero, cannot compute the type-reduced set.")
+
+    # Reduce the samples in chunks that fit in cache
+    flat_lower, flat_upper = lower.reshape(-1, len(y)), upper.reshape(-1, len(y))
+    left = np.empty(len(flat_lower))
+    chunk_size = max(1, TYPE_REDUCTION_CHUNK_SIZE // max(1, len(y)))
+    for start in range(0, len(left), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        left[chunk] = _smallest_average(y, flat_lower[chunk][:, order], flat_upper[chunk][:, order])
+
+    return left.reshape(lower.shape[:-1])
+
+
+def karnik_mendel_right(y: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Right end of the interval of weighted averages of y with weights between lower and upper.
+
+    Args:
+        y (np.ndarray): Points of shape (n_points,), e.g. the universe of discourse
+        lower (np.ndarray): Lower weights of shape (..., n_points)
+        upper (np.ndarray): Upper weights of shape (..., n_points)
+
+    Returns:
+        np.ndarray: Right ends of shape (...)
+    """
+
+    # The largest average of y is the opposite of the smallest average of -y
+    return -karnik_mendel_left(-np.asarray(y, dtype=np.float64), lower, upper)
+
+
+def karnik_mendel(y: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Interval of weighted averages of y with weights between lower and upper, e.g. the centroid of an interval type-2
+    membership function over the universe of discourse.
+
+    Args:
+        y (np.ndarray): Points of shape (n_points,)
+        lower (np.ndarray): Lower weights of shape (..., n_points)
+        upper (np.ndarray): Upper weights of shape (..., n_points)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Left and right ends of shape (...)
+    """
+
+    return karnik_mendel_left(y, lower, upper), karnik_mendel_right(y, lower, upper)
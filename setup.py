@@ -27,6 +27,7 @@ setup(
     license=license_text,
     python_requires="~=3.10",
     install_requires=requirements,
-    packages=find_packages(exclude=("tests", "tests.*", "scripts")),
+    extras_require={"jit": ["numba>=0.58"]},
+    packages=find_packages(exclude=("tests", "tests.*", "benchmarks", "benchmarks.*", "scripts")),
     entry_points={"console_scripts": ["fuzzylogic=fuzzylogic.cli:cli"]},
 )
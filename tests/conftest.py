@@ -4,6 +4,12 @@ import pytest
 
 # fuzzy logic libraries
 from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine, TSKFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule, TSKConsequent, TSKFuzzyRule
+from fuzzylogic.mf import Gaussian, Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
 
 
 @pytest.fixture(scope="session")
@@ -55,3 +61,69 @@ def simple_mf():
             return x + y
 
     return SimpleMF()
+
+
+@pytest.fixture
+def mamdani_engine():
+    """
+    Two input Mamdani engine for testing inference.
+    """
+
+    low_mf = Trapezoid(a=-1, b=0, c=2, d=5)
+    high_mf = Trapezoid(a=5, b=8, c=10, d=11)
+    medium_mf = Gaussian(mean=5, std=2)
+    rule_kwargs = dict(
+        dom_operator=MinimumTNorm(),
+        tnorm=MinimumTNorm(),
+        tconorm=MaximumTCoNorm(),
+        implication_operator=MinimumTNorm(),
+    )
+
+    rules = [
+        FuzzyRule(
+            antecedents=[low_mf, low_mf], operators=["and"], consequent=Triangle(a=0, b=0.2, c=0.4), **rule_kwargs
+        ),
+        FuzzyRule(
+            antecedents=[medium_mf, medium_mf],
+            operators=["or"],
+            consequent=Triangle(a=0.3, b=0.5, c=0.7),
+            **rule_kwargs,
+        ),
+        FuzzyRule(
+            antecedents=[high_mf, high_mf], operators=["and"], consequent=Triangle(a=0.6, b=0.8, c=1), **rule_kwargs
+        ),
+    ]
+
+    return MamdaniFuzzyEngine(rules=rules, aggregate_operator=MaximumTCoNorm(), defuzz="centroid")
+
+
+@pytest.fixture
+def tsk_engine():
+    """
+    Two input TSK engine with zero and first-order rules for testing inference.
+    """
+
+    low_mf = Trapezoid(a=-1, b=0, c=2, d=5)
+    high_mf = Trapezoid(a=5, b=8, c=10, d=11)
+    medium_mf = Gaussian(mean=5, std=2)
+    rule_kwargs = dict(dom_operator=MinimumTNorm(), tnorm=MinimumTNorm(), tconorm=MaximumTCoNorm())
+
+    rules = [
+        TSKFuzzyRule(
+            antecedents=[low_mf, low_mf], operators=["and"], consequent=TSKConsequent(intercept=0.1), **rule_kwargs
+        ),
+        TSKFuzzyRule(
+            antecedents=[medium_mf, medium_mf],
+            operators=["or"],
+            consequent=TSKConsequent(intercept=0.2, coefficients=[0.05, -0.02]),
+            **rule_kwargs,
+        ),
+        TSKFuzzyRule(
+            antecedents=[high_mf, high_mf],
+            operators=["and"],
+            consequent=TSKConsequent(intercept=-1, coefficients=[0.1, 0.1]),
+            **rule_kwargs,
+        ),
+    ]
+
+    return TSKFuzzyEngine(rules=rules)
@@ -0,0 +1,148 @@
+# standard libraries
+from dataclasses import dataclass
+from typing import Tuple
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.core.mf import SUPPORT_TOLERANCE, MembershipFunction1D
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.mf import Bell, ConstantMF, Gaussian, MFBank, Rectangular, Step, Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
+
+
+@dataclass
+class ScaledTriangle(MembershipFunction1D):
+    """
+    Triangle scaled by a height, whose formula relies on a helper method.
+    """
+
+    center: float
+    half_width: float
+    height: float
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return self.formula(x, self.center, self.half_width, self.height)
+
+    @staticmethod
+    def _triangle(x: np.ndarray, center: np.ndarray, half_width: np.ndarray) -> np.ndarray:
+        return np.maximum(1 - np.abs(x - center) / half_width, 0)
+
+    @classmethod
+    def formula(cls, x: np.ndarray, center: np.ndarray, half_width: np.ndarray, height: np.ndarray) -> np.ndarray:
+        return height * cls._triangle(x, center, half_width)
+
+    def support(self, tolerance: float = SUPPORT_TOLERANCE) -> Tuple[float, float]:
+        return self.center - self.half_width, self.center + self.half_width
+
+
+@pytest.mark.parametrize(
+    "mfs",
+    [
+        [Triangle(a=i, b=i + 1, c=i + 2) for i in range(7)],
+        [Trapezoid(a=i, b=i + 0.5, c=i + 1, d=i + 3) for i in range(5)],
+        [Gaussian(mean=i, std=0.5 + i) for i in range(9)],
+        [Bell(center=i, width=1, intensity=i + 1) for i in range(3)],
+        [Rectangular(low=i, high=i + 2) for i in range(4)],
+        [Step(limit=i) for i in range(4)],
+    ],
+)
+def test_bank_evaluation(mfs):
+    """
+    Test that a bank evaluates every membership function at once.
+    """
+
+    bank = MFBank.from_mfs(mfs)
+    x = np.linspace(-1, 10, 45)
+
+    assert len(bank) == len(mfs)
+    assert np.array_equal(bank(x), np.stack([mf(x) for mf in mfs]))
+    assert np.array_equal(bank(x.reshape(5, 9)), np.stack([mf(x) for mf in mfs]).reshape(len(mfs), 5, 9))
+
+
+def test_bank_custom_family():
+    """
+    Test that a bank evaluates a family whose formula calls other methods of the family.
+    """
+
+    mfs = [ScaledTriangle(center=i, half_width=1 + i, height=1 / (1 + i)) for i in range(4)]
+    bank = MFBank.from_mfs(mfs)
+    x = np.linspace(-2, 8, 41)
+
+    assert np.array_equal(bank(x), np.stack([mf(x) for mf in mfs]))
+    assert np.array_equal(bank[2](x), mfs[2](x))
+
+
+def test_bank_members():
+    """
+    Test that the members of a bank evaluate like the membership functions of the bank.
+    """
+
+    bank = MFBank(family=Triangle, parameters={"a": [0, 1], "b": [1, 2], "c": [2, 3]})
+    x = np.linspace(-1, 4, 11)
+
+    assert bank.mfs == [Triangle(a=0, b=1, c=2), Triangle(a=1, b=2, c=3)]
+    assert np.array_equal(bank[1](x), Triangle(a=1, b=2, c=3)(x))
+    assert bank[-1].index == 1
+
+    with pytest.raises(IndexError):
+        bank[2]
+
+
+def test_bank_validation():
+    """
+    Test that a bank validates its family and parameters.
+    """
+
+    with pytest.raises(ValueError):
+        MFBank(family=Triangle, parameters={"a": [2], "b": [1], "c": [0]})
+
+    with pytest.raises(ValueError):
+        MFBank(family=Triangle, parameters={"a": [0], "b": [1]})
+
+    with pytest.raises(ValueError):
+        MFBank(family=Triangle, parameters={"a": [0], "b": [1, 2], "c": [2]})
+
+    with pytest.raises(TypeError):
+        MFBank.from_mfs([Triangle(a=0, b=1, c=2), Gaussian(mean=0, std=1)])
+
+    with pytest.raises(TypeError):
+        MFBank.from_mfs([ConstantMF(value=0.5)])
+
+
+def test_compiled_engine_consumes_banks():
+    """
+    Test that a compiled engine evaluates every input against its bank once.
+    """
+
+    error = MFBank.from_mfs([Triangle(a=i - 2, b=i, c=i + 2) for i in range(0, 11, 2)])
+    rate = MFBank.from_mfs([Gaussian(mean=i, std=1.5) for i in range(0, 11, 2)])
+    output = MFBank.from_mfs([Triangle(a=i / 10 - 0.2, b=i / 10, c=i / 10 + 0.2) for i in range(0, 11, 2)])
+    rules = [
+        FuzzyRule(
+            antecedents=[error[i], rate[j]],
+            operators=["and"],
+            consequent=output[(i + j) // 2],
+            dom_operator=MinimumTNorm(),
+            tnorm=MinimumTNorm(),
+            tconorm=MaximumTCoNorm(),
+            implication_operator=MinimumTNorm(),
+        )
+        for i in range(len(error))
+        for j in range(len(rate))
+    ]
+    engine = MamdaniFuzzyEngine(rules=rules, aggregate_operator=MaximumTCoNorm())
+    inputs = np.random.default_rng(0).uniform(0, 10, size=(100, 2))
+    x = np.linspace(-0.2, 1.2, 141)
+
+    outputs = engine.infer_batch(inputs, x)
+    compiled_rule_base = engine.compile()
+
+    assert [term_table.banks for term_table in compiled_rule_base.term_tables] == [[error], [rate]]
+    assert compiled_rule_base.consequent_table.banks == [output]
+    assert np.array_equal(engine.infer_batch(inputs, x), outputs)
@@ -41,3 +41,12 @@ def test_asymptotic_behavior():
     x = np.array([1e6])
     y = bell_fn(x)
     assert np.isclose(y, [0], atol=1e-5).all()
+
+
+def test_support_and_core():
+    bell_fn = Bell(center=1, width=-2, intensity=3)
+    low, high = bell_fn.support(tolerance=1e-6)
+
+    assert bell_fn(np.array([low, high])) == pytest.approx(1e-6)
+    assert bell_fn.support(tolerance=0) == (-np.inf, np.inf)
+    assert bell_fn.core() == (1, 1)
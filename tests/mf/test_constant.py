@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 
 # fuzzy logic libraries
+from fuzzylogic.core.mf import EMPTY, UNBOUNDED
 from fuzzylogic.mf.constant import ConstantMF
 
 
@@ -36,3 +37,13 @@ def test_asymptotic_behavior():
     x = np.array([1e6])
     y = constant_fn(x)
     assert np.isclose(y, [0.5], atol=1e-5).all()
+
+
+@pytest.mark.parametrize(
+    "value, support, core",
+    [(0, EMPTY, EMPTY), (0.5, UNBOUNDED, EMPTY), (1, UNBOUNDED, UNBOUNDED)],
+)
+def test_support_and_core(value, support, core):
+    constant_mf = ConstantMF(value=value)
+    assert constant_mf.support() == support
+    assert constant_mf.core() == core
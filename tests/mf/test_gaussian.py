@@ -35,3 +35,12 @@ def test_gaussian_array_evaluation():
     expected_values = np.array([0.1353, 0.6065, 1.0, 0.6065, 0.1353])
 
     assert np.allclose(y, expected_values, atol=0.01)
+
+
+def test_gaussian_support_and_core():
+    gaussian_fn = Gaussian(mean=1, std=2)
+    low, high = gaussian_fn.support(tolerance=1e-6)
+
+    assert gaussian_fn(np.array([low, high])) == pytest.approx(1e-6)
+    assert gaussian_fn.support(tolerance=0) == (-np.inf, np.inf)
+    assert gaussian_fn.core() == (1, 1)
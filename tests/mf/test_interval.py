@@ -0,0 +1,67 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.mf import Gaussian, IntervalType2MF
+from fuzzylogic.mf.trap import Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tnorms import MinimumTNorm
+
+
+@pytest.mark.parametrize(
+    "mf", [Triangle(a=0, b=1, c=2), Trapezoid(a=0, b=1, c=2, d=3), Gaussian(mean=1, std=0.5)], ids=type
+)
+def test_interval_footprint(mf):
+    """
+    Test that the lower membership values do not exceed the upper ones and that a zero spread gives the type-1 mf.
+    """
+
+    x = np.linspace(-2, 5, 701)
+    memberships = IntervalType2MF.from_mf(mf, spread=0.2)(x)
+
+    assert memberships.shape == (2, len(x))
+    assert np.all(memberships[0] <= memberships[1])
+    assert np.all(memberships[0] <= mf(x)) and np.all(mf(x) <= memberships[1])
+    assert np.array_equal(IntervalType2MF.from_mf(mf, spread=0)(x), np.stack([mf(x), mf(x)]))
+
+
+def test_interval_support_and_core():
+    """
+    Test that the support is the support of the upper mf and the core the core of the lower mf.
+    """
+
+    mf = IntervalType2MF.from_mf(Trapezoid(a=0, b=1, c=2, d=3), spread=0.5)
+
+    assert mf.support() == (-0.5, 3.5)
+    assert mf.core() == (1, 2)
+
+
+def test_interval_combine():
+    """
+    Test that T-Norms combine interval type-2 memberships bound by bound.
+    """
+
+    mf1 = IntervalType2MF.from_mf(Triangle(a=0, b=1, c=2), spread=0.2)
+    mf2 = IntervalType2MF.from_mf(Triangle(a=0.5, b=1.5, c=2.5), spread=0.2)
+    x = np.linspace(0, 2.5, 26)
+
+    combined = MinimumTNorm().combine(mf1, mf2)(x)
+
+    assert np.array_equal(combined[0], np.minimum(mf1.lower(x), mf2.lower(x)))
+    assert np.array_equal(combined[1], np.minimum(mf1.upper(x), mf2.upper(x)))
+
+
+def test_interval_invalid():
+    """
+    Test that invalid spreads and membership function families raise errors.
+    """
+
+    with pytest.raises(ValueError):
+        IntervalType2MF.from_mf(Triangle(a=0, b=1, c=2), spread=-0.1)
+    with pytest.raises(ValueError):
+        IntervalType2MF.from_mf(Triangle(a=0, b=1, c=2), spread=1.5)
+    with pytest.raises(ValueError):
+        IntervalType2MF.from_mf(Gaussian(mean=0, std=1), spread=1)
+    with pytest.raises(TypeError):
+        IntervalType2MF.from_mf(IntervalType2MF.from_mf(Triangle(a=0, b=1, c=2), spread=0.1), spread=0.1)
@@ -42,3 +42,20 @@ def test_linear_array_evaluation():
     )
 
     assert np.allclose(y, expected_values, atol=0.01)
+
+
+@pytest.mark.parametrize("m, b", [(0.5, -1), (-2, 3)])
+def test_linear_support_and_core(m, b):
+    linear_fn = Linear(m=m, b=b)
+    low, high = linear_fn.support()
+    core_low, core_high = linear_fn.core()
+
+    x = np.linspace(-10, 10, 2001)
+    assert np.all(linear_fn(x[(x < low) | (x > high)]) == 0)
+    assert np.all(linear_fn(x[(x >= core_low) & (x <= core_high)]) == pytest.approx(1))
+    assert np.any(linear_fn(x[(x >= low) & (x <= high)]) > 0)
+
+
+def test_linear_support_and_core_flat():
+    assert Linear(m=0, b=0).support()[0] > Linear(m=0, b=0).support()[1]
+    assert Linear(m=0, b=1).core() == (-np.inf, np.inf)
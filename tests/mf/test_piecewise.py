@@ -0,0 +1,100 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.mf import Gaussian, PiecewiseLinearMF, Rectangular, Trapezoid
+from fuzzylogic.mf.piecewise import maximum
+from fuzzylogic.mf.triangle import Triangle
+
+
+@pytest.mark.parametrize("mf", [Triangle(a=0, b=1, c=3), Trapezoid(a=0, b=1, c=2, d=4), Rectangular(low=1, high=2)])
+def test_piecewise_linear_from_mf(mf):
+    """
+    Test that the piecewise linear membership function evaluates like the original one.
+    """
+
+    x = np.linspace(-1, 5, 601)
+    assert np.allclose(PiecewiseLinearMF.from_mf(mf)(x), mf(x), rtol=0, atol=1e-12)
+
+
+def test_piecewise_linear_from_mf_invalid():
+    """
+    Test that only piecewise linear families are converted.
+    """
+
+    with pytest.raises(TypeError):
+        PiecewiseLinearMF.from_mf(Gaussian(mean=0, std=1))
+
+
+def test_piecewise_linear_invalid_breakpoints():
+    """
+    Test that the breakpoints must be non-decreasing membership values.
+    """
+
+    with pytest.raises(ValueError):
+        PiecewiseLinearMF(x=[1, 0], y=[0, 0])
+    with pytest.raises(ValueError):
+        PiecewiseLinearMF(x=[0, 1], y=[0, 2])
+
+
+def test_piecewise_linear_operations():
+    """
+    Test the pointwise operations against the sampled membership functions.
+    """
+
+    triangle = PiecewiseLinearMF.from_mf(Triangle(a=0, b=1, c=3))
+    trapezoid = PiecewiseLinearMF.from_mf(Trapezoid(a=1, b=2, c=3, d=4))
+    rectangle = PiecewiseLinearMF.from_mf(Rectangular(low=0.5, high=2.5))
+    x = np.linspace(-1, 5, 1201)
+
+    assert np.allclose(triangle.clip(0.4)(x), np.minimum(triangle(x), 0.4), atol=1e-12)
+    assert np.allclose(triangle.scale(0.4)(x), triangle(x) * 0.4, atol=1e-12)
+    assert np.allclose(triangle.maximum(trapezoid)(x), np.maximum(triangle(x), trapezoid(x)), atol=1e-12)
+    assert np.allclose(triangle.minimum(trapezoid)(x), np.minimum(triangle(x), trapezoid(x)), atol=1e-12)
+
+    clipped = [triangle.clip(0.7), trapezoid.scale(0.5), rectangle.clip(0.2)]
+    expected = np.max([mf(x) for mf in clipped], axis=0)
+    # The closed rectangle edges are jumps, away from them the envelope is continuous
+    away_from_jumps = (np.abs(x - 0.5) > 1e-9) & (np.abs(x - 2.5) > 1e-9)
+    assert np.allclose(maximum(clipped)(x)[away_from_jumps], expected[away_from_jumps], atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "mf, centroid, bisector",
+    [
+        (Triangle(a=0, b=1, c=2), 1, 1),
+        (Triangle(a=0, b=0, c=3), 1, 3 - 3 / np.sqrt(2)),
+        (Trapezoid(a=0, b=1, c=3, d=4), 2, 2),
+        (Rectangular(low=1, high=4), 2.5, 2.5),
+    ],
+)
+def test_piecewise_linear_centroid_bisector(mf, centroid, bisector):
+    """
+    Test the exact centroid and bisector against closed forms.
+    """
+
+    mf = PiecewiseLinearMF.from_mf(mf)
+
+    assert mf.centroid() == pytest.approx(centroid, abs=1e-12)
+    assert mf.bisector() == pytest.approx(bisector, abs=1e-12)
+
+
+def test_piecewise_linear_zero_area():
+    """
+    Test that a membership function without area cannot be defuzzified.
+    """
+
+    mf = PiecewiseLinearMF.from_mf(Triangle(a=0, b=1, c=2)).clip(0)
+
+    with pytest.raises(ValueError):
+        mf.centroid()
+    with pytest.raises(ValueError):
+        mf.bisector()
+
+
+def test_piecewise_linear_support_and_core():
+    mf = PiecewiseLinearMF(x=[0, 1, 2, 3, 4, 6, 7], y=[0, 1, 1, 0.5, 1, 1, 0])
+    assert mf.support() == (0, 7)
+    assert mf.core() == (4, 6)
+    assert PiecewiseLinearMF(x=[0, 1], y=[0, 0]).support()[0] == np.inf
@@ -38,3 +38,9 @@ def test_rectangular_array_evaluation():
     expected_values = np.array([0.0, 1.0, 1.0, 1.0, 0.0])
 
     assert np.allclose(y, expected_values, atol=0.01)
+
+
+def test_rectangular_support_and_core():
+    rectangular_fn = Rectangular(low=1, high=2)
+    assert rectangular_fn.support() == (1, 2)
+    assert rectangular_fn.core() == (1, 2)
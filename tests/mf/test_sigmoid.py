@@ -70,3 +70,15 @@ def test_sigmoid_slope():
     x_val_right = np.array([1])
     y_right = sigmoid_shallow(x_val_right)
     assert y_right < 0.8 and y_right > 0.6
+
+
+@pytest.mark.parametrize("center_slope", [2, -2])
+def test_sigmoid_support_and_core(center_slope):
+    sigmoid_fn = Sigmoid(center_slope=center_slope, center=1)
+    low, high = sigmoid_fn.support(tolerance=1e-6)
+
+    # The support is a ray bounded where the membership value crosses the tolerance
+    bound = low if center_slope > 0 else high
+    assert np.isinf(high if center_slope > 0 else low)
+    assert sigmoid_fn(np.array([bound])) == pytest.approx(1e-6)
+    assert sigmoid_fn.core()[0] > sigmoid_fn.core()[1]
@@ -45,3 +45,9 @@ def test_large_array():
     x = np.array([1e6 - 1, 1e6, 1e6 + 1])
     y = singleton_mf(x)
     assert np.isclose(y, np.array([0, 1, 0])).all()
+
+
+def test_support_and_core():
+    singleton_mf = FuzzySingleton(value=5)
+    assert singleton_mf.support() == (5, 5)
+    assert singleton_mf.core() == (5, 5)
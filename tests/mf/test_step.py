@@ -35,3 +35,9 @@ def test_step_array_mixed_evaluation():
 
     expected_values = np.array([0, 0, 0, 1, 1])
     assert np.array_equal(y, expected_values)
+
+
+def test_step_support_and_core():
+    step_fn = Step(limit=0.5)
+    assert step_fn.support() == (0.5, np.inf)
+    assert step_fn.core() == (0.5, np.inf)
@@ -50,3 +50,10 @@ def test_trapezoid_edges_evaluation():
     y = trap_fn(x_vals)
     expected_values = np.array([0, 0.5, 1, 0.5, 0])
     assert np.array_equal(y, expected_values)
+
+
+def test_trapezoid_support_and_core():
+    trapezoid_fn = Trapezoid(0, 1, 2, 4)
+    assert trapezoid_fn.support() == (0, 4)
+    assert trapezoid_fn.core() == (1, 2)
+    assert np.all(trapezoid_fn(np.array([1, 1.5, 2])) == 1)
@@ -47,3 +47,10 @@ def test_triangle_outside_range():
     triangle_fn = Triangle(a=0, b=1, c=2)
     assert triangle_fn(-10) == 0
     assert triangle_fn(10) == 0
+
+
+def test_triangle_support_and_core():
+    triangle_fn = Triangle(a=0, b=1, c=3)
+    assert triangle_fn.support() == (0, 3)
+    assert triangle_fn.core() == (1, 1)
+    assert np.all(triangle_fn(np.array([-1, 0, 3, 4])) == 0)
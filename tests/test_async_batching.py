@@ -0,0 +1,131 @@
+# standard libraries
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.async_batching import AsyncInferenceBatcher
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    return np.random.default_rng(0).uniform(0, 10, size=(500, 2))
+
+
+def count_batches(engine, monkeypatch):
+    """
+    Records the size of every batch inferred by the engine.
+    """
+
+    batch_sizes = []
+    infer_batch = engine.infer_batch
+
+    def counted_infer_batch(inputs, x=None):
+        batch_sizes.append(len(inputs))
+        return infer_batch(inputs, x)
+
+    monkeypatch.setattr(engine, "infer_batch", counted_infer_batch)
+
+    return batch_sizes
+
+
+def test_concurrent_clients(mamdani_engine, inputs, monkeypatch):
+    """
+    Test that concurrent requests are inferred in batches and each resolves with its own output.
+    """
+
+    x = np.linspace(0, 1, 101)
+    expected = mamdani_engine.infer_batch(inputs, x)
+    batch_sizes = count_batches(mamdani_engine, monkeypatch)
+
+    async def serve():
+        async with AsyncInferenceBatcher(mamdani_engine, x, max_batch_size=128, max_wait=0.01) as batcher:
+            return await asyncio.gather(*(batcher.ainfer(list(row)) for row in inputs))
+
+    outputs = asyncio.run(serve())
+
+    assert np.array_equal(outputs, expected)
+    assert batch_sizes == [128, 128, 128, 116]
+
+
+def test_lone_request(tsk_engine, monkeypatch):
+    """
+    Test that a lone request is inferred after the wait and staggered requests start new batches.
+    """
+
+    expected = tsk_engine.infer_batch(np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])).tolist()
+    batch_sizes = count_batches(tsk_engine, monkeypatch)
+
+    async def serve():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = AsyncInferenceBatcher(tsk_engine, max_wait=0.001, executor=executor)
+            first = await batcher.ainfer([1.0, 2.0])
+            second = await asyncio.gather(batcher.ainfer([3.0, 4.0]), batcher.ainfer([5.0, 6.0]))
+            return [first, *second]
+
+    outputs = asyncio.run(serve())
+
+    assert outputs == expected
+    assert batch_sizes == [1, 2]
+
+
+def test_errors(mamdani_engine):
+    """
+    Test that invalid inputs raise errors and inference errors propagate to the failing requests.
+    """
+
+    async def serve():
+        batcher = AsyncInferenceBatcher(mamdani_engine, x=np.zeros(0), max_wait=0)
+        with pytest.raises(ValueError):
+            await batcher.ainfer([1.0, 2.0, 3.0])
+
+        return await asyncio.gather(batcher.ainfer([1.0, 2.0]), batcher.ainfer([3.0, 4.0]), return_exceptions=True)
+
+    assert all(isinstance(result, Exception) for result in asyncio.run(serve()))
+
+    with pytest.raises(ValueError):
+        AsyncInferenceBatcher(mamdani_engine, max_batch_size=0)
+
+
+def test_failing_request_isolated(monkeypatch):
+    """
+    Test that a request whose input fails inference does not fail the other requests of its batch.
+    """
+
+    rule_kwargs = dict(
+        dom_operator=MinimumTNorm(),
+        tnorm=MinimumTNorm(),
+        tconorm=MaximumTCoNorm(),
+        implication_operator=MinimumTNorm(),
+    )
+    rule = FuzzyRule(
+        antecedents=[Triangle(a=0, b=1, c=2)], operators=[], consequent=Triangle(a=0, b=1, c=2), **rule_kwargs
+    )
+    engine = MamdaniFuzzyEngine(rules=[rule], aggregate_operator=MaximumTCoNorm())
+    x = np.linspace(0, 2, 101)
+    expected = engine.infer_batch(np.array([[1.0], [0.5]]), x).tolist()
+    batch_sizes = count_batches(engine, monkeypatch)
+
+    async def serve():
+        async with AsyncInferenceBatcher(engine, x, max_wait=0.01) as batcher:
+            return await asyncio.gather(
+                batcher.ainfer(1.0), batcher.ainfer(0.5), batcher.ainfer(5.0), return_exceptions=True
+            )
+
+    outputs = asyncio.run(serve())
+
+    assert outputs[:2] == expected
+    assert isinstance(outputs[2], ValueError)
+    assert batch_sizes == [3, 1, 1, 1]
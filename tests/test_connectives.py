@@ -1,8 +1,15 @@
+# standard libraries
+import pickle
+
 # third party libraries
 import numpy as np
+import pytest
 
 # fuzzy logic libraries
 from fuzzylogic.connectives import And, Or
+from fuzzylogic.hedges import Not
+from fuzzylogic.mf import Gaussian, Step
+from fuzzylogic.mf.triangle import Triangle
 
 
 class TestAndConnective:
@@ -47,3 +54,26 @@ class TestOrConnective:
         y_vals = unioned_mf(x_vals)
         assert np.all(y_vals >= 0)
         assert np.all(y_vals <= 1)
+
+
+@pytest.mark.parametrize("connective", [And, Or])
+def test_combined_mf_pickle(connective):
+    """
+    Test that combined membership functions survive a pickle round trip.
+    """
+
+    combined_mf = connective.combine(Gaussian(mean=0, std=1), Not.transform(Gaussian(mean=1, std=2)))
+    x = np.linspace(-3, 3, 13)
+    assert np.array_equal(pickle.loads(pickle.dumps(combined_mf))(x), combined_mf(x))
+
+
+def test_combined_mf_support_and_core():
+    """
+    Test that And intersects and Or bounds the union of the supports and cores.
+    """
+
+    triangle, step = Triangle(a=0, b=2, c=4), Step(limit=3)
+    assert And.combine(triangle, step).support() == (3, 4)
+    assert And.combine(triangle, step).core()[0] == np.inf
+    assert Or.combine(triangle, step).support() == (0, np.inf)
+    assert Or.combine(triangle, step).core() == (3, np.inf)
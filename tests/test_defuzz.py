@@ -3,7 +3,22 @@ import numpy as np
 import pytest
 
 # fuzzy logic libraries
-from fuzzylogic.defuzz import Bisector, Centroid, LargestOfMaximum, MeanOfMaximum, SmallestOfMaximum
+from fuzzylogic.defuzz import (
+    AdaptiveBisector,
+    AdaptiveCentroid,
+    Bisector,
+    Centroid,
+    LargestOfMaximum,
+    MeanOfMaximum,
+    PiecewiseLinearBisector,
+    PiecewiseLinearCentroid,
+    SmallestOfMaximum,
+    adaptive_sample,
+)
+from fuzzylogic.mf import ConstantMF, Gaussian, Rectangular, Sigmoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
 
 
 def test_centroid_defuzz(dummy_mf_1):
@@ -63,3 +78,126 @@ def test_smallest_of_maximum_defuzz(dummy_mf_1):
     max_mf = np.max(dummy_mf_1(x))
     max_indices = np.where(dummy_mf_1(x) == max_mf)[0]
     assert smallest_max_value == np.min(x[max_indices])
+
+
+@pytest.mark.parametrize("defuzz", [Centroid, Bisector, MeanOfMaximum, LargestOfMaximum, SmallestOfMaximum])
+def test_defuzz_evaluates_once(dummy_mf_1, defuzz):
+    """
+    Test that defuzzification evaluates the membership function once and matches the precomputed membership values.
+    """
+
+    x = np.linspace(0, 2 * np.pi, 1000)
+    calls = []
+
+    def mf(x):
+        calls.append(x)
+        return dummy_mf_1(x)
+
+    assert defuzz.defuzz(x, mf) == defuzz.defuzz_memberships(x, dummy_mf_1(x))
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("defuzz", [Centroid, Bisector, MeanOfMaximum, LargestOfMaximum, SmallestOfMaximum])
+def test_defuzz_batch(dummy_mf_1, dummy_mf_2, defuzz):
+    """
+    Test that batched defuzzification matches defuzzifying each membership function.
+    """
+
+    x = np.linspace(0, 2 * np.pi, 1000)
+    memberships = np.stack([dummy_mf_1(x), dummy_mf_2(x)])
+    expected = [defuzz.defuzz(x, dummy_mf_1), defuzz.defuzz(x, dummy_mf_2)]
+    assert defuzz.defuzz_batch(x, memberships) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("exact, sampled", [(PiecewiseLinearCentroid, Centroid), (PiecewiseLinearBisector, Bisector)])
+def test_piecewise_linear_defuzz(mamdani_engine, exact, sampled):
+    """
+    Test that the exact defuzzification methods match sampling over a dense universe.
+    """
+
+    x = np.linspace(0, 1, 100001)
+    for inputs in ([1.0, 2.0], [5.0, 4.0], [8.0, 3.0], [9.0, 9.0]):
+        composed_mf = mamdani_engine.compose(inputs)
+        assert exact.defuzz(None, composed_mf) == pytest.approx(sampled.defuzz(x, composed_mf), abs=1e-4)
+        assert exact.defuzz_batch(x, composed_mf(x)[np.newaxis]) == pytest.approx(
+            [exact.defuzz(None, composed_mf)], abs=1e-8
+        )
+
+
+@pytest.mark.parametrize("defuzz", [PiecewiseLinearCentroid, PiecewiseLinearBisector])
+def test_piecewise_linear_defuzz_invalid(defuzz):
+    """
+    Test that the exact defuzzification methods reject membership functions that are not piecewise linear.
+    """
+
+    with pytest.raises(TypeError):
+        defuzz.defuzz(None, Gaussian(mean=0, std=1))
+    with pytest.raises(TypeError):
+        defuzz.defuzz(None, MaximumTCoNorm.combine(Gaussian(mean=0, std=1), Gaussian(mean=1, std=1)))
+
+
+@pytest.fixture
+def narrow_peaks_mf():
+    """
+    Aggregated output with a narrow peak, a wide peak and a jump on a wide universe.
+    """
+
+    clipped_mfs = [
+        MinimumTNorm.combine(ConstantMF(value=0.7), Triangle(a=10, b=10.05, c=10.1)),
+        MinimumTNorm.combine(ConstantMF(value=0.3), Triangle(a=80, b=85, c=90)),
+        MinimumTNorm.combine(ConstantMF(value=0.5), Rectangular(low=40, high=41)),
+    ]
+
+    return MaximumTCoNorm.combine(MaximumTCoNorm.combine(clipped_mfs[0], clipped_mfs[1]), clipped_mfs[2])
+
+
+@pytest.mark.parametrize(
+    "adaptive, exact", [(AdaptiveCentroid, PiecewiseLinearCentroid), (AdaptiveBisector, PiecewiseLinearBisector)]
+)
+def test_adaptive_defuzz(narrow_peaks_mf, adaptive, exact):
+    """
+    Test that the adaptive defuzzification methods reach their tolerance with few evaluations.
+    """
+
+    x = np.linspace(0, 100, 10001)
+    expected = exact.defuzz(None, narrow_peaks_mf)
+
+    assert adaptive.defuzz(x, narrow_peaks_mf) == pytest.approx(expected, abs=adaptive.tolerance)
+    assert adaptive.defuzz(None, narrow_peaks_mf) == pytest.approx(expected, abs=adaptive.tolerance)
+    assert len(adaptive_sample(narrow_peaks_mf, 0, 100)[0]) < 1000
+
+    # A dense uniform universe misses the narrow peak
+    sampled = Centroid if adaptive is AdaptiveCentroid else Bisector
+    assert abs(sampled.defuzz(x, narrow_peaks_mf) - expected) > 1e3 * adaptive.tolerance
+
+
+def test_adaptive_sample_smooth():
+    """
+    Test that adaptive sampling converges on smooth membership functions.
+    """
+
+    mf = MaximumTCoNorm.combine(Gaussian(mean=30, std=3), Gaussian(mean=60, std=0.5))
+    x_dense = np.linspace(0, 100, 1000001)
+    expected = PiecewiseLinearCentroid.defuzz_memberships(x_dense, mf(x_dense))
+
+    for tolerance in (1e-2, 1e-3, 1e-4):
+        x, y = adaptive_sample(mf, 0, 100, tolerance=tolerance)
+        assert np.all(np.diff(x) > 0)
+        assert np.array_equal(y, mf(x))
+        assert PiecewiseLinearCentroid.defuzz_memberships(x, y) == pytest.approx(expected, abs=tolerance)
+
+    assert len(adaptive_sample(mf, 0, 100, tolerance=0, max_evaluations=500)[0]) == 500
+
+
+def test_adaptive_defuzz_unbounded():
+    """
+    Test that the adaptive defuzzification methods need a universe of discourse for unbounded supports.
+    """
+
+    with pytest.raises(ValueError):
+        AdaptiveCentroid.defuzz(None, Sigmoid(center_slope=1, center=0))
+
+    x = np.linspace(-10, 10, 201)
+    assert AdaptiveCentroid.defuzz(x, Sigmoid(center_slope=1, center=0)) == pytest.approx(
+        PiecewiseLinearCentroid.defuzz_memberships(x, Sigmoid(center_slope=1, center=0)(x)), abs=1e-3
+    )
@@ -0,0 +1,151 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.core.dtype import as_float_array, float_dtype, result_dtype
+from fuzzylogic.defuzz import DEFUZZ
+from fuzzylogic.expression import CompiledMF
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine, TSKFuzzyEngine
+from fuzzylogic.mf import ConstantMF, FuzzySingleton, Gaussian, MFBank, PiecewiseLinearMF, Rectangular, Step
+from fuzzylogic.mf.trap import Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.streaming import iter_batches
+from fuzzylogic.tconorms import MaximumTCoNorm
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    return np.random.default_rng(0).uniform(0, 10, size=(500, 2))
+
+
+def test_result_dtype():
+    """
+    Test that float32 and float64 observations keep their type and any other observations give float64.
+    """
+
+    assert result_dtype(np.zeros(3, dtype=np.float32)) == np.float32
+    assert result_dtype(np.float32(1)) == np.float32
+    assert result_dtype(np.zeros(3)) == np.float64
+    assert result_dtype(np.arange(3)) == np.float64
+    assert result_dtype(np.zeros(3, dtype=np.float16)) == np.float64
+    assert result_dtype(1.0) == np.float64
+    assert result_dtype([1, 2]) == np.float64
+
+    assert as_float_array([1, 2]).dtype == np.float64
+    assert as_float_array(np.arange(3), np.float32).dtype == np.float32
+
+
+def test_float_dtype_invalid():
+    """
+    Test that types other than float32 and float64 raise errors, for engines too.
+    """
+
+    assert float_dtype("float32") == np.float32
+    with pytest.raises(ValueError):
+        float_dtype(np.int64)
+    with pytest.raises(ValueError):
+        float_dtype(np.float16)
+    with pytest.raises(ValueError):
+        MamdaniFuzzyEngine(rules=[object()], aggregate_operator=MaximumTCoNorm(), dtype=np.int32)
+
+
+@pytest.mark.parametrize(
+    "mf",
+    [
+        ConstantMF(value=0.3),
+        FuzzySingleton(value=0.5),
+        Gaussian(mean=0.5, std=0.2),
+        PiecewiseLinearMF(x=np.array([0.0, 0.5, 1.0]), y=np.array([0.0, 1.0, 0.0])),
+        Rectangular(low=0.2, high=0.8),
+        Step(limit=0.5),
+        Trapezoid(a=0.0, b=0.2, c=0.6, d=1.0),
+        MFBank.from_mfs([Triangle(a=0.0, b=0.2, c=0.4), Triangle(a=0.3, b=0.5, c=0.7)]),
+        CompiledMF.from_mf(MaximumTCoNorm.combine(Triangle(a=0.0, b=0.2, c=0.4), ConstantMF(value=0.2))),
+    ],
+)
+def test_mf_dtype(mf):
+    """
+    Test that membership functions keep the type of float observations and give float64 for integer observations.
+    """
+
+    x = np.linspace(0, 1, 11)
+
+    memberships_32 = mf(x.astype(np.float32))
+    assert memberships_32.dtype == np.float32
+    assert np.allclose(memberships_32, mf(x), atol=1e-6)
+    assert mf(x).dtype == np.float64
+    assert mf(np.arange(3)).dtype == np.float64
+
+
+@pytest.mark.parametrize("method", sorted(DEFUZZ))
+@pytest.mark.parametrize("backend", [None, "numpy"])
+def test_mamdani_float32(mamdani_engine, inputs, method, backend):
+    """
+    Test that a float32 Mamdani engine computes in float32 and stays close to the float64 outputs.
+    """
+
+    x = np.linspace(0, 1, 201)
+    engine_32 = MamdaniFuzzyEngine(
+        rules=mamdani_engine.rules, aggregate_operator=mamdani_engine.aggregate_operator, defuzz=method, dtype="float32"
+    )
+    engine_64 = MamdaniFuzzyEngine(
+        rules=mamdani_engine.rules, aggregate_operator=mamdani_engine.aggregate_operator, defuzz=method
+    )
+    if backend is not None:
+        engine_32.compile(backend)
+        engine_64.compile(backend)
+
+    rule_strengths = engine_32.get_rule_strengths(inputs.astype(np.float32))
+    assert rule_strengths.dtype == np.float32
+    assert engine_32.aggregate(rule_strengths, x.astype(np.float32)).dtype == np.float32
+
+    outputs = engine_32.infer_batch(inputs, x)
+    assert outputs.dtype == np.float32
+    # The bisector may pick a neighbouring point of the universe
+    assert np.allclose(outputs, engine_64.infer_batch(inputs, x), atol=1e-5 if method != "bisector" else 5e-3)
+
+
+def test_mamdani_float32_surface(mamdani_engine):
+    """
+    Test that the control surface of a float32 engine is float32 with and without a universe of discourse.
+    """
+
+    engine = MamdaniFuzzyEngine(rules=mamdani_engine.rules, aggregate_operator=MaximumTCoNorm(), dtype=np.float32)
+    antecedent_ranges = [np.linspace(0, 10, 6), np.linspace(0, 10, 5)]
+
+    surface = engine.calculate_fuzzy_control_surface(antecedent_ranges)
+    assert surface.dtype == np.float32
+    assert np.allclose(surface, mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges), atol=1e-6)
+    assert engine.calculate_fuzzy_control_surface(antecedent_ranges, np.linspace(0, 1, 101)).dtype == np.float32
+    assert engine.fingerprint() != mamdani_engine.fingerprint()
+
+
+def test_tsk_float32(tsk_engine, inputs):
+    """
+    Test that a float32 TSK engine computes in float32 and stays close to the float64 outputs.
+    """
+
+    engine = TSKFuzzyEngine(rules=tsk_engine.rules, dtype=np.float32)
+
+    assert engine.get_consequents(inputs).dtype == np.float32
+    outputs = engine.infer_batch(inputs)
+    assert outputs.dtype == np.float32
+    assert np.allclose(outputs, tsk_engine.infer_batch(inputs), atol=1e-5)
+    assert all(batch.dtype == np.float32 for batch in engine.infer_stream(inputs, batch_size=128))
+
+
+def test_iter_batches_dtype(inputs):
+    """
+    Test that streamed batches are cast to the requested floating point type.
+    """
+
+    batches = list(iter_batches(inputs, batch_size=100, dtype=np.float32))
+
+    assert all(batch.dtype == np.float32 for batch in batches)
+    with pytest.raises(ValueError):
+        list(iter_batches(inputs, dtype=np.int64))
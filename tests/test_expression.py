@@ -0,0 +1,119 @@
+# standard libraries
+import sys
+from dataclasses import dataclass, field
+from functools import reduce
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.connectives import And, Or
+from fuzzylogic.core.mf import MembershipFunction1D
+from fuzzylogic.expression import CompiledMF
+from fuzzylogic.hedges import Con, Dil, Dim, Int, Not
+from fuzzylogic.mf import ConstantMF, Gaussian, MFBank
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm, MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm, MinimumTNorm
+
+
+@dataclass(eq=False)
+class CountingMF(MembershipFunction1D):
+    """
+    Membership function counting its evaluations.
+    """
+
+    mf: MembershipFunction1D
+    calls: list = field(default_factory=list)
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        self.calls.append(x)
+        return self.mf(x)
+
+
+@pytest.mark.parametrize(
+    "operator",
+    [
+        MinimumTNorm,
+        AlgebraicProductTNorm,
+        BoundedProductTNorm,
+        DrasticProductTNorm,
+        MaximumTCoNorm,
+        AlgebraicSumTCoNorm,
+        BoundedSumTCoNorm,
+        DrasticSumTCoNorm,
+        And,
+        Or,
+    ],
+)
+@pytest.mark.parametrize("hedge", [Not, Con, Dil, Int, Dim])
+def test_compiled_mf_matches_expression(operator, hedge):
+    """
+    Test that compiled membership functions match the expression they compile.
+    """
+
+    mf = operator.combine(
+        hedge.transform(Gaussian(mean=0, std=1)), operator.combine(Triangle(a=-1, b=0, c=2), ConstantMF(value=0.6))
+    )
+    x = np.linspace(-3, 3, 61)
+
+    assert np.array_equal(CompiledMF.from_mf(mf)(x), mf(x))
+    assert CompiledMF.from_mf(mf).support() == mf.support()
+
+
+def test_compiled_mf_shares_subexpressions():
+    """
+    Test that shared subexpressions and their leaves are evaluated once.
+    """
+
+    leaf = CountingMF(mf=Gaussian(mean=0, std=1))
+    mf = DrasticProductTNorm.combine(Not.transform(leaf), leaf)
+    for _ in range(20):
+        mf = MaximumTCoNorm.combine(mf, MinimumTNorm.combine(mf, Not.transform(mf)))
+    compiled_mf = CompiledMF.from_mf(mf)
+
+    x = np.linspace(-3, 3, 61)
+    memberships = compiled_mf(x)
+
+    assert len(leaf.calls) == 1
+    assert len(compiled_mf.nodes) == 2 + 3 * 20
+
+    # Equal leaves and equal subexpressions built from them are merged
+    mf = MaximumTCoNorm.combine(Con.transform(Gaussian(mean=0, std=1)), Con.transform(Gaussian(mean=0.0, std=1.0)))
+    compiled_mf = CompiledMF.from_mf(mf)
+    assert compiled_mf.leaves.n_terms == 1
+    assert len(compiled_mf.nodes) == 2
+    assert np.array_equal(compiled_mf(x), mf(x))
+    assert memberships.shape == x.shape
+
+
+def test_compiled_mf_deep_chain():
+    """
+    Test that chains deeper than the recursion limit compile and evaluate.
+    """
+
+    bank = MFBank.from_mfs([Triangle(a=i - 1, b=i, c=i + 1) for i in range(10)])
+    mfs = [
+        MinimumTNorm.combine(ConstantMF(value=(i % 7) / 7), bank[i % 10]) for i in range(2 * sys.getrecursionlimit())
+    ]
+    compiled_mf = CompiledMF.from_mf(reduce(MaximumTCoNorm.combine, mfs))
+
+    x = np.linspace(-1, 10, 111)
+    expected = np.max([mf(x) for mf in mfs], axis=0)
+
+    assert compiled_mf.leaves.n_terms == 10
+    assert len(compiled_mf.constants) == 7
+    assert np.array_equal(compiled_mf(x), expected)
+
+
+def test_compiled_mf_constant_and_shape():
+    """
+    Test that constant expressions are broadcast to the shape of the input.
+    """
+
+    compiled_mf = CompiledMF.from_mf(AlgebraicProductTNorm.combine(ConstantMF(value=0.5), ConstantMF(value=0.5)))
+    x = np.zeros((3, 4))
+
+    assert np.array_equal(compiled_mf(x), np.full((3, 4), 0.25))
+    assert CompiledMF.from_mf(Triangle(a=0, b=1, c=2))(np.ones((2, 2))).shape == (2, 2)
@@ -0,0 +1,243 @@
+# standard libraries
+import copy
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.defuzz import DEFUZZ
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    rng = np.random.default_rng(0)
+    return rng.uniform(0, 10, size=(50, 2))
+
+
+@pytest.mark.parametrize("defuzz", list(DEFUZZ))
+def test_infer_batch_matches_infer(mamdani_engine, inputs, defuzz):
+    """
+    Test that batched inference matches per sample composition and inference.
+    """
+
+    mamdani_engine.defuzz = DEFUZZ[defuzz]
+    x = np.linspace(0, 1, 201)
+
+    expected = []
+    for row in inputs:
+        mamdani_engine.compose(list(row))
+        expected.append(mamdani_engine.infer(x))
+
+    assert np.allclose(mamdani_engine.infer_batch(inputs, x), expected, rtol=1e-12, atol=0)
+
+
+def test_evaluate_matches_compose(mamdani_engine, inputs):
+    """
+    Test that evaluate returns the rule strengths, composed membership function and output of compose and infer.
+    """
+
+    x = np.linspace(0, 1, 201)
+
+    for row in inputs[:10]:
+        result = mamdani_engine.evaluate(list(row), x)
+        composed_mf = mamdani_engine.compose(list(row))
+
+        assert np.allclose(result.rule_strengths, mamdani_engine.get_rule_strengths(row[np.newaxis])[0])
+        assert np.array_equal(result.composed_mf(x), composed_mf(x))
+        assert result.output == mamdani_engine.infer(x)
+
+    assert mamdani_engine.evaluate([5.0, 5.0]).output is None
+
+
+def test_evaluate_is_stateless(mamdani_engine, inputs):
+    """
+    Test that evaluate does not modify the engine or its rules and can be shared between threads.
+    """
+
+    x = np.linspace(0, 1, 201)
+    engine_state = copy.copy(vars(mamdani_engine))
+    rule_states = [copy.copy(vars(rule)) for rule in mamdani_engine.rules]
+
+    expected = [mamdani_engine.evaluate(list(row), x).output for row in inputs]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outputs = list(executor.map(lambda row: mamdani_engine.evaluate(list(row), x).output, inputs))
+
+    assert outputs == expected
+    assert vars(mamdani_engine) == engine_state
+    assert [vars(rule) for rule in mamdani_engine.rules] == rule_states
+
+
+@pytest.mark.parametrize("defuzz", ["exact_centroid", "exact_bisector", "adaptive_centroid", "adaptive_bisector"])
+def test_infer_batch_exact_without_universe(mamdani_engine, inputs, defuzz):
+    """
+    Test that the exact defuzzification methods infer without a universe of discourse.
+    """
+
+    mamdani_engine.defuzz = DEFUZZ[defuzz]
+
+    outputs = mamdani_engine.infer_batch(inputs)
+
+    assert np.array_equal(outputs, [mamdani_engine.evaluate(list(row)).output for row in inputs])
+
+    mamdani_engine.defuzz = DEFUZZ["centroid"]
+    with pytest.raises(ValueError):
+        mamdani_engine.infer_batch(inputs)
+
+
+def test_infer_batch_many(mamdani_engine, inputs):
+    """
+    Test that inference with several defuzzification methods matches inference with each of them.
+    """
+
+    x = np.linspace(0, 1, 201)
+    methods = list(DEFUZZ)
+
+    outputs = mamdani_engine.infer_batch_many(inputs, x, methods, memory_budget=4096)
+    results = [mamdani_engine.evaluate(list(row), x, methods=methods) for row in inputs[:5]]
+
+    for method in methods:
+        mamdani_engine.defuzz = DEFUZZ[method]
+        assert np.array_equal(outputs[method], mamdani_engine.infer_batch(inputs, x))
+        assert np.allclose([result.outputs[method] for result in results], outputs[method][:5], rtol=1e-12, atol=0)
+
+    with pytest.raises(ValueError):
+        mamdani_engine.infer_batch_many(inputs, x, ["median"])
+    with pytest.raises(ValueError):
+        mamdani_engine.infer_batch_many(inputs, None, ["exact_centroid", "mom"])
+
+
+def test_rule_strengths_shape(mamdani_engine, inputs):
+    """
+    Test the shape of the batched rule strengths and aggregated output.
+    """
+
+    x = np.linspace(0, 1, 101)
+    rule_strengths = mamdani_engine.get_rule_strengths(inputs)
+
+    assert rule_strengths.shape == (len(inputs), len(mamdani_engine.rules))
+    assert mamdani_engine.aggregate(rule_strengths, x).shape == (len(inputs), len(x))
+
+
+def test_infer_batch_invalid_shape(mamdani_engine):
+    """
+    Test that batched inference rejects inputs with the wrong number of columns.
+    """
+
+    with pytest.raises(ValueError):
+        mamdani_engine.infer_batch(np.zeros((4, 3)), np.linspace(0, 1, 11))
+
+
+def test_control_surface_rule_strength(mamdani_engine):
+    """
+    Test that the control surface holds the aggregated rule strength of every grid point.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 7), np.linspace(0, 10, 7)]
+    surface = mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges)
+
+    expected = [
+        np.max([np.min(rule.get_rule_strength([h, a])) for rule in mamdani_engine.rules])
+        for h, a in zip(*[grid.flatten() for grid in np.meshgrid(*antecedent_ranges)])
+    ]
+
+    assert surface.shape == (7, 7)
+    assert np.array_equal(surface.ravel(), expected)
+
+
+def test_control_surface_defuzzified(mamdani_engine):
+    """
+    Test that the control surface holds the defuzzified output of every grid point.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 5), np.linspace(0, 10, 6), np.linspace(0, 10, 4)]
+    x = np.linspace(0, 1, 101)
+    mamdani_engine.rules = [
+        rule.__class__(
+            antecedents=rule.antecedents + [rule.antecedents[0]],
+            operators=rule.operators + ["and"],
+            consequent=rule.consequent,
+            dom_operator=rule.dom_operator,
+            tnorm=rule.tnorm_operator,
+            tconorm=rule.tconorm_operator,
+            implication_operator=rule.implication_operator,
+        )
+        for rule in mamdani_engine.rules
+    ]
+    surface = mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges, x=x)
+
+    flat_meshgrid = np.stack([grid.ravel() for grid in np.meshgrid(*antecedent_ranges)], axis=1)
+
+    assert surface.shape == (5, 6, 4)
+    assert np.array_equal(surface.ravel(), mamdani_engine.infer_batch(flat_meshgrid, x))
+
+
+def test_control_surface_memory_budget(mamdani_engine):
+    """
+    Test that chunking the control surface does not change its values.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 20), np.linspace(0, 10, 20)]
+    x = np.linspace(0, 1, 101)
+
+    for universe in (None, x):
+        surface = mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges, x=universe)
+        chunked_surface = mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges, x=universe, memory_budget=1)
+        assert np.array_equal(surface, chunked_surface)
+
+
+def test_engine_pickle(mamdani_engine, inputs):
+    """
+    Test that composed and compiled engines survive a pickle round trip.
+    """
+
+    x = np.linspace(0, 1, 101)
+    composed_mf = mamdani_engine.compose([5.0, 5.0])
+    mamdani_engine.compile()
+
+    engine = pickle.loads(pickle.dumps(mamdani_engine))
+
+    assert np.array_equal(engine.infer(x), mamdani_engine.infer(x))
+    assert np.array_equal(pickle.loads(pickle.dumps(composed_mf))(x), composed_mf(x))
+    assert np.array_equal(engine.infer_batch(inputs, x), mamdani_engine.infer_batch(inputs, x))
+
+
+def test_evaluate_many_rules():
+    """
+    Test that aggregating more rules than the recursion limit evaluates in one pass.
+    """
+
+    n_rules = 2 * sys.getrecursionlimit()
+    rules = [
+        FuzzyRule(
+            antecedents=[Triangle(a=-1, b=idx / n_rules, c=2)],
+            operators=[],
+            consequent=Triangle(a=idx % 10, b=idx % 10 + 1, c=idx % 10 + 2),
+            dom_operator=MinimumTNorm(),
+            tnorm=MinimumTNorm(),
+            tconorm=MaximumTCoNorm(),
+            implication_operator=MinimumTNorm(),
+        )
+        for idx in range(n_rules)
+    ]
+    engine = MamdaniFuzzyEngine(rules=rules, aggregate_operator=MaximumTCoNorm())
+    x = np.linspace(0, 12, 121)
+
+    # Every rule fires
+    result = engine.evaluate([0.5], x)
+
+    assert np.all(result.rule_strengths > 0)
+    assert np.array_equal(result.composed_mf(x), engine.aggregate(result.rule_strengths[np.newaxis], x)[0])
+    assert result.output == engine.infer_batch([[0.5]], x)[0]
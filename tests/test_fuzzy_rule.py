@@ -0,0 +1,69 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.mf import FuzzySingleton, Gaussian, Trapezoid
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm, MinimumTNorm
+
+
+def make_rule(dom_operator):
+    """
+    Two antecedent rule using the given degree of membership operator.
+    """
+
+    return FuzzyRule(
+        antecedents=[Trapezoid(a=0, b=1, c=3, d=4), Gaussian(mean=2, std=1)],
+        operators=["and"],
+        consequent=Trapezoid(a=0, b=0.2, c=0.4, d=0.6),
+        dom_operator=dom_operator,
+        tnorm=MinimumTNorm(),
+        tconorm=MaximumTCoNorm(),
+        implication_operator=MinimumTNorm(),
+    )
+
+
+@pytest.mark.parametrize(
+    "dom_operator", [MinimumTNorm(), AlgebraicProductTNorm(), BoundedProductTNorm(), DrasticProductTNorm()]
+)
+def test_rule_strength_matches_singleton_fuzzification(dom_operator):
+    """
+    Test that the rule strength is the degree of membership of the fuzzified crisp inputs.
+    """
+
+    rule = make_rule(dom_operator)
+
+    for x in ([0.5, 1.5], [2.0, 4.0], [-1.0, 2.0]):
+        expected = [
+            dom_operator.combine(FuzzySingleton(value=x_i), antecedent)(x_i)
+            for antecedent, x_i in zip(rule.antecedents, x)
+        ]
+        assert rule.get_rule_strength(x) == expected
+
+
+@pytest.mark.parametrize(
+    "dom_operator", [MinimumTNorm(), AlgebraicProductTNorm(), BoundedProductTNorm(), DrasticProductTNorm()]
+)
+def test_rule_strength_vector_inputs(dom_operator):
+    """
+    Test that a vector of crisp inputs per antecedent gives the rule strength of every sample.
+    """
+
+    rule = make_rule(dom_operator)
+    x = [np.linspace(-1, 5, 13), np.linspace(0, 4, 13)]
+
+    rule_strength = rule.get_rule_strength(x)
+    expected = np.array([rule.get_rule_strength([x_0, x_1]) for x_0, x_1 in zip(*x)]).T
+
+    assert np.array_equal(rule_strength, expected)
+
+
+def test_rule_strength_invalid_length():
+    """
+    Test that the number of crisp inputs must match the number of antecedents.
+    """
+
+    with pytest.raises(ValueError):
+        make_rule(MinimumTNorm()).get_rule_strength([1.0])
@@ -1,8 +1,13 @@
+# standard libraries
+import pickle
+
 # third party libraries
 import numpy as np
+import pytest
 
 # fuzzy logic libraries
 from fuzzylogic.hedges import Con, Dil, Dim, Int, Not
+from fuzzylogic.mf import Bell, Gaussian, Sigmoid, Step, Trapezoid
 
 
 class TestNotHedge:
@@ -217,3 +222,59 @@ class TestDimHedge:
     #     # For original values above 0.5, diminished values should be less than original.
     #     assert np.all(diminished_y_vals[original_y_vals <= 0.5] >= original_y_vals[original_y_vals <= 0.5])
     #     assert np.all(diminished_y_vals[original_y_vals > 0.5] <= original_y_vals[original_y_vals > 0.5])
+
+
+@pytest.mark.parametrize("hedge", [Not, Con, Dil, Int, Dim])
+def test_transformed_mf_pickle(hedge):
+    """
+    Test that transformed membership functions survive a pickle round trip.
+    """
+
+    transformed_mf = hedge.transform(Gaussian(mean=0, std=1))
+    x = np.linspace(-3, 3, 13)
+    assert np.array_equal(pickle.loads(pickle.dumps(transformed_mf))(x), transformed_mf(x))
+
+
+@pytest.mark.parametrize("hedge", [Con, Dil, Int, Dim])
+def test_transformed_mf_support_and_core(hedge):
+    """
+    Test that hedges other than Not keep the support and core.
+    """
+
+    transformed_mf = hedge.transform(Trapezoid(a=0, b=1, c=2, d=4))
+    assert transformed_mf.support() == (0, 4)
+    assert transformed_mf.core() == (1, 2)
+
+
+@pytest.mark.parametrize("hedge", [Not, Con, Dil, Int, Dim])
+@pytest.mark.parametrize(
+    "mf", [Gaussian(mean=0, std=1), Bell(center=0, width=1, intensity=2), Sigmoid(center_slope=2, center=0)]
+)
+@pytest.mark.parametrize("tolerance", [1e-9, 1e-4, 0.1])
+def test_transformed_mf_support_tolerance(hedge, mf, tolerance):
+    """
+    Test that a transformed membership function is below tolerance outside of its support.
+    """
+
+    transformed_mf = hedge.transform(mf)
+    low, high = transformed_mf.support(tolerance)
+    x = np.linspace(-100, 100, 20001)
+    outside = x[(x < low) | (x > high)]
+
+    assert np.all(transformed_mf(outside) <= tolerance)
+
+
+def test_not_support_and_core():
+    """
+    Test that Not swaps the complements of the support and core.
+    """
+
+    complemented_mf = Not.transform(Step(limit=1))
+    low, high = complemented_mf.core()
+    assert complemented_mf.support() == (-np.inf, 1)
+    assert low == -np.inf and high < 1
+    assert complemented_mf(np.array([high])) == 1
+
+    # The complement of a bounded membership function is unbounded on both sides
+    assert Not.transform(Trapezoid(a=0, b=1, c=2, d=4)).support() == (-np.inf, np.inf)
+    assert Not.transform(Gaussian(mean=0, std=1)).core()[0] == np.inf
@@ -0,0 +1,124 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.fuzzy_engine import IT2FuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.mf import IntervalType2MF
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
+
+
+def it2_engine(mamdani_engine, spread, type_reduction="centroid"):
+    """
+    Blurs the antecedents and consequents of the Mamdani engine into an IT2 engine.
+    """
+
+    rules = [
+        FuzzyRule(
+            antecedents=[IntervalType2MF.from_mf(mf, spread) for mf in rule.antecedents],
+            operators=rule.operators,
+            consequent=IntervalType2MF.from_mf(rule.consequent, spread / 10),
+            dom_operator=rule.dom_operator,
+            tnorm=rule.tnorm_operator,
+            tconorm=rule.tconorm_operator,
+            implication_operator=rule.implication_operator,
+        )
+        for rule in mamdani_engine.rules
+    ]
+
+    return IT2FuzzyEngine(rules=rules, aggregate_operator=MaximumTCoNorm(), type_reduction=type_reduction)
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    rng = np.random.default_rng(0)
+    return rng.uniform(0, 10, size=(50, 2))
+
+
+def test_it2_zero_spread_matches_mamdani(mamdani_engine, inputs):
+    """
+    Test that an IT2 engine without uncertainty reduces to the type-1 Mamdani engine.
+    """
+
+    x = np.linspace(0, 1, 1001)
+    intervals = it2_engine(mamdani_engine, spread=0).infer_interval_batch(inputs, x)
+
+    assert np.allclose(intervals[:, 0], intervals[:, 1], rtol=0, atol=1e-12)
+    assert np.allclose(intervals[:, 0], mamdani_engine.infer_batch(inputs, x), rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("type_reduction", ["centroid", "center_of_sets"])
+def test_it2_evaluate_matches_batch(mamdani_engine, inputs, type_reduction):
+    """
+    Test that per sample inference matches batched inference and chunking does not change it.
+    """
+
+    engine = it2_engine(mamdani_engine, spread=0.5, type_reduction=type_reduction)
+    x = np.linspace(0, 1, 1001)
+    intervals = engine.infer_interval_batch(inputs, x)
+
+    assert np.all(intervals[:, 0] <= intervals[:, 1])
+    assert np.allclose(engine.infer_interval_batch(inputs, x, memory_budget=1), intervals, rtol=0, atol=1e-12)
+
+    for row, output in zip(inputs[:10], engine.infer_batch(inputs, x)):
+        result = engine.evaluate(list(row), x)
+        assert result.output == pytest.approx(output, rel=1e-12)
+        assert result.rule_strengths.shape == (2, len(engine.rules))
+        assert np.all(result.rule_strengths[0] <= result.rule_strengths[1])
+
+        engine.compose(list(row))
+        assert engine.infer(x) == pytest.approx(output, rel=1e-12)
+
+
+def test_it2_composed_mf(mamdani_engine, inputs):
+    """
+    Test that the composed consequent mf evaluates to the aggregated lower and upper consequents.
+    """
+
+    engine = it2_engine(mamdani_engine, spread=0.5)
+    x = np.linspace(0, 1, 101)
+
+    for row in inputs[:10]:
+        composed_mf = engine.compose(list(row))
+        expected = engine.aggregate(engine.get_rule_strengths(row[np.newaxis]), x)[:, 0]
+        assert np.allclose(composed_mf(x), expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("indexing", ["xy", "ij"])
+def test_it2_control_surface_non_square(mamdani_engine, indexing):
+    """
+    Test that a non-square control surface is laid out like the meshgrid of the antecedent ranges.
+    """
+
+    engine = it2_engine(mamdani_engine, spread=0.5)
+    x = np.linspace(0, 1, 101)
+    antecedent_ranges = [np.linspace(0, 10, 3), np.linspace(0, 10, 5)]
+    surface = engine.calculate_fuzzy_control_surface(antecedent_ranges, x, indexing=indexing)
+    grids = np.meshgrid(*antecedent_ranges, indexing=indexing)
+
+    assert surface.shape == grids[0].shape
+    for idx in np.ndindex(surface.shape):
+        assert surface[idx] == pytest.approx(engine.evaluate([grid[idx] for grid in grids], x).output, rel=1e-12)
+
+
+def test_it2_invalid(mamdani_engine):
+    """
+    Test that type-1 rules, invalid operators and type reductions raise errors.
+    """
+
+    engine = it2_engine(mamdani_engine, spread=0.5)
+
+    with pytest.raises(TypeError):
+        IT2FuzzyEngine(rules=mamdani_engine.rules, aggregate_operator=MaximumTCoNorm())
+    with pytest.raises(TypeError):
+        IT2FuzzyEngine(rules=engine.rules, aggregate_operator=MinimumTNorm())
+    with pytest.raises(ValueError):
+        IT2FuzzyEngine(rules=engine.rules, aggregate_operator=MaximumTCoNorm(), type_reduction="unknown")
+    with pytest.raises(ValueError):
+        engine.infer_batch(np.zeros((1, 2)))
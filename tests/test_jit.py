@@ -0,0 +1,133 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic import fuzzy_engine
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.hedges import Con, Dil, Dim, Int, Not
+from fuzzylogic.jit import JITRuleBase
+from fuzzylogic.mf import Gaussian
+from fuzzylogic.mf.bank import MFBank
+from fuzzylogic.mf.bell import Bell
+from fuzzylogic.mf.linear import Linear
+from fuzzylogic.mf.sigmoid import Sigmoid
+from fuzzylogic.mf.trap import Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.rule_base import CompiledRuleBase
+from fuzzylogic.tconorms import AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm, MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm, MinimumTNorm
+
+TNORMS = [MinimumTNorm(), AlgebraicProductTNorm(), BoundedProductTNorm(), DrasticProductTNorm()]
+TCONORMS = [MaximumTCoNorm(), AlgebraicSumTCoNorm(), BoundedSumTCoNorm(), DrasticSumTCoNorm()]
+
+
+def random_engine(aggregate_operator, seed=0):
+    """
+    Three input Mamdani engine with every membership function family, hedge and operator the kernels support.
+    """
+
+    rng = np.random.default_rng(seed)
+    bank = MFBank.from_mfs([Triangle(a=0, b=2, c=4), Triangle(a=3, b=5, c=7), Triangle(a=6, b=8, c=10)])
+    antecedents = [
+        Triangle(a=0, b=3, c=6),
+        Trapezoid(a=2, b=4, c=6, d=9),
+        Gaussian(mean=5, std=2),
+        Bell(center=5, width=2, intensity=2),
+        Sigmoid(center_slope=1, center=5),
+        Linear(m=0.1, b=0.1),
+        Con.transform(Int.transform(Triangle(a=1, b=5, c=9))),
+        Dim.transform(Gaussian(mean=3, std=1)),
+        Not.transform(Sigmoid(center_slope=-1, center=4)),
+        bank[1],
+        Dil.transform(bank[2]),
+    ]
+    consequents = [Triangle(a=0, b=0.2, c=0.4), Triangle(a=0.3, b=0.5, c=0.7), Gaussian(mean=0.8, std=0.1)]
+
+    rules = [
+        FuzzyRule(
+            antecedents=[antecedents[idx] for idx in rng.integers(len(antecedents), size=3)],
+            operators=list(rng.choice(["and", "or"], size=2)),
+            consequent=consequents[rng.integers(len(consequents))],
+            dom_operator=TNORMS[rng.integers(len(TNORMS))],
+            tnorm=TNORMS[rng.integers(len(TNORMS))],
+            tconorm=TCONORMS[rng.integers(len(TCONORMS))],
+            implication_operator=TNORMS[rng.integers(2)],
+        )
+        for _ in range(12)
+    ]
+
+    return MamdaniFuzzyEngine(rules=rules, aggregate_operator=aggregate_operator)
+
+
+@pytest.mark.parametrize("aggregate_operator", TCONORMS, ids=type)
+def test_jit_rule_base_matches_compiled(aggregate_operator):
+    """
+    Test that the kernels fire, aggregate and defuzzify like the NumPy path, compiled or as plain Python.
+    """
+
+    engine = random_engine(aggregate_operator)
+    inputs = np.random.default_rng(1).uniform(0, 10, size=(50, 3))
+    x = np.linspace(0, 1, 101)
+    methods = ["centroid", "bisector", "mom", "lom", "som"]
+
+    engine.compile()
+    rule_strengths = engine.get_rule_strengths(inputs)
+    aggregated_mf = engine.aggregate(rule_strengths, x)
+    expected = engine.infer_batch_many(inputs, x, methods)
+
+    engine.compiled_rule_base = JITRuleBase(rules=engine.rules, aggregate_operator=aggregate_operator)
+    assert np.allclose(engine.get_rule_strengths(inputs), rule_strengths, rtol=0, atol=1e-12)
+    assert np.allclose(engine.aggregate(rule_strengths, x), aggregated_mf, rtol=0, atol=1e-12)
+    outputs = engine.infer_batch_many(inputs, x, methods)
+    assert set(outputs) == set(methods)
+    assert np.allclose(outputs["centroid"], expected["centroid"], rtol=0, atol=1e-12)
+    assert np.allclose(outputs["mom"], expected["mom"], rtol=0, atol=1e-12)
+    for method in ["bisector", "lom", "som"]:
+        assert np.array_equal(outputs[method], expected[method])
+
+
+def test_jit_zero_area(mamdani_engine):
+    """
+    Test that the kernels raise the same zero area errors as the NumPy path.
+    """
+
+    mamdani_engine.compiled_rule_base = JITRuleBase(mamdani_engine.rules, mamdani_engine.aggregate_operator)
+
+    with pytest.raises(ValueError, match="area of zero"):
+        mamdani_engine.infer_batch(np.array([[5.0, 5.0]]), np.linspace(2, 3, 11))
+
+
+def test_compile_numba_fallback(mamdani_engine, monkeypatch):
+    """
+    Test that the numba backend falls back to the numpy backend without Numba.
+    """
+
+    monkeypatch.setattr(fuzzy_engine, "NUMBA_AVAILABLE", False)
+
+    with pytest.warns(RuntimeWarning, match="Numba"):
+        compiled_rule_base = mamdani_engine.compile(backend="numba")
+
+    assert type(compiled_rule_base) is CompiledRuleBase
+    with pytest.raises(ValueError):
+        mamdani_engine.compile(backend="unknown")
+
+
+def test_compile_numba(mamdani_engine):
+    """
+    Test that the numba backend matches the numpy backend and falls back on antecedents without a kernel.
+    """
+
+    pytest.importorskip("numba")
+
+    inputs = np.random.default_rng(0).uniform(0, 10, size=(1000, 2))
+    x = np.linspace(0, 1, 101)
+    expected = mamdani_engine.infer_batch(inputs, x)
+
+    assert isinstance(mamdani_engine.compile(backend="numba"), JITRuleBase)
+    assert np.allclose(mamdani_engine.infer_batch(inputs, x), expected, rtol=0, atol=1e-12)
+
+    mamdani_engine.rules[0].antecedents[0] = MinimumTNorm.combine(Triangle(a=0, b=1, c=2), Triangle(a=1, b=2, c=3))
+    with pytest.warns(RuntimeWarning, match="CombinedMF"):
+        assert type(mamdani_engine.compile(backend="numba")) is CompiledRuleBase
@@ -0,0 +1,94 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.lookup import LookupTable
+
+
+def test_lookup_table_grid_points(mamdani_engine):
+    """
+    Test that the lookup table holds the engine output at the grid points.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 11), np.linspace(0, 10, 6)]
+    x = np.linspace(0, 1, 101)
+    table = LookupTable.from_engine(mamdani_engine, antecedent_ranges, x=x, n_validation=0)
+
+    grid = np.stack([grid.ravel() for grid in np.meshgrid(*antecedent_ranges, indexing="ij")], axis=1)
+
+    assert table.values.shape == (11, 6)
+    assert table.max_error is None
+    assert np.allclose(table(grid), mamdani_engine.infer_batch(grid, x), rtol=0, atol=1e-12)
+
+
+def test_lookup_table_requires_universe(mamdani_engine):
+    """
+    Test that baking a sampling defuzzification method without a universe of discourse raises an error.
+    """
+
+    with pytest.raises(ValueError, match="requires a universe of discourse"):
+        LookupTable.from_engine(mamdani_engine, [np.linspace(0, 10, 11)] * 2, n_validation=0)
+
+
+def test_lookup_table_multilinear():
+    """
+    Test that multilinear interpolation is exact for multilinear functions and clamps to the antecedent ranges.
+    """
+
+    antecedent_ranges = [np.array([0.0, 1.0, 3.0]), np.array([-1.0, 0.0, 2.0, 5.0]), np.array([0.0, 2.0])]
+    grid = np.meshgrid(*antecedent_ranges, indexing="ij")
+    table = LookupTable(antecedent_ranges, values=1 + 2 * grid[0] - grid[1] + 0.5 * grid[0] * grid[2])
+
+    rng = np.random.default_rng(0)
+    inputs = rng.uniform([0, -1, 0], [3, 5, 2], size=(100, 3))
+
+    assert np.allclose(table(inputs), 1 + 2 * inputs[:, 0] - inputs[:, 1] + 0.5 * inputs[:, 0] * inputs[:, 2])
+    assert table(np.array([[-5.0, 10.0, 1.0]])) == pytest.approx(table(np.array([[0.0, 5.0, 1.0]])))
+
+
+def test_lookup_table_max_error(mamdani_engine):
+    """
+    Test that the measured maximum error bounds the error on the validation points and shrinks with the grid.
+    """
+
+    x = np.linspace(0, 1, 101)
+    coarse = LookupTable.from_engine(mamdani_engine, [np.linspace(0, 10, 6)] * 2, x=x, seed=0)
+    fine = LookupTable.from_engine(mamdani_engine, [np.linspace(0, 10, 81)] * 2, x=x, seed=0)
+
+    inputs = np.random.default_rng(0).uniform(0, 10, size=(1000, 2))
+
+    assert np.max(np.abs(fine(inputs) - mamdani_engine.infer_batch(inputs, x))) == pytest.approx(fine.max_error)
+    assert 0 < fine.max_error < coarse.max_error
+
+
+def test_lookup_table_save_load(mamdani_engine, tmp_path):
+    """
+    Test that a saved lookup table is loaded memory mapped and answers queries like the original.
+    """
+
+    table = LookupTable.from_engine(
+        mamdani_engine, [np.linspace(0, 10, 21), np.linspace(0, 10, 11)], x=np.linspace(0, 1, 101), seed=0
+    )
+    table.save(tmp_path / "table.npz")
+
+    loaded = LookupTable.load(tmp_path / "table.npz")
+    inputs = np.random.default_rng(1).uniform(0, 10, size=(50, 2))
+
+    assert isinstance(loaded.values, np.memmap)
+    assert loaded.max_error == table.max_error
+    assert np.array_equal(loaded(inputs), table(inputs))
+    assert np.array_equal(LookupTable.load(tmp_path / "table.npz", mmap_mode=None).values, table.values)
+
+
+def test_lookup_table_invalid():
+    """
+    Test that the antecedent ranges, values and inputs are validated.
+    """
+
+    with pytest.raises(ValueError):
+        LookupTable([np.array([0.0, 0.0, 1.0])], values=np.zeros(3))
+    with pytest.raises(ValueError):
+        LookupTable([np.array([0.0, 1.0])], values=np.zeros(3))
+    with pytest.raises(ValueError):
+        LookupTable([np.array([0.0, 1.0])], values=np.zeros(2))(np.zeros((4, 2)))
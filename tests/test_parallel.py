@@ -0,0 +1,59 @@
+# standard libraries
+import multiprocessing
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.parallel import parallel_infer_batch
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    return np.random.default_rng(0).uniform(0, 10, size=(1001, 2))
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_parallel_infer_batch(mamdani_engine, inputs, backend):
+    """
+    Test that parallel inference returns the batched outputs in order.
+    """
+
+    x = np.linspace(0, 1, 101)
+    outputs = parallel_infer_batch(mamdani_engine, inputs, x, n_workers=2, backend=backend)
+
+    assert np.array_equal(outputs, mamdani_engine.infer_batch(inputs, x))
+
+
+def test_parallel_infer_batch_spawn(mamdani_engine, inputs):
+    """
+    Test that the engine is shipped to spawned workers.
+    """
+
+    x = np.linspace(0, 1, 101)
+    mamdani_engine.compile()
+    outputs = parallel_infer_batch(
+        mamdani_engine, inputs, x, n_workers=2, shard_size=100, mp_context=multiprocessing.get_context("spawn")
+    )
+
+    assert np.array_equal(outputs, mamdani_engine.infer_batch(inputs, x))
+
+
+def test_parallel_infer_batch_errors(mamdani_engine):
+    """
+    Test that worker errors are raised to the caller.
+    """
+
+    x = np.linspace(0, 1, 101)
+
+    for backend in ("process", "thread"):
+        with pytest.raises(ValueError):
+            parallel_infer_batch(mamdani_engine, np.zeros((10, 3)), x, n_workers=2, backend=backend)
+
+    with pytest.raises(ValueError):
+        parallel_infer_batch(mamdani_engine, np.zeros((10, 2)), x, backend="gpu")
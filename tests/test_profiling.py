@@ -0,0 +1,122 @@
+# standard libraries
+import json
+import pickle
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.profiling import STAGES, InferenceProfiler
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    rng = np.random.default_rng(0)
+    return rng.uniform(0, 10, size=(20, 2))
+
+
+def test_profile_evaluate(mamdani_engine, inputs):
+    """
+    Test that evaluate records every stage and every rule of every input while profiled, and nothing afterwards.
+    """
+
+    x = np.linspace(0, 1, 101)
+
+    with mamdani_engine.profile() as profiler:
+        rule_strengths = np.array([mamdani_engine.evaluate(list(row), x).rule_strengths for row in inputs])
+
+    assert mamdani_engine.profiler is None
+    assert profiler.n_samples == len(inputs)
+    assert all(profiler.stage_calls[stage] >= len(inputs) for stage in STAGES)
+    assert all(profiler.stage_times[stage] > 0 for stage in STAGES)
+    assert np.array_equal(profiler.rule_calls, np.full(len(mamdani_engine.rules), len(inputs)))
+    assert np.all(profiler.rule_times > 0)
+    assert np.array_equal(profiler.rule_fired, np.sum(rule_strengths > 0, axis=0))
+    assert np.array_equal(profiler.rule_histograms.sum(axis=1), profiler.rule_fired)
+
+    mamdani_engine.evaluate(list(inputs[0]), x)
+    assert profiler.n_samples == len(inputs)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+@pytest.mark.parametrize("defuzz", ["centroid", "exact_centroid"])
+def test_profile_infer_batch(mamdani_engine, inputs, compiled, defuzz):
+    """
+    Test that batched inference records every stage and the firing of every rule, but does not time the rules.
+    """
+
+    if compiled:
+        mamdani_engine.compile()
+    rule_strengths = mamdani_engine.get_rule_strengths(inputs)
+
+    with mamdani_engine.profile() as profiler:
+        outputs = mamdani_engine.infer_batch_many(inputs, np.linspace(0, 1, 101), [defuzz])[defuzz]
+
+    assert np.all(np.isfinite(outputs))
+    assert profiler.n_samples == len(inputs)
+    assert all(profiler.stage_calls[stage] > 0 for stage in ("fuzzification", "rule_firing", "defuzzification"))
+    assert np.array_equal(profiler.rule_calls, np.zeros(len(mamdani_engine.rules)))
+    assert np.array_equal(profiler.rule_fired, np.sum(rule_strengths > 0, axis=0))
+
+
+def test_dead_rules(mamdani_engine):
+    """
+    Test that the rules that never fire are reported as dead.
+    """
+
+    with mamdani_engine.profile() as profiler:
+        mamdani_engine.infer_batch(np.array([[0.0, 0.0], [1.0, 1.5]]), np.linspace(0, 1, 101))
+
+    assert profiler.dead_rules().tolist() == [2]
+
+
+def test_record_rule_strengths():
+    """
+    Test that firing strengths are binned into (k / n_bins, (k + 1) / n_bins] and zeros are not binned.
+    """
+
+    profiler = InferenceProfiler(n_rules=5, n_bins=10)
+    profiler.record_rule_strengths(np.array([0, 0.05, 0.1, 0.15, 1.0]))
+
+    assert profiler.n_samples == 1
+    assert profiler.rule_fired.tolist() == [0, 1, 1, 1, 1]
+    assert np.argmax(profiler.rule_histograms, axis=1)[1:].tolist() == [0, 0, 1, 9]
+    assert profiler.rule_histograms[0].sum() == 0
+
+
+def test_export(mamdani_engine, inputs):
+    """
+    Test that the profile exports to JSON, pickles and resets.
+    """
+
+    with mamdani_engine.profile(n_bins=4) as profiler:
+        mamdani_engine.infer_batch(inputs, np.linspace(0, 1, 101))
+
+    profile = profiler.as_dict()
+    assert json.loads(profiler.to_json()) == profile
+    assert profile["n_samples"] == len(inputs)
+    assert profile["bin_edges"] == [0, 0.25, 0.5, 0.75, 1]
+    assert list(profile["stages"]) == list(STAGES)
+    assert [rule["fired"] for rule in profile["rules"]] == profiler.rule_fired.tolist()
+
+    assert pickle.loads(pickle.dumps(profiler)).as_dict() == profile
+
+    profiler.reset()
+    assert profiler.n_samples == 0
+    assert not np.any(profiler.rule_histograms)
+
+
+def test_invalid_profiler():
+    """
+    Test that invalid histograms and stages raise errors.
+    """
+
+    with pytest.raises(ValueError):
+        InferenceProfiler(n_rules=1, n_bins=0)
+    with pytest.raises(ValueError):
+        InferenceProfiler(n_rules=1).record_stage("unknown", 1.0)
@@ -0,0 +1,152 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.hedges import Con
+from fuzzylogic.mf import Bell, Rectangular, Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.rule_base import CompiledRuleBase, aggregate_clipped_consequents, support_slices
+from fuzzylogic.tconorms import AlgebraicSumTCoNorm, BoundedSumTCoNorm, MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, BoundedProductTNorm, MinimumTNorm
+
+
+@pytest.fixture
+def mixed_engine():
+    """
+    Mamdani engine mixing membership function families and operators.
+    """
+
+    low_mf = Triangle(a=0, b=2, c=5)
+    rules = [
+        FuzzyRule(
+            antecedents=[low_mf, Trapezoid(a=0, b=1, c=3, d=6), Bell(center=5, width=2, intensity=2)],
+            operators=["and", "or"],
+            consequent=Triangle(a=0, b=0.25, c=0.5),
+            dom_operator=MinimumTNorm(),
+            tnorm=AlgebraicProductTNorm(),
+            tconorm=MaximumTCoNorm(),
+            implication_operator=MinimumTNorm(),
+        ),
+        FuzzyRule(
+            antecedents=[Triangle(a=0, b=2, c=5), Con.transform(low_mf), Rectangular(low=4, high=8)],
+            operators=["or", "and"],
+            consequent=Triangle(a=0.25, b=0.5, c=0.75),
+            dom_operator=BoundedProductTNorm(),
+            tnorm=MinimumTNorm(),
+            tconorm=AlgebraicSumTCoNorm(),
+            implication_operator=AlgebraicProductTNorm(),
+        ),
+        FuzzyRule(
+            antecedents=[Triangle(a=4, b=7, c=10), Triangle(a=4, b=7, c=10), Triangle(a=4, b=7, c=10)],
+            operators=["and", "and"],
+            consequent=Triangle(a=0.5, b=0.75, c=1),
+            dom_operator=AlgebraicProductTNorm(),
+            tnorm=BoundedProductTNorm(),
+            tconorm=BoundedSumTCoNorm(),
+            implication_operator=MinimumTNorm(),
+        ),
+    ]
+
+    return MamdaniFuzzyEngine(rules=rules, aggregate_operator=AlgebraicSumTCoNorm(), defuzz="centroid")
+
+
+def test_compiled_rule_base_deduplicates_terms(mixed_engine):
+    """
+    Test that equal antecedents are evaluated once.
+    """
+
+    compiled_rule_base = mixed_engine.compile()
+
+    assert [term_table.n_terms for term_table in compiled_rule_base.term_tables] == [2, 3, 3]
+    assert compiled_rule_base.consequent_table.n_terms == 3
+    assert len(compiled_rule_base.operators) == 5
+
+
+def test_compiled_rule_base_matches_rules(mixed_engine):
+    """
+    Test that the compiled rule base gives the same results as the rules.
+    """
+
+    inputs = np.random.default_rng(0).uniform(0, 10, size=(100, 3))
+    x = np.linspace(0, 1, 101)
+
+    rule_strengths = mixed_engine.get_rule_strengths(inputs)
+    aggregated_mf = mixed_engine.aggregate(rule_strengths, x)
+    outputs = mixed_engine.infer_batch(inputs, x)
+
+    mixed_engine.compile()
+
+    assert np.array_equal(mixed_engine.get_rule_strengths(inputs), rule_strengths)
+    assert np.array_equal(mixed_engine.aggregate(rule_strengths, x), aggregated_mf)
+    assert np.array_equal(mixed_engine.infer_batch(inputs, x), outputs)
+
+
+def test_compiled_control_surface(mamdani_engine):
+    """
+    Test that the compiled rule base gives the same control surface as the rules.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 11), np.linspace(0, 10, 11)]
+    surface = mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges)
+
+    mamdani_engine.compile()
+
+    assert np.array_equal(mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges), surface)
+
+
+def test_compiled_rule_base_invalid_rules(mixed_engine):
+    """
+    Test that rules with a different number of antecedents cannot be compiled.
+    """
+
+    rules = mixed_engine.rules[:1] + [
+        FuzzyRule(
+            antecedents=[Triangle(a=0, b=1, c=2)],
+            operators=[],
+            consequent=Triangle(a=0, b=1, c=2),
+            dom_operator=MinimumTNorm(),
+            tnorm=MinimumTNorm(),
+            tconorm=MaximumTCoNorm(),
+            implication_operator=MinimumTNorm(),
+        )
+    ]
+
+    with pytest.raises(ValueError):
+        CompiledRuleBase(rules=rules, aggregate_operator=MaximumTCoNorm())
+
+
+@pytest.mark.parametrize("x", [np.linspace(-5, 5, 1001), np.random.default_rng(1).uniform(-5, 5, 1001)])
+def test_aggregate_on_consequent_supports(mixed_engine, x):
+    """
+    Test that aggregating the consequents on their support only does not change the aggregate.
+    """
+
+    inputs = np.random.default_rng(0).uniform(0, 10, size=(100, 3))
+    rule_strengths = mixed_engine.get_rule_strengths(inputs)
+    rules = mixed_engine.rules
+
+    aggregated_mf = aggregate_clipped_consequents(
+        rule_strengths,
+        [rule.consequent(x) for rule in rules],
+        [type(rule.implication_operator) for rule in rules],
+        mixed_engine.aggregate_operator,
+    )
+
+    assert np.array_equal(mixed_engine.aggregate(rule_strengths, x), aggregated_mf)
+    mixed_engine.compile()
+    assert np.array_equal(mixed_engine.aggregate(rule_strengths, x), aggregated_mf)
+
+
+def test_support_slices():
+    """
+    Test the slices of a sorted universe holding the supports.
+    """
+
+    x = np.linspace(0, 10, 11)
+    supports = np.array([[2.5, 4], [-np.inf, 1], [11, 12], [np.inf, -np.inf]])
+
+    assert support_slices(supports, x) == [slice(3, 5), slice(0, 2), slice(11, 11), slice(11, 11)]
+    assert support_slices(supports, x[::-1]) == [slice(None)] * 4
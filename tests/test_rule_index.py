@@ -0,0 +1,180 @@
+# standard libraries
+import itertools
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic import rule_base
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine
+from fuzzylogic.fuzzy_rule import FuzzyRule
+from fuzzylogic.hedges import Con
+from fuzzylogic.mf import Gaussian, Rectangular, Step, Trapezoid
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.rule_index import RuleIndex
+from fuzzylogic.tconorms import AlgebraicSumTCoNorm, MaximumTCoNorm
+from fuzzylogic.tnorms import AlgebraicProductTNorm, MinimumTNorm
+
+
+@pytest.fixture
+def grid_engine():
+    """
+    Three input engine with one rule per combination of triangle, trapezoid and rectangular terms.
+    """
+
+    terms = [
+        [Triangle(a=i - 1, b=i, c=i + 1) for i in range(4)],
+        [Trapezoid(a=i - 1, b=i - 0.5, c=i + 0.5, d=i + 1) for i in range(4)],
+        [Rectangular(low=i - 0.5, high=i + 0.5) for i in range(4)],
+    ]
+    consequents = [Triangle(a=i / 3 - 0.2, b=i / 3, c=i / 3 + 0.2) for i in range(4)]
+    rule_kwargs = dict(
+        dom_operator=MinimumTNorm(),
+        tnorm=AlgebraicProductTNorm(),
+        tconorm=MaximumTCoNorm(),
+        implication_operator=MinimumTNorm(),
+    )
+
+    rules = [
+        FuzzyRule(antecedents=list(antecedents), operators=["and", "and"], consequent=consequents[i % 4], **rule_kwargs)
+        for i, antecedents in enumerate(itertools.product(*terms))
+    ]
+    rules.append(
+        FuzzyRule(
+            antecedents=[Gaussian(mean=1, std=1), terms[1][0], terms[2][0]],
+            operators=["and", "and"],
+            consequent=consequents[0],
+            **rule_kwargs,
+        )
+    )
+    rules.append(
+        FuzzyRule(
+            antecedents=[terms[0][3], terms[1][3], terms[2][3]],
+            operators=["or", "and"],
+            consequent=consequents[3],
+            **rule_kwargs,
+        )
+    )
+
+    return MamdaniFuzzyEngine(rules=rules, aggregate_operator=AlgebraicSumTCoNorm())
+
+
+def test_rule_index_candidates(grid_engine):
+    """
+    Test that every rule that fires is a candidate and few other rules are.
+    """
+
+    rng = np.random.default_rng(0)
+    inputs = np.concatenate([rng.uniform(-1, 4, size=(500, 3)), rng.integers(-1, 5, size=(100, 3)) / 2])
+
+    candidates = RuleIndex(grid_engine.rules).candidates(inputs)
+    rule_strengths = grid_engine.get_rule_strengths(inputs)
+
+    assert candidates.shape == rule_strengths.shape
+    assert np.all(candidates[rule_strengths > 0])
+    assert np.all(candidates[:, -1])
+    # Off the bounds at most two terms of every input overlap, on the bounds the closed supports of three can
+    assert candidates[:500, :-2].sum(axis=1).max() <= 8
+    assert candidates[500:, :-2].sum(axis=1).max() <= 27
+    assert not np.any(RuleIndex(grid_engine.rules).candidates(np.full((1, 3), 10.0))[0, :-2])
+
+
+def test_rule_index_evaluate(grid_engine):
+    """
+    Test that indexed evaluation matches evaluating every rule.
+    """
+
+    rng = np.random.default_rng(1)
+    x = np.linspace(-0.2, 1.2, 141)
+    inputs = rng.uniform(0, 3, size=(30, 3))
+
+    expected = [grid_engine.evaluate(list(row), x) for row in inputs]
+    grid_engine.build_rule_index()
+    results = [grid_engine.evaluate(list(row), x) for row in inputs]
+
+    for result, expected_result in zip(results, expected):
+        assert np.array_equal(result.rule_strengths, expected_result.rule_strengths)
+        assert np.array_equal(result.composed_mf(x), expected_result.composed_mf(x))
+        assert result.output == expected_result.output
+
+
+def test_rule_index_batch(grid_engine, monkeypatch):
+    """
+    Test that indexed batched inference fires every rule on its candidate samples only and matches firing every rule.
+    """
+
+    rng = np.random.default_rng(3)
+    x = np.linspace(-0.2, 1.2, 141)
+    inputs = rng.uniform(0, 3, size=(200, 3))
+
+    expected_strengths = grid_engine.get_rule_strengths(inputs)
+    expected = grid_engine.infer_batch(inputs, x)
+    candidates = grid_engine.build_rule_index().candidates(inputs)
+
+    n_fired = []
+    for rule in grid_engine.rules:
+        get_firing_strengths = rule.get_firing_strengths
+
+        def counted(inputs, profiler=None, get_firing_strengths=get_firing_strengths):
+            n_fired.append(len(inputs))
+            return get_firing_strengths(inputs, profiler)
+
+        monkeypatch.setattr(rule, "get_firing_strengths", counted)
+
+    assert np.array_equal(grid_engine.get_rule_strengths(inputs), expected_strengths)
+    assert sum(n_fired) == candidates.sum() < candidates.size
+    assert np.array_equal(grid_engine.infer_batch(inputs, x), expected)
+
+
+def test_sparse_aggregation(grid_engine, monkeypatch):
+    """
+    Test that aggregating rules only on the samples for which they fire does not change the aggregate.
+    """
+
+    rng = np.random.default_rng(2)
+    x = np.linspace(-0.2, 1.2, 141)
+    inputs = rng.uniform(0, 3, size=(200, 3))
+    rule_strengths = grid_engine.get_rule_strengths(inputs)
+
+    monkeypatch.setattr(rule_base, "SPARSE_AGGREGATION_FRACTION", 0)
+    dense = grid_engine.aggregate(rule_strengths, x)
+    monkeypatch.setattr(rule_base, "SPARSE_AGGREGATION_FRACTION", 1)
+    sparse = grid_engine.aggregate(rule_strengths, x)
+    grid_engine.compile()
+    compiled_sparse = grid_engine.aggregate(rule_strengths, x)
+
+    assert np.array_equal(sparse, dense)
+    assert np.array_equal(compiled_sparse, dense)
+
+
+def test_rule_index_composite_antecedents():
+    """
+    Test that the index bounds antecedents from the support of composite membership functions.
+    """
+
+    rule_kwargs = dict(
+        dom_operator=MinimumTNorm(),
+        tnorm=MinimumTNorm(),
+        tconorm=MaximumTCoNorm(),
+        implication_operator=MinimumTNorm(),
+    )
+    rules = [
+        FuzzyRule(
+            antecedents=[Con.transform(Triangle(a=0, b=1, c=2)), Step(limit=1)],
+            operators=["and"],
+            consequent=Triangle(a=0, b=0.5, c=1),
+            **rule_kwargs,
+        ),
+        FuzzyRule(
+            antecedents=[MinimumTNorm.combine(Gaussian(mean=0, std=1), Rectangular(low=3, high=4)), Step(limit=1)],
+            operators=["and"],
+            consequent=Triangle(a=0, b=0.5, c=1),
+            **rule_kwargs,
+        ),
+    ]
+    rule_index = RuleIndex(rules)
+
+    assert rule_index.candidate_rules([1, 2]).tolist() == [0]
+    assert rule_index.candidate_rules([3.5, 2]).tolist() == [1]
+    assert rule_index.candidate_rules([3.5, 0]).tolist() == []
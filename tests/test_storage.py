@@ -0,0 +1,86 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.storage import ControlSurface, load_npz, save_npz
+
+
+def test_npz_memory_mapped(tmp_path):
+    """
+    Test that the members of a saved .npz file are memory mapped with their values.
+    """
+
+    arrays = {
+        "matrix": np.arange(12.0).reshape(3, 4),
+        "fortran": np.asfortranarray(np.arange(6).reshape(2, 3)),
+        "scalar": np.array(0.5),
+        "empty": np.zeros((0, 2)),
+    }
+    save_npz(tmp_path / "arrays.npz", **arrays)
+
+    loaded = load_npz(tmp_path / "arrays.npz")
+
+    assert isinstance(loaded["matrix"], np.memmap)
+    for name, array in arrays.items():
+        assert loaded[name].shape == array.shape
+        assert np.array_equal(loaded[name], array)
+
+
+def test_npz_compressed(tmp_path):
+    """
+    Test that compressed members are read into memory but cannot be memory mapped.
+    """
+
+    np.savez_compressed(tmp_path / "arrays.npz", values=np.arange(5))
+
+    assert np.array_equal(load_npz(tmp_path / "arrays.npz", mmap_mode=None)["values"], np.arange(5))
+    with pytest.raises(ValueError):
+        load_npz(tmp_path / "arrays.npz")
+
+
+def test_control_surface_save_load(mamdani_engine, tmp_path):
+    """
+    Test that a saved control surface is loaded memory mapped with its antecedent ranges and fingerprint.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 7), np.linspace(0, 10, 5)]
+    x = np.linspace(0, 1, 101)
+    surface = ControlSurface.from_engine(mamdani_engine, antecedent_ranges, x=x, indexing="ij")
+    surface.save(tmp_path / "surface.npz")
+
+    loaded = ControlSurface.load(
+        tmp_path / "surface.npz", fingerprint=mamdani_engine.fingerprint(x), antecedent_ranges=antecedent_ranges
+    )
+
+    assert isinstance(loaded.values, np.memmap)
+    assert np.array_equal(
+        loaded.values, mamdani_engine.calculate_fuzzy_control_surface(antecedent_ranges, x, indexing="ij")
+    )
+    assert loaded.indexing == "ij"
+    assert loaded.fingerprint == surface.fingerprint
+
+
+def test_control_surface_stale(mamdani_engine, tmp_path):
+    """
+    Test that loading fails when the engine, universe or antecedent ranges changed.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 7), np.linspace(0, 10, 5)]
+    x = np.linspace(0, 1, 101)
+    ControlSurface.from_engine(mamdani_engine, antecedent_ranges, x=x).save(tmp_path / "surface.npz")
+
+    with pytest.raises(ValueError):
+        ControlSurface.load(tmp_path / "surface.npz", fingerprint=mamdani_engine.fingerprint(np.linspace(0, 1, 11)))
+    with pytest.raises(ValueError):
+        ControlSurface.load(tmp_path / "surface.npz", antecedent_ranges=[np.linspace(0, 10, 7)] * 2)
+
+    fingerprint = mamdani_engine.fingerprint(x)
+    mamdani_engine.compose([5.0, 5.0])
+    mamdani_engine.compile()
+    assert mamdani_engine.fingerprint(x) == fingerprint
+
+    mamdani_engine.rules[0].consequent = Triangle(a=0, b=0.1, c=0.4)
+    with pytest.raises(ValueError):
+        ControlSurface.load(tmp_path / "surface.npz", fingerprint=mamdani_engine.fingerprint(x))
@@ -0,0 +1,80 @@
+# standard libraries
+from itertools import chain
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.streaming import iter_batches, read_csv_chunks, read_npy_chunks
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    return np.random.default_rng(0).uniform(0, 10, size=(1001, 2))
+
+
+def test_iter_batches_mixed(inputs):
+    """
+    Test that rows and chunks of any size are regrouped into full batches in order.
+    """
+
+    source = chain(inputs[:3], [inputs[3:500]], iter(inputs[500:501].tolist()), [inputs[501:]])
+    batches = list(iter_batches(source, batch_size=128))
+
+    assert [len(batch) for batch in batches] == [128] * 7 + [105]
+    assert np.array_equal(np.concatenate(batches), inputs)
+
+
+def test_iter_batches_invalid():
+    """
+    Test that invalid batch sizes and rows of inconsistent length raise errors.
+    """
+
+    with pytest.raises(ValueError):
+        list(iter_batches([[0.0, 1.0]], batch_size=0))
+    with pytest.raises(ValueError):
+        list(iter_batches([[0.0, 1.0], [0.0, 1.0, 2.0]]))
+    assert list(iter_batches([])) == []
+
+
+def test_infer_stream(mamdani_engine, inputs):
+    """
+    Test that streaming inference over rows yields the batched outputs lazily.
+    """
+
+    x = np.linspace(0, 1, 101)
+    consumed = []
+
+    def rows():
+        for row in inputs:
+            consumed.append(row)
+            yield row
+
+    stream = mamdani_engine.infer_stream(rows(), x, batch_size=100)
+    assert len(next(stream)) == 100
+    assert len(consumed) == 100
+
+    outputs = np.concatenate([mamdani_engine.infer_batch(inputs[:100], x), *stream])
+    assert np.array_equal(outputs, mamdani_engine.infer_batch(inputs, x))
+
+
+def test_infer_stream_files(tsk_engine, inputs, tmp_path):
+    """
+    Test that streaming inference over CSV and .npy files matches batched inference.
+    """
+
+    np.savetxt(tmp_path / "inputs.csv", np.column_stack([np.arange(len(inputs)), inputs]), delimiter=",", header="id")
+    np.save(tmp_path / "inputs.npy", inputs)
+    expected = tsk_engine.infer_batch(inputs)
+
+    csv_chunks = read_csv_chunks(tmp_path / "inputs.csv", chunk_size=300, skip_header=1, usecols=[1, 2])
+    assert np.allclose(np.concatenate(list(tsk_engine.infer_stream(csv_chunks, batch_size=256))), expected)
+
+    npy_chunks = list(read_npy_chunks(tmp_path / "inputs.npy", chunk_size=300))
+    assert [len(chunk) for chunk in npy_chunks] == [300, 300, 300, 101]
+    assert np.array_equal(np.concatenate(list(tsk_engine.infer_stream(npy_chunks))), expected)
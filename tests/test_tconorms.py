@@ -1,7 +1,14 @@
+# standard libraries
+import pickle
+from functools import reduce
+
 # third party libraries
 import numpy as np
+import pytest
 
 # fuzzy logic libraries
+from fuzzylogic.mf import Gaussian, Trapezoid
+from fuzzylogic.mf.triangle import Triangle
 from fuzzylogic.tconorms import AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm, MaximumTCoNorm
 
 
@@ -45,3 +52,55 @@ def test_drastic_sum_tconorm(dummy_mf_1, dummy_mf_2):
     assert np.array_equal(
         combined_mf(x), np.where(dummy_mf_1(x) == 0, dummy_mf_2(x), np.where(dummy_mf_2(x) == 0, dummy_mf_1(x), 1))
     )
+
+
+@pytest.mark.parametrize("tconorm", [MaximumTCoNorm, AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm])
+def test_combined_mf_pickle(tconorm):
+    """
+    Test that combined membership functions survive a pickle round trip.
+    """
+
+    combined_mf = tconorm.combine(Gaussian(mean=0, std=1), Triangle(a=-1, b=0, c=2))
+    x = np.linspace(-3, 3, 13)
+    assert np.array_equal(pickle.loads(pickle.dumps(combined_mf))(x), combined_mf(x))
+
+
+@pytest.mark.parametrize("tconorm", [MaximumTCoNorm, AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm])
+def test_combined_mf_support_and_core(tconorm):
+    """
+    Test that a T-CoNorm bounds the union of the supports and cores.
+    """
+
+    combined_mf = tconorm.combine(Triangle(a=0, b=2, c=4), Trapezoid(a=1, b=2, c=3, d=6))
+    assert combined_mf.support() == (0, 6)
+    assert combined_mf.core() == (2, 3)
+
+    x = np.linspace(-1, 7, 81)
+    assert np.all(combined_mf(x[(x < 0) | (x > 6)]) == 0)
+    assert np.all(combined_mf(x[(x >= 2) & (x <= 3)]) == pytest.approx(1))
+
+
+@pytest.mark.parametrize("tconorm", [MaximumTCoNorm, AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm])
+@pytest.mark.parametrize("n_operands", [1, 2, 3, 5])
+def test_apply_many(tconorm, n_operands):
+    """
+    Test that the n-ary T-CoNorm matches folding the binary T-CoNorm.
+    """
+
+    rng = np.random.default_rng(n_operands)
+    memberships = rng.choice([0, 0.1, 0.3, 0.7, 1], size=(n_operands, 200))
+
+    assert tconorm.apply_many(memberships) == pytest.approx(reduce(tconorm.apply, memberships))
+
+
+@pytest.mark.parametrize("tconorm", [MaximumTCoNorm, AlgebraicSumTCoNorm, BoundedSumTCoNorm, DrasticSumTCoNorm])
+def test_combine_many(tconorm):
+    """
+    Test that combining many membership functions matches combining them pairwise.
+    """
+
+    mfs = [Triangle(a=i, b=i + 2, c=i + 4) for i in range(4)]
+    x = np.linspace(-1, 8, 91)
+
+    assert tconorm.combine_many(mfs)(x) == pytest.approx(reduce(tconorm.combine, mfs)(x))
+    assert tconorm.combine_many(mfs).support() == (0, 7)
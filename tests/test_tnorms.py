@@ -1,7 +1,14 @@
+# standard libraries
+import pickle
+from functools import reduce
+
 # third party libraries
 import numpy as np
+import pytest
 
 # fuzzy logic libraries
+from fuzzylogic.mf import Gaussian, Trapezoid
+from fuzzylogic.mf.triangle import Triangle
 from fuzzylogic.tnorms import AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm, MinimumTNorm
 
 
@@ -45,3 +52,57 @@ def test_drastic_product_tnorm(dummy_mf_1, dummy_mf_2):
     assert np.array_equal(
         combined_mf(x), np.where(dummy_mf_1(x) == 1, dummy_mf_2(x), np.where(dummy_mf_2(x) == 1, dummy_mf_1(x), 0))
     )
+
+
+@pytest.mark.parametrize("tnorm", [MinimumTNorm, AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm])
+def test_combined_mf_pickle(tnorm):
+    """
+    Test that combined membership functions survive a pickle round trip.
+    """
+
+    combined_mf = tnorm.combine(Gaussian(mean=0, std=1), Triangle(a=-1, b=0, c=2))
+    x = np.linspace(-3, 3, 13)
+    assert np.array_equal(pickle.loads(pickle.dumps(combined_mf))(x), combined_mf(x))
+
+
+@pytest.mark.parametrize("tnorm", [MinimumTNorm, AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm])
+def test_combined_mf_support_and_core(tnorm):
+    """
+    Test that a T-Norm intersects the supports and cores.
+    """
+
+    combined_mf = tnorm.combine(Triangle(a=0, b=2, c=4), Trapezoid(a=1, b=2, c=3, d=6))
+    assert combined_mf.support() == (1, 4)
+    assert combined_mf.core() == (2, 2)
+
+    x = np.linspace(-1, 7, 81)
+    assert np.all(combined_mf(x[(x < 1) | (x > 4)]) == 0)
+    assert combined_mf(np.array([2.0])) == pytest.approx(1)
+
+
+@pytest.mark.parametrize("tnorm", [MinimumTNorm, AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm])
+@pytest.mark.parametrize("n_operands", [1, 2, 3, 5])
+def test_apply_many(tnorm, n_operands):
+    """
+    Test that the n-ary T-Norm matches folding the binary T-Norm.
+    """
+
+    rng = np.random.default_rng(n_operands)
+    memberships = rng.choice([0, 0.3, 0.7, 0.9, 1], size=(n_operands, 200))
+
+    assert tnorm.apply_many(memberships) == pytest.approx(reduce(tnorm.apply, memberships))
+
+
+@pytest.mark.parametrize("tnorm", [MinimumTNorm, AlgebraicProductTNorm, BoundedProductTNorm, DrasticProductTNorm])
+def test_combine_many(tnorm):
+    """
+    Test that combining many membership functions matches combining them pairwise.
+    """
+
+    mfs = [Triangle(a=i, b=i + 2, c=i + 4) for i in range(4)]
+    x = np.linspace(-1, 8, 91)
+
+    assert tnorm.combine_many(mfs)(x) == pytest.approx(reduce(tnorm.combine, mfs)(x))
+    assert tnorm.combine_many(mfs).support() == (3, 4)
+    with pytest.raises(ValueError):
+        tnorm.combine_many([])
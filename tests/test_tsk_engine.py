@@ -0,0 +1,133 @@
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.fuzzy_engine import MamdaniFuzzyEngine, TSKFuzzyEngine
+from fuzzylogic.fuzzy_rule import TSKConsequent, TSKFuzzyRule
+from fuzzylogic.mf import Gaussian
+from fuzzylogic.mf.triangle import Triangle
+from fuzzylogic.tconorms import MaximumTCoNorm
+from fuzzylogic.tnorms import MinimumTNorm
+
+
+@pytest.fixture
+def inputs():
+    """
+    Batch of crisp inputs covering the antecedent ranges.
+    """
+
+    rng = np.random.default_rng(0)
+    return rng.uniform(0, 10, size=(50, 2))
+
+
+def test_tsk_weighted_average(tsk_engine, inputs):
+    """
+    Test that the output is the weighted average of the zero and first-order consequents.
+    """
+
+    outputs = tsk_engine.infer_batch(inputs)
+
+    for row, output in zip(inputs, outputs):
+        weights = [rule.get_firing_strength(list(row)) for rule in tsk_engine.rules]
+        consequents = [rule.consequent(row[np.newaxis])[0] for rule in tsk_engine.rules]
+        assert output == pytest.approx(np.dot(weights, consequents) / np.sum(weights), rel=1e-12)
+
+
+def test_tsk_evaluate_matches_batch(tsk_engine, inputs):
+    """
+    Test that per sample inference matches batched inference and chunking does not change it.
+    """
+
+    outputs = tsk_engine.infer_batch(inputs)
+
+    for row, output in zip(inputs[:10], outputs):
+        result = tsk_engine.evaluate(list(row))
+        assert result.output == pytest.approx(output, rel=1e-12)
+        assert result.composed_mf.value == result.output
+        assert result.rule_strengths.shape == (len(tsk_engine.rules),)
+
+        tsk_engine.compose(list(row))
+        assert tsk_engine.infer() == result.output
+
+    assert np.array_equal(tsk_engine.infer_batch(inputs, memory_budget=1), outputs)
+
+
+def test_tsk_compile_snapshot(tsk_engine, inputs):
+    """
+    Test that the batched methods use the coefficient matrix of the last compilation.
+    """
+
+    outputs = tsk_engine.infer_batch(inputs)
+    assert tsk_engine.coefficients.shape == (3, len(tsk_engine.rules))
+
+    tsk_engine.rules[0].consequent.intercept += 1
+    assert np.array_equal(tsk_engine.infer_batch(inputs), outputs)
+
+    tsk_engine.compile()
+    assert np.allclose(tsk_engine.infer_batch(inputs), [tsk_engine.evaluate(list(row)).output for row in inputs])
+    assert not np.allclose(tsk_engine.infer_batch(inputs), outputs)
+
+
+def test_tsk_control_surface(tsk_engine):
+    """
+    Test that the control surface holds the crisp output of every grid point.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 5), np.linspace(0, 10, 4)]
+    surface = tsk_engine.calculate_fuzzy_control_surface(antecedent_ranges, indexing="ij")
+
+    grid = np.stack([grid.ravel() for grid in np.meshgrid(*antecedent_ranges, indexing="ij")], axis=1)
+
+    assert surface.shape == (5, 4)
+    assert np.array_equal(surface.ravel(), tsk_engine.infer_batch(grid))
+
+
+@pytest.mark.parametrize("indexing", ["xy", "ij"])
+def test_tsk_control_surface_non_square(tsk_engine, indexing):
+    """
+    Test that a non-square control surface is laid out like the meshgrid of the antecedent ranges.
+    """
+
+    antecedent_ranges = [np.linspace(0, 10, 3), np.linspace(0, 10, 5)]
+    surface = tsk_engine.calculate_fuzzy_control_surface(antecedent_ranges, indexing=indexing)
+    grids = np.meshgrid(*antecedent_ranges, indexing=indexing)
+
+    assert surface.shape == grids[0].shape
+    for idx in np.ndindex(surface.shape):
+        assert surface[idx] == pytest.approx(tsk_engine.evaluate([grid[idx] for grid in grids]).output, rel=1e-12)
+
+
+def test_tsk_no_rule_fires(tsk_engine):
+    """
+    Test that inputs for which no rule fires cannot be inferred.
+    """
+
+    tsk_engine.rules = tsk_engine.rules[:1]
+
+    with pytest.raises(ValueError):
+        tsk_engine.infer_batch(np.array([[20.0, 20.0]]))
+
+
+def test_tsk_invalid_rules(tsk_engine):
+    """
+    Test that TSK and Mamdani rules are not mixed.
+    """
+
+    rule_kwargs = dict(dom_operator=MinimumTNorm(), tnorm=MinimumTNorm(), tconorm=MaximumTCoNorm())
+
+    with pytest.raises(TypeError):
+        TSKFuzzyRule(
+            antecedents=[Gaussian(mean=0, std=1)], operators=[], consequent=Triangle(a=0, b=1, c=2), **rule_kwargs
+        )
+    with pytest.raises(ValueError):
+        TSKFuzzyRule(
+            antecedents=[Gaussian(mean=0, std=1)],
+            operators=[],
+            consequent=TSKConsequent(intercept=0, coefficients=[1, 2]),
+            **rule_kwargs,
+        )
+    with pytest.raises(TypeError):
+        MamdaniFuzzyEngine(rules=tsk_engine.rules, aggregate_operator=MaximumTCoNorm())
+    with pytest.raises(TypeError):
+        TSKFuzzyEngine(rules=[tsk_engine.rules[0], object()])
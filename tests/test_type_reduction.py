@@ -0,0 +1,54 @@
+# standard libraries
+from itertools import product
+
+# third party libraries
+import numpy as np
+import pytest
+
+# fuzzy logic libraries
+from fuzzylogic.type_reduction import karnik_mendel
+
+
+def test_karnik_mendel_brute_force():
+    """
+    Test that the type-reduced interval spans the weighted averages of every choice of lower or upper weights.
+    """
+
+    rng = np.random.default_rng(0)
+    y = rng.uniform(-1, 1, size=8)
+    lower = rng.uniform(0, 0.5, size=(20, 8))
+    upper = lower + rng.uniform(0, 0.5, size=(20, 8))
+
+    left, right = karnik_mendel(y, lower, upper)
+
+    # The extreme weighted averages weight every point by its lower or upper weight
+    choices = np.array(list(product([0, 1], repeat=len(y))), dtype=bool)
+    weights = np.where(choices[np.newaxis], upper[:, np.newaxis], lower[:, np.newaxis])
+    averages = weights @ y / weights.sum(axis=-1)
+
+    assert left.shape == right.shape == (20,)
+    assert np.allclose(left, averages.min(axis=1), rtol=0, atol=1e-12)
+    assert np.allclose(right, averages.max(axis=1), rtol=0, atol=1e-12)
+
+
+def test_karnik_mendel_type_1():
+    """
+    Test that equal lower and upper weights reduce to the type-1 weighted average.
+    """
+
+    y = np.linspace(0, 1, 101)
+    weights = np.exp(-((y - 0.3) ** 2) / 0.02)
+
+    left, right = karnik_mendel(y, weights, weights)
+
+    assert left == pytest.approx(np.dot(y, weights) / np.sum(weights), rel=1e-12)
+    assert right == pytest.approx(left, rel=1e-12)
+
+
+def test_karnik_mendel_zero_area():
+    """
+    Test that upper weights of zero raise an error.
+    """
+
+    with pytest.raises(ValueError):
+        karnik_mendel(np.linspace(0, 1, 11), np.zeros(11), np.zeros(11))